@@ -0,0 +1,27 @@
+// Clientside language switch. The language buttons set the language store in
+// the browser, and a language change replaces the texts of the header, the year
+// slider title and the tab labels and sets dir/lang on the app container from a
+// table sent once with the layout (the 'language-texts' store), without a
+// request to the server. Mirroring for Arabic is left to the [dir="rtl"] CSS.
+// Only the tab content is rendered again, by the server.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    languageSwitch: {
+        selectLanguage: function(englishClicks, arabicClicks, currentLanguage) {
+            var triggered = window.dash_clientside.callback_context.triggered;
+            if (!triggered || !triggered.length) {
+                return window.dash_clientside.no_update;
+            }
+            var language = triggered[0].prop_id.split('.')[0] === 'btn-arabic' ? 'arabic' : 'english';
+            // Clicking the language already shown changes nothing
+            return language === currentLanguage ? window.dash_clientside.no_update : language;
+        },
+
+        // Values of every output of the callback, in the order the server listed them
+        applyLanguage: function(language, texts) {
+            if (!texts || !texts[language]) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            return texts[language];
+        }
+    }
+});
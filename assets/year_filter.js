@@ -0,0 +1,57 @@
+// Clientside year filter, used when the server runs with CLIENTSIDE_YEAR_FILTER=1.
+// Every chart arrives with the full series once; moving the year slider then
+// filters the traces in the browser without a request to the server.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    yearFilter: {
+        filterFigures: function(yearRange, figures) {
+            if (!yearRange || !figures) {
+                return window.dash_clientside.no_update;
+            }
+            var low = yearRange[0];
+            var high = yearRange[1];
+
+            return figures.map(function(figure) {
+                if (!figure || !figure.data) {
+                    return figure;
+                }
+
+                var data = figure.data.map(function(trace) {
+                    // The full series is kept on the trace so the range can widen again later
+                    var full = (trace.meta && trace.meta.fullSeries) || {x: trace.x, y: trace.y};
+                    if (!Array.isArray(full.x) || !Array.isArray(full.y)) {
+                        return trace;
+                    }
+                    var x = [];
+                    var y = [];
+                    full.x.forEach(function(year, i) {
+                        if (year >= low && year <= high) {
+                            x.push(year);
+                            y.push(full.y[i]);
+                        }
+                    });
+                    return Object.assign({}, trace, {
+                        x: x,
+                        y: y,
+                        meta: Object.assign({}, trace.meta, {fullSeries: full})
+                    });
+                });
+
+                // Hide notes pinned to years outside the selected range
+                var layout = Object.assign({}, figure.layout);
+                if (layout.annotations) {
+                    layout.annotations = layout.annotations.map(function(annotation) {
+                        var onYearAxis = !annotation.xref || /^x\d*$/.test(annotation.xref);
+                        if (!onYearAxis || typeof annotation.x !== 'number') {
+                            return annotation;
+                        }
+                        return Object.assign({}, annotation, {
+                            visible: annotation.x >= low - 0.5 && annotation.x <= high + 0.5
+                        });
+                    });
+                }
+
+                return Object.assign({}, figure, {data: data, layout: layout});
+            });
+        }
+    }
+});
@@ -0,0 +1,83 @@
+"""
+Data Load Benchmark
+-------------------
+Compares cold-start load time and memory of the pillar data when parsed from
+the CSV files versus memory-mapped from the binary cache written by
+data_store.py. Every run happens in a fresh interpreter so module imports and
+allocator state do not carry over between runs.
+
+Usage:
+    python bench_data_load.py [--runs 15] [--output results.json]
+"""
+
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from data_store import DATA_FILES
+
+# Code run in each child interpreter; prints one JSON line with its measurements
+CHILD = """
+import json, sys, time
+from render_cache import current_rss
+import numpy, pandas
+from data_store import load_stores
+paths = json.loads(sys.argv[1])
+use_cache = sys.argv[2] == 'cache'
+rss_before = current_rss()
+started = time.perf_counter()
+stores = load_stores(paths, use_cache=use_cache)
+elapsed = time.perf_counter() - started
+# Touch every value so memory-mapped pages are counted as well
+total = sum(float(numpy.nansum(store.values)) for store in stores.values())
+print(json.dumps({'seconds': elapsed, 'rss_delta': current_rss() - rss_before}))
+"""
+
+
+def run_once(mode):
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, json.dumps(DATA_FILES), mode],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    seconds = [sample['seconds'] * 1000 for sample in samples]
+    rss = [sample['rss_delta'] / 1024 for sample in samples]
+    return {
+        'load_ms_median': statistics.median(seconds),
+        'load_ms_min': min(seconds),
+        'load_ms_max': max(seconds),
+        'rss_delta_kb_median': statistics.median(rss),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=15, help='fresh interpreters per mode')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    # Make sure the binary cache exists before timing the cached mode
+    run_once('cache')
+
+    results = {}
+    for mode in ('csv', 'cache'):
+        results[mode] = summarize([run_once(mode) for _ in range(args.runs)])
+
+    print(f"{'mode':<8}{'median ms':>12}{'min ms':>10}{'max ms':>10}{'RSS delta KB':>15}")
+    for mode, result in results.items():
+        print(f"{mode:<8}{result['load_ms_median']:>12.2f}{result['load_ms_min']:>10.2f}"
+              f"{result['load_ms_max']:>10.2f}{result['rss_delta_kb_median']:>15.0f}")
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
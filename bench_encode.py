@@ -0,0 +1,115 @@
+"""
+Encode Benchmark
+----------------
+Times the JSON encoding of every tab's figures (full period, in each
+language) and reports the bytes produced:
+
+- plotly json: Plotly's encoder with the standard library json engine, which
+  Dash uses when orjson is not installed
+- plotly orjson: Plotly's encoder with its orjson engine
+- encode: encoded_json.encode(), orjson with numpy arrays written as they are;
+  what the chart engine pays once per figure it builds
+
+and what a response then costs per request for the figures and for the whole
+tab: Dash encoding the decoded structures (as before), against splicing the
+cached EncodedJSON bytes.
+
+Usage:
+    python bench_encode.py [--repeat 20] [--output results.json]
+"""
+
+
+import argparse
+import json
+import time
+
+from plotly.io.json import to_json_plotly
+
+import app
+import encoded_json
+from encoded_json import EncodedJSON
+
+
+# Best time in milliseconds of calling function over repeat runs, and its result
+def best_time(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+# Plotly figure objects of a tab's charts, built as the chart engine builds them
+def build_figures(tab, min_year, max_year, language):
+    engine = app.chart_engine
+    frames = {}
+    return [
+        engine.build(app.CHART_SPECS[chart_id],
+                     engine.pillar_frame(frames, app.CHART_SPECS[chart_id]['pillar'], min_year, max_year), language)
+        for chart_id in app.TAB_CHARTS[tab]
+    ]
+
+
+def measure(tab, language, repeat):
+    store = app.data_stores['key_indicators']
+    figures = build_figures(tab, store.min_year, store.max_year, language)
+    encoders = {'plotly json': lambda figure: to_json_plotly(figure, engine='json').encode('utf-8')}
+    if encoded_json.orjson is not None:
+        encoders['plotly orjson'] = lambda figure: to_json_plotly(figure, engine='orjson').encode('utf-8')
+    encoders['encode'] = encoded_json.encode
+
+    result = {'tab': tab, 'language': language, 'charts': len(figures), 'encode_ms': {}, 'bytes': {}}
+    for name, encoder in encoders.items():
+        seconds, payloads = best_time(lambda: [encoder(figure) for figure in figures], repeat)
+        result['encode_ms'][name] = seconds
+        result['bytes'][name] = sum(len(payload) for payload in payloads)
+
+    # Per request: the figures and the tab as Dash encoded them from decoded
+    # structures, against the cached bytes spliced into the response
+    encoded = [EncodedJSON(encoded_json.encode(figure)) for figure in figures]
+    decoded = [figure.decode() for figure in encoded]
+    key = (tab, store.min_year, store.max_year, language)
+    content = EncodedJSON(app.render_tab_payload(key))
+    decoded_content = content.decode()
+    result['response_ms'] = {
+        'figures decoded': best_time(lambda: to_json_plotly(decoded), repeat)[0],
+        'figures cached': best_time(lambda: encoded_json.dumps(encoded), repeat)[0],
+        'tab decoded': best_time(lambda: to_json_plotly(decoded_content), repeat)[0],
+        'tab cached': best_time(lambda: encoded_json.dumps(content), repeat)[0],
+    }
+    result['tab_bytes'] = len(content.data)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='runs per measurement; the best is reported')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    results = [measure(tab, language, args.repeat) for tab in app.TAB_IDS for language in app.LANGUAGES]
+
+    encoders = list(results[0]['encode_ms'])
+    print(f"Encoder: {encoded_json.ENCODER}; best of {args.repeat} runs, ms")
+    print(f"{'tab':<16}{'language':<10}{'charts':>7}"
+          + ''.join(f"{name + ' ms':>17}{'KB':>8}" for name in encoders))
+    for result in results:
+        print(f"{result['tab']:<16}{result['language']:<10}{result['charts']:>7}"
+              + ''.join(f"{result['encode_ms'][name]:>17.2f}{result['bytes'][name] / 1024:>8.1f}" for name in encoders))
+
+    print()
+    print("Per request")
+    print(f"{'tab':<16}{'language':<10}" + ''.join(f"{name:>17}" for name in results[0]['response_ms']) + f"{'tab KB':>9}")
+    for result in results:
+        print(f"{result['tab']:<16}{result['language']:<10}"
+              + ''.join(f"{seconds:>17.3f}" for seconds in result['response_ms'].values())
+              + f"{result['tab_bytes'] / 1024:>9.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({'encoder': encoded_json.ENCODER, 'repeat': args.repeat, 'tabs': results}, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
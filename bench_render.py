@@ -0,0 +1,196 @@
+"""
+Render Benchmark
+----------------
+Times the tab renderers (render_key_indicators, render_economic,
+render_environmental, render_human and render_social) for every year range
+the slider allows and both languages, and reports per tab and language:
+
+- p50, p95 and max wall time with the chart and insight caches cleared before
+  each render (cold) and with every chart already cached (warm)
+- peak traced memory of a cold render and the memory it still holds after
+  returning, chart cache entries included (tracemalloc, measured in a
+  separate pass so tracing does not skew the timings)
+- size of the serialized payload sent to the browser
+
+Results can be written to a JSON file and compared with the file of an earlier
+commit; the script exits with status 1 when a p50 got slower by more than the
+threshold.
+
+Usage:
+    python bench_render.py [--runs 1] [--tabs economic human] [--skip-alloc]
+                           [--output results.json] [--compare baseline.json]
+                           [--threshold 0.2]
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Benchmark the default rendering path, whatever the shell has configured
+for variable in ('WARM_CACHE', 'CHART_CALLBACKS', 'CLIENTSIDE_YEAR_FILTER', 'RENDER_CACHE_DIR'):
+    os.environ.pop(variable, None)
+
+import dash  # noqa: E402
+import plotly  # noqa: E402
+from plotly.io.json import to_json_plotly  # noqa: E402
+
+import app  # noqa: E402
+
+RENDERERS = {
+    'key-indicators': app.render_key_indicators,
+    'economic': app.render_economic,
+    'environmental': app.render_environmental,
+    'human': app.render_human,
+    'social': app.render_social,
+}
+
+
+# Every (min_year, max_year) the year slider can select
+def year_ranges():
+    years = [int(year) for year in app.data_stores['key_indicators'].years]
+    return [(min_year, max_year) for i, min_year in enumerate(years) for max_year in years[i:]]
+
+
+# Drop the figures and range statistics the chart and insight engines cached
+def clear_caches():
+    app.chart_engine.cache.invalidate()
+    app.insight_engine.cache.invalidate()
+
+
+def timed_render(renderer, min_year, max_year, language):
+    started = time.perf_counter()
+    renderer(min_year, max_year, language)
+    return (time.perf_counter() - started) * 1000
+
+
+# Memory still held after a cold render and the peak traced memory, in KB
+def traced_render(renderer, min_year, max_year, language):
+    clear_caches()
+    tracemalloc.start()
+    try:
+        renderer(min_year, max_year, language)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.size for stat in snapshot.statistics('filename'))
+    return retained / 1024, peak / 1024
+
+
+def distribution(samples):
+    return {
+        'p50': float(np.percentile(samples, 50)),
+        'p95': float(np.percentile(samples, 95)),
+        'max': float(np.max(samples)),
+    }
+
+
+def benchmark(tab, language, ranges, runs, skip_alloc):
+    renderer = RENDERERS[tab]
+    cold, warm, payload = [], [], []
+    for min_year, max_year in ranges:
+        for _ in range(runs):
+            clear_caches()
+            cold.append(timed_render(renderer, min_year, max_year, language))
+            warm.append(timed_render(renderer, min_year, max_year, language))
+        payload.append(len(to_json_plotly(renderer(min_year, max_year, language)).encode()))
+
+    result = {
+        'cold_ms': distribution(cold),
+        'warm_ms': distribution(warm),
+        'payload_bytes': distribution(payload),
+    }
+    if not skip_alloc:
+        traces = [traced_render(renderer, min_year, max_year, language) for min_year, max_year in ranges]
+        result['retained_kb'] = distribution([retained for retained, _ in traces])
+        result['peak_kb'] = distribution([peak for _, peak in traces])
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], check=True, capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# p50 timings that got slower than the baseline by more than threshold (a fraction)
+def regressions(results, baseline, threshold):
+    found = []
+    for tab, languages in results.items():
+        for language, result in languages.items():
+            previous = baseline.get(tab, {}).get(language)
+            if previous is None:
+                continue
+            for timing in ('cold_ms', 'warm_ms'):
+                before, after = previous[timing]['p50'], result[timing]['p50']
+                if before and (after - before) / before > threshold:
+                    found.append((tab, language, timing, before, after))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=1, help='renders per year range, language and tab')
+    parser.add_argument('--tabs', nargs='+', choices=list(RENDERERS), default=list(RENDERERS),
+                        help='tabs to benchmark')
+    parser.add_argument('--skip-alloc', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='results file of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative p50 slowdown reported as a regression')
+    args = parser.parse_args()
+
+    ranges = year_ranges()
+    results = {}
+    for tab in args.tabs:
+        results[tab] = {}
+        for language in app.LANGUAGES:
+            results[tab][language] = benchmark(tab, language, ranges, args.runs, args.skip_alloc)
+
+    print(f"{len(ranges)} year ranges, {args.runs} run(s) each")
+    print(f"{'tab':<16}{'language':<10}{'cold p50':>10}{'p95':>8}{'max':>8}{'warm p50':>10}{'p95':>8}"
+          f"{'held KB':>10}{'peak KB':>9}{'payload KB':>12}")
+    for tab, languages in results.items():
+        for language, result in languages.items():
+            cold, warm = result['cold_ms'], result['warm_ms']
+            retained = result.get('retained_kb', {}).get('p50', float('nan'))
+            peak = result.get('peak_kb', {}).get('p50', float('nan'))
+            print(f"{tab:<16}{language:<10}{cold['p50']:>10.1f}{cold['p95']:>8.1f}{cold['max']:>8.1f}"
+                  f"{warm['p50']:>10.1f}{warm['p95']:>8.1f}{retained:>10.0f}{peak:>9.0f}"
+                  f"{result['payload_bytes']['p50'] / 1024:>12.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'dash': dash.__version__,
+                'plotly': plotly.__version__,
+                'year_ranges': len(ranges),
+                'runs': args.runs,
+                'results': results,
+            }, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        found = regressions(results, baseline['results'], args.threshold)
+        for tab, language, timing, before, after in found:
+            print(f"REGRESSION {tab} {language} {timing} p50: {before:.1f} ms -> {after:.1f} ms")
+        if found:
+            sys.exit(1)
+        print(f"No p50 slower than {baseline.get('revision') or args.compare} by more than {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
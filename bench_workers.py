@@ -0,0 +1,165 @@
+"""
+Worker Memory Benchmark
+-----------------------
+Starts the dashboard under Gunicorn (with gunicorn.conf.py) with and without
+preload_app and reports the memory of the master and every worker, once the
+server is ready and again after simulated users (load_test.py sessions) have
+browsed it for a while:
+
+- RSS: resident memory, counting shared pages in full for every process
+- PSS: resident memory with each shared page divided among the processes
+  sharing it; the PSS of all processes adds up to what the server costs
+- USS: memory private to the process
+
+Linux only (reads /proc/<pid>/smaps_rollup).
+
+Usage:
+    python bench_workers.py [--workers 2] [--threads 4] [--concurrency 4]
+                            [--duration 30] [--output results.json]
+"""
+
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+
+from load_test import DEFAULT_MIX, Callback, Stats, free_port, get_json, parse_pairs, run_user
+
+
+# RSS, PSS and USS of a process in bytes
+def process_memory(pid):
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as smaps:
+        for line in smaps:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) * 1024
+    return {
+        'rss': fields.get('Rss', 0),
+        'pss': fields.get('Pss', 0),
+        'uss': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+    }
+
+
+# Process IDs whose parent is pid
+def child_pids(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                # The command name may hold spaces; the parent pid follows the closing parenthesis
+                parent = int(stat.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if parent == pid:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def snapshot(master_pid):
+    workers = [process_memory(pid) for pid in child_pids(master_pid)]
+    master = process_memory(master_pid)
+    return {
+        'master': master,
+        'workers': workers,
+        'total_pss': master['pss'] + sum(worker['pss'] for worker in workers),
+    }
+
+
+# Start Gunicorn with the given preload setting and wait until the workers serve
+def start_server(workers, threads, preload, startup_timeout):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:server', '-b', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads), '--log-level', 'warning'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=dict(os.environ, GUNICORN_PRELOAD='1' if preload else '0')
+    )
+    url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"gunicorn exited with status {server.returncode}")
+        try:
+            get_json(url + '/_dash-layout')
+            # Every worker has finished starting once all of them are listed
+            if len(child_pids(server.pid)) >= workers:
+                return server, url
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.5)
+    server.terminate()
+    raise SystemExit(f"gunicorn did not start within {startup_timeout}s")
+
+
+def browse(url, concurrency, duration):
+    callbacks = [Callback(dependency) for dependency in get_json(url + '/_dash-dependencies')
+                 if not dependency.get('clientside_function')]
+    stats = Stats()
+    mix = parse_pairs(DEFAULT_MIX, float)
+    deadline = time.monotonic() + duration
+    users = [threading.Thread(target=run_user, args=(url, callbacks, mix, stats, deadline, index, 0))
+             for index in range(concurrency)]
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+
+
+def measure(args, preload):
+    started = time.perf_counter()
+    server, url = start_server(args.workers, args.threads, preload, args.startup_timeout)
+    try:
+        result = {'startup_seconds': time.perf_counter() - started, 'ready': snapshot(server.pid)}
+        browse(url, args.concurrency, args.duration)
+        result['browsed'] = snapshot(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+    return result
+
+
+def megabytes(value):
+    return value / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=4, help='gunicorn threads per worker')
+    parser.add_argument('--concurrency', type=int, default=4, help='simulated users while browsing')
+    parser.add_argument('--duration', type=float, default=30, help='seconds of browsing')
+    parser.add_argument('--startup-timeout', type=float, default=300, help='seconds to wait for gunicorn')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    results = {'preload': measure(args, True), 'no_preload': measure(args, False)}
+
+    print(f"{args.workers} workers x {args.threads} threads, {args.concurrency} users for {args.duration:.0f}s; MB")
+    print(f"{'mode':<12}{'phase':<9}{'startup s':>10}{'master RSS':>12}{'worker RSS':>12}{'worker PSS':>12}"
+          f"{'worker USS':>12}{'total PSS':>11}")
+    for mode, result in results.items():
+        for phase in ('ready', 'browsed'):
+            memory = result[phase]
+            workers = memory['workers'] or [{'rss': 0, 'pss': 0, 'uss': 0}]
+            average = {field: sum(worker[field] for worker in workers) / len(workers) for field in ('rss', 'pss', 'uss')}
+            startup = f"{result['startup_seconds']:.1f}" if phase == 'ready' else ''
+            print(f"{mode:<12}{phase:<9}{startup:>10}{megabytes(memory['master']['rss']):>12.1f}"
+                  f"{megabytes(average['rss']):>12.1f}{megabytes(average['pss']):>12.1f}"
+                  f"{megabytes(average['uss']):>12.1f}{megabytes(memory['total_pss']):>11.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(dict(results, workers=args.workers, threads=args.threads,
+                           concurrency=args.concurrency, duration=args.duration), output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -48,4 +48,12 @@ benchmarks = {
         "regional": {"Oman": "~6K per worker"},
         "leading": {"Advanced economies": ">50K per worker"}
     }
-}
\ No newline at end of file
+}
+
+
+# Value at a key path of the benchmarks, e.g. ('education_years', 'expected', 'global_avg')
+def benchmark_value(path):
+    value = benchmarks
+    for key in path:
+        value = value[key]
+    return value
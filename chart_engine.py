@@ -0,0 +1,260 @@
+"""
+Chart Engine
+------------
+Builds the dashboard figures from the declarative specs in chart_specs.py, so
+every chart goes through one code path: a Plotly Express (or dual-axis) figure
+over the pillar's year range, benchmark lines from benchmarks.py, an optional
+annotation, the registered chart template and the spec's layout overrides.
+
+Figures are cached one chart at a time, keyed on the rows of data the chart
+actually draws and the language. A chart whose rows did not change between two
+year ranges (e.g. an indicator published for a few years only) is therefore
+reused rather than rebuilt, and a tab's pillar data is sliced only once for all
+of its charts that do have to be built. Figures are kept as the JSON they were
+encoded to when built (encoded_json.py), which tabs and chart callbacks send
+without encoding them again.
+"""
+
+
+import time
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from benchmarks import benchmark_value, benchmarks
+from chart_templates import FONT_FAMILY, chart_template
+from encoded_json import EncodedJSON, encode
+from lru_cache import LRUCache
+
+# Line dash and palette colour of each kind of benchmark line
+LINE_STYLES = {
+    'global': ('dash', 'global'),
+    'regional': ('dot', 'regional'),
+    'leading': ('dot', 'leading'),
+}
+
+# Boxed note style shared by every chart annotation
+ANNOTATION_STYLE = dict(
+    showarrow=True,
+    arrowhead=1,
+    font=dict(size=12, family=FONT_FAMILY),
+    bgcolor="rgba(255, 255, 255, 0.9)",
+    bordercolor="#c7c7c7",
+    borderwidth=1,
+    borderpad=4
+)
+
+EXPRESS_KINDS = {'line': px.line, 'area': px.area, 'bar': px.bar}
+
+
+# Indicator IDs a spec plots
+def spec_columns(spec):
+    if 'series' in spec:
+        return [series['column'] for series in spec['series']]
+    return spec['columns']
+
+
+class ChartEngine:
+    def __init__(self, specs, tab_charts, palette, translate, maxsize=1024, on_build=None):
+        self.specs = specs
+        self.tab_charts = tab_charts
+        self.palette = palette
+        self.translate = translate
+        self.on_build = on_build
+        self.stores = {}
+        self.cache = LRUCache(maxsize=maxsize)
+
+        # Display labels of every chart on a pillar, applied when its data is sliced
+        self.pillar_labels = {}
+        for spec in specs.values():
+            self.pillar_labels.setdefault(spec['pillar'], {}).update(spec.get('labels', {}))
+
+    # Use freshly loaded pillar stores and drop every figure built from the old ones
+    def set_stores(self, stores):
+        self.stores = stores
+        self.cache.invalidate()
+
+    def color(self, name):
+        return self.palette.get(name, name)
+
+    # Column name of an indicator in the frames handed to the builders
+    def column_name(self, spec, indicator):
+        return spec.get('labels', {}).get(indicator) or self.stores[spec['pillar']].column(indicator)
+
+    # Rows of the pillar store a chart draws for a year range. Charts that drop
+    # missing years are keyed on the years that have a value, so moving the range
+    # across years without data reuses the cached figure.
+    def chart_rows(self, spec, min_year, max_year):
+        store = self.stores[spec['pillar']]
+        if spec.get('dropna'):
+            present = ~np.isnan(store.series(spec_columns(spec)[0], min_year, max_year))
+            return tuple(int(year) for year in store.year_range(min_year, max_year)[present])
+        rows = store.span(min_year, max_year)
+        return (rows.start, rows.stop)
+
+    # Figure of one chart as EncodedJSON, from the cache when its rows and
+    # language were built before; frames shares pillar slices between charts
+    def figure(self, chart_id, min_year, max_year, language='english', frames=None):
+        spec = self.specs[chart_id]
+        frames = {} if frames is None else frames
+        key = (chart_id, self.chart_rows(spec, min_year, max_year), language)
+        return self.cache.get_or_compute(key, lambda: self.render(chart_id, min_year, max_year, language, frames),
+                                         size=lambda figure: len(figure.data))
+
+    # Encoded figure of one chart; the build time is reported to on_build
+    def render(self, chart_id, min_year, max_year, language, frames):
+        start = time.perf_counter()
+        spec = self.specs[chart_id]
+        payload = encode(self.build(spec, self.pillar_frame(frames, spec['pillar'], min_year, max_year), language))
+        if self.on_build is not None:
+            self.on_build(chart_id, time.perf_counter() - start)
+        return EncodedJSON(payload)
+
+    # Figures of every chart on a tab keyed by chart ID; the charts missing from
+    # the cache are built from one slice per pillar
+    def tab_figures(self, tab, min_year, max_year, language='english'):
+        frames = {}
+        return {
+            chart_id: self.figure(chart_id, min_year, max_year, language, frames)
+            for chart_id in self.tab_charts[tab]
+        }
+
+    # Year range of a pillar with the display labels of its charts applied
+    def pillar_frame(self, frames, pillar, min_year, max_year):
+        if pillar not in frames:
+            frames[pillar] = self.stores[pillar].frame(min_year, max_year, labels=self.pillar_labels[pillar])
+        return frames[pillar]
+
+    # Build the figure of one spec from a frame holding its columns
+    def build(self, spec, frame, language='english'):
+        columns = [self.column_name(spec, indicator) for indicator in spec_columns(spec)]
+        if spec.get('dropna'):
+            frame = frame.dropna(subset=columns)
+            if frame.empty and 'empty_text' in spec:
+                return self.empty_figure(spec, language)
+
+        if spec['kind'] == 'dual_axis':
+            figure = self.dual_axis_figure(spec, frame, columns, language)
+        else:
+            figure = self.express_figure(spec, frame, columns, language)
+
+        for line in spec.get('benchmark_lines', ()):
+            self.add_benchmark_lines(figure, line, language)
+        if 'annotation' in spec:
+            self.add_annotation(figure, spec, frame, language)
+
+        if spec['kind'] == 'dual_axis':
+            figure.update_layout(
+                template=chart_template(language),
+                title_text=self.translate(spec['title'], language),
+                **spec.get('layout', {})
+            )
+            figure.update_xaxes(title_text=self.translate("Year", language))
+            figure.update_yaxes(title_text=self.translate(spec['y_label'], language), secondary_y=False)
+            figure.update_yaxes(
+                title_text=self.translate(spec['secondary_y_label'], language),
+                secondary_y=True,
+                showgrid=False
+            )
+        else:
+            figure.update_layout(
+                template=chart_template(language),
+                xaxis_title=self.translate("Year", language),
+                **spec.get('layout', {})
+            )
+
+        trace_updates = {}
+        if 'line_width' in spec:
+            trace_updates['line'] = dict(width=spec['line_width'])
+        if spec.get('connectgaps', spec['kind'] != 'bar'):
+            trace_updates['connectgaps'] = True
+        if trace_updates:
+            figure.update_traces(**trace_updates)
+        return figure
+
+    def express_figure(self, spec, frame, columns, language):
+        # A single column is plotted by name, which px draws without a legend entry
+        y = columns if len(columns) > 1 or spec.get('show_legend') else columns[0]
+        options = {'markers': True} if spec['kind'] == 'line' else {}
+        if 'barmode' in spec:
+            options['barmode'] = spec['barmode']
+
+        figure = EXPRESS_KINDS[spec['kind']](
+            frame,
+            x='Year',
+            y=y,
+            title=self.translate(spec['title'], language),
+            color_discrete_sequence=[self.color(color) for color in spec['colors']],
+            labels={'value' if isinstance(y, list) else y: self.translate(spec['y_label'], language), "variable": ""},
+            **options
+        )
+
+        if language == 'arabic':
+            figure.for_each_trace(lambda trace: trace.update(name=self.translate(trace.name, language)))
+        return figure
+
+    def dual_axis_figure(self, spec, frame, columns, language):
+        figure = make_subplots(specs=[[{"secondary_y": True}]])
+        for series, column in zip(spec['series'], columns):
+            line = dict(color=self.color(series['color']))
+            if 'dash' in series:
+                line['dash'] = series['dash']
+            figure.add_trace(
+                go.Scatter(
+                    x=frame['Year'],
+                    y=frame[column],
+                    name=self.translate(series['name'], language),
+                    line=line,
+                    mode='lines+markers'
+                ),
+                secondary_y=series.get('secondary_y', False)
+            )
+        return figure
+
+    # Horizontal line per benchmark value; a key path ending in a dict of
+    # countries or regions draws one line for each
+    def add_benchmark_lines(self, figure, line, language):
+        value = line['value'] if 'value' in line else benchmark_value(line['benchmark'])
+        dash, color = LINE_STYLES.get(line.get('style'), (None, None))
+        values = value.items() if isinstance(value, dict) else [(None, value)]
+        for name, value in values:
+            figure.add_hline(
+                y=value,
+                line_dash=line.get('dash', dash),
+                line_color=self.color(line.get('color', color)),
+                annotation_text=self.translate(line['text'].format(name=name, value=value), language),
+                annotation_position=line['position']
+            )
+
+    def add_annotation(self, figure, spec, frame, language):
+        annotation = spec['annotation']
+        columns = [self.column_name(spec, indicator) for indicator in annotation['y']]
+        statistic = annotation['y_stat']
+        y = getattr(getattr(frame[columns], statistic)(), statistic)()
+        figure.add_annotation(
+            x=getattr(frame['Year'], annotation['x'])(),
+            y=y * annotation.get('y_scale', 1),
+            text=self.translate(annotation['text'].format(benchmarks=benchmarks), language),
+            **ANNOTATION_STYLE
+        )
+
+    # Placeholder figure for a chart without any data in the selected years
+    def empty_figure(self, spec, language):
+        figure = go.Figure()
+        figure.update_layout(
+            template=chart_template(language),
+            title=self.translate(spec['title'], language),
+            annotations=[dict(
+                text=self.translate(spec['empty_text'], language),
+                xref="paper", yref="paper",
+                x=0.5, y=0.5,
+                showarrow=False,
+                font=dict(size=16, family=FONT_FAMILY)
+            )]
+        )
+        return figure
+
+    def stats(self):
+        return self.cache.stats()
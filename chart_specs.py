@@ -0,0 +1,577 @@
+"""
+Chart Specs
+-----------
+Declarative description of every chart on the dashboard. Each entry names the
+pillar store and indicator IDs it plots, the chart kind, its title and axis
+label (English keys into translations.py), the benchmark lines and annotation
+drawn over it, and the insight and benchmark cards shown next to it.
+chart_engine.py turns these specs into Plotly figures.
+
+Spec fields:
+    pillar          data store the columns come from (see data_store.DATA_FILES)
+    kind            'line', 'area', 'bar' or 'dual_axis'
+    columns         indicator IDs plotted, in legend order
+    labels          shorter display names for indicator IDs, used as trace names
+    series          dual_axis only: one dict per trace with column, name, color,
+                    dash and secondary_y
+    title, y_label  translation keys of the chart title and value axis title
+                    (dual_axis charts add secondary_y_label)
+    colors          series colours, as hex values or names from the app palette
+    color           palette name of the pillar, for the insight and benchmark cards
+    dropna          plot only the years with a value
+    show_legend     keep a legend entry for a single series
+    benchmark_lines lines from benchmarks.py: benchmark key path (or a fixed
+                    value), text template with {name} and {value}, style
+                    ('global', 'regional' or 'leading') and annotation position
+    annotation      boxed note: text key (may use {benchmarks[...]}), x at the
+                    'max' or 'median' year and y at a statistic of some columns
+    layout          layout properties that differ from the chart template
+    insight_title   title of the paired insight card; its insights are the
+                    insight_catalog.py entries whose card is the chart ID
+    benchmark_card  (title, benchmarks.py key) of the card under the chart
+    highlights      indicator IDs described by computed statements for the
+                    selected years under the chart (see insight_engine.py)
+"""
+
+
+# Legend placed above the middle of the plot, for charts with long series names
+CENTERED_LEGEND = dict(y=1.05, xanchor="center", x=0.5)
+CENTERED_BOXED_LEGEND = dict(y=1.05, xanchor="center", x=0.5, bgcolor='rgba(255,255,255,0.9)')
+LOW_BOXED_LEGEND = dict(y=0.95, xanchor="center", x=0.5, bgcolor='rgba(255,255,255,0.9)')
+
+CHART_SPECS = {
+    # Key Indicators
+    'key-gdp': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['gdp_pc_ppp'],
+        'title': 'GDP per Capita (PPP)',
+        'y_label': "GDP per capita, PPP (2021 international $)",
+        'colors': ['key'],
+        'color': 'key',
+        'benchmark_lines': [
+            {'benchmark': ('gdp_per_capita', 'global_avg'), 'text': "Global Average: ${value:,}",
+             'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('gdp_per_capita', 'regional'), 'text': "{name}: ${value:,}",
+             'style': 'regional', 'position': "bottom right"},
+        ],
+        'insight_title': "GDP per Capita",
+        'benchmark_card': ("GDP per Capita (PPP) Benchmarks", 'gdp_per_capita'),
+        'highlights': ['gdp_pc_ppp'],
+    },
+    'key-hci': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['hci'],
+        'title': 'Human Capital Index',
+        'y_label': "Human Capital Index (HCI) (scale 0-1)",
+        'colors': ['key'],
+        'color': 'key',
+        'dropna': True,
+        'benchmark_lines': [
+            {'benchmark': ('human_capital_index', 'global_avg'), 'text': "Global Average: {value}",
+             'style': 'global', 'position': "top right"},
+            {'benchmark': ('human_capital_index', 'regional'), 'text': "{name}: {value}",
+             'style': 'regional', 'position': "bottom left"},
+            {'benchmark': ('human_capital_index', 'leading'), 'text': "{name}: {value}",
+             'style': 'leading', 'position': "top right"},
+        ],
+        'insight_title': "Human Capital Index",
+        'benchmark_card': ("Human Capital Index Benchmarks", 'human_capital_index'),
+        'highlights': ['hci'],
+    },
+    'key-co2': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['co2_pc'],
+        'title': 'CO₂ Emissions per Capita',
+        'y_label': "Annual CO₂ emissions (per capita)",
+        'colors': ['key'],
+        'color': 'key',
+        'benchmark_lines': [
+            {'benchmark': ('co2_per_capita', 'global_avg'), 'text': "Global Average: {value} tonnes",
+             'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('co2_per_capita', 'regional'), 'text': "{name}: {value} tonnes",
+             'style': 'regional', 'position': "bottom right"},
+        ],
+        'layout': dict(margin=dict(t=70), legend=CENTERED_LEGEND),
+        'insight_title': "CO₂ Emissions",
+        'benchmark_card': ("CO₂ Emissions per Capita Benchmarks", 'co2_per_capita'),
+        'highlights': ['co2_pc'],
+    },
+    'key-renewables': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['elec_renewables'],
+        'title': 'Electricity from Renewables (TWh)',
+        'y_label': "Electricity from renewables - TWh",
+        'colors': ['key'],
+        'color': 'key',
+        'annotation': {
+            'text': "Qatar targets 20% of electricity from renewables by 2030<br>"
+                    "Global average: {benchmarks[renewables_share][global_avg]}%<br>"
+                    "Middle East: {benchmarks[renewables_share][regional][Middle East Avg]}%",
+            'x': 'max', 'y': ['elec_renewables'], 'y_stat': 'max',
+        },
+        'insight_title': "Renewable Energy",
+        'benchmark_card': ("Renewables Share Benchmarks", 'renewables_share'),
+        'highlights': ['elec_renewables'],
+    },
+    'key-energy': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['oil_prod', 'gas_prod'],
+        'title': 'Energy Production: Oil & Gas (TWh)',
+        'y_label': "Oil production (TWh), Gas production - TWh",
+        'colors': ['key', '#17becf'],
+        'color': 'key',
+        'annotation': {
+            'text': "Qatar plans 85% LNG<br>expansion by 2030",
+            'x': 'max', 'y': ['gas_prod'], 'y_stat': 'max',
+        },
+        'layout': dict(margin=dict(t=70), legend=CENTERED_BOXED_LEGEND),
+        'insight_title': "Energy Production",
+        'highlights': ['oil_prod', 'gas_prod'],
+    },
+    'key-education': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['expected_school', 'learning_adjusted_school', 'enrol_tertiary'],
+        'title': 'Education Metrics',
+        'y_label': 'Expected Years of School, Learning-Adjusted and enrollment',
+        'colors': ['key', '#17becf', '#ff7f0e'],
+        'color': 'key',
+        'benchmark_lines': [
+            {'benchmark': ('education_years', 'expected', 'global_avg'),
+             'text': "Global Avg Expected: {value} years", 'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('education_years', 'learning_adjusted', 'global_avg'),
+             'text': "Global Avg Learning-Adjusted: {value} years", 'style': 'global', 'position': "bottom right"},
+        ],
+        'layout': dict(margin=dict(t=70), legend=CENTERED_BOXED_LEGEND),
+        'insight_title': "Education Metrics",
+        'highlights': ['expected_school', 'learning_adjusted_school'],
+    },
+    'key-stem': {
+        'pillar': 'key_indicators',
+        'kind': 'line',
+        'columns': ['stem_grads'],
+        'title': 'STEM Graduates (%)',
+        'y_label': "Percentage of graduates from STEM programmes in tertiary",
+        'colors': ['key'],
+        'color': 'key',
+        'benchmark_lines': [
+            {'benchmark': ('stem_graduates', 'global_avg'), 'text': "Global Average: {value}%",
+             'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('stem_graduates', 'regional', 'Saudi Arabia'), 'text': "Saudi Arabia: {value}%",
+             'style': 'regional', 'position': "bottom right"},
+            {'benchmark': ('stem_graduates', 'leading'), 'text': "{name}: {value}%",
+             'style': 'leading', 'position': "top right"},
+        ],
+        'insight_title': "STEM Graduates",
+        'benchmark_card': ("STEM Graduates Benchmarks", 'stem_graduates'),
+        'highlights': ['stem_grads'],
+    },
+
+    # Economic Development
+    'economic-gdp': {
+        'pillar': 'economic',
+        'kind': 'line',
+        'columns': ['gdp_pc_ppp', 'gdp_pc'],
+        'title': 'GDP per Capita Trends',
+        'y_label': "GDP per capita, PPP (2021 international $)",
+        'colors': ['economic', '#17becf'],
+        'color': 'economic',
+        'benchmark_lines': [
+            {'benchmark': ('gdp_per_capita', 'global_avg'), 'text': "Global Average: ${value:,}",
+             'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('gdp_per_capita', 'regional'), 'text': "{name}: ${value:,}",
+             'style': 'regional', 'position': "bottom right"},
+        ],
+        'insight_title': "GDP per Capita Trends",
+        'benchmark_card': ("GDP per Capita (PPP) Benchmarks", 'gdp_per_capita'),
+        'highlights': ['gdp_pc_ppp'],
+    },
+    'economic-energy-production': {
+        'pillar': 'economic',
+        'kind': 'line',
+        'columns': ['oil_prod', 'gas_prod'],
+        'title': 'Energy Production (TWh)',
+        'y_label': "Oil production and Gas production - TWh",
+        'colors': ['economic', '#17becf'],
+        'color': 'economic',
+        'annotation': {
+            'text': "Qatar plans to boost LNG output<br>by 85% by 2030 (126-142M tons)",
+            'x': 'max', 'y': ['gas_prod'], 'y_stat': 'max',
+        },
+        'insight_title': "Energy Production",
+        'highlights': ['oil_prod', 'gas_prod'],
+    },
+    'economic-energy-consumption': {
+        'pillar': 'economic',
+        'kind': 'dual_axis',
+        'series': [
+            {'column': 'energy_cons', 'name': "Primary Energy", 'color': 'economic'},
+            {'column': 'oil_cons', 'name': "Oil Consumption", 'color': '#17becf'},
+            {'column': 'gas_cons', 'name': "Gas Consumption", 'color': '#ff7f0e'},
+            {'column': 'coal_cons', 'name': "Coal Consumption", 'color': '#d62728', 'dash': 'dot',
+             'secondary_y': True},
+        ],
+        'title': "Energy Consumption",
+        'y_label': "Energy Consumption (TWh)",
+        'secondary_y_label': "Coal Consumption (TWh)",
+        'color': 'economic',
+        'layout': dict(margin=dict(t=60)),
+        'insight_title': "Energy Consumption",
+        'highlights': ['energy_cons'],
+    },
+    'economic-energy-growth': {
+        'pillar': 'economic',
+        'kind': 'bar',
+        'columns': ['oil_growth', 'gas_growth', 'coal_growth'],
+        'title': 'Energy Growth Rates (%)',
+        'y_label': "Oil, Gas and Coal (% growth)",
+        'colors': ['economic', '#17becf', '#ff7f0e'],
+        'color': 'economic',
+        'barmode': 'group',
+        'annotation': {
+            'text': "Global energy demand growth: ~1-2% per year<br>Qatar targets: 2-3% growth by 2030<br>"
+                    "Past Qatar growth: ~6-7% annually",
+            'x': 'max', 'y': ['oil_growth', 'gas_growth', 'coal_growth'], 'y_stat': 'max',
+        },
+        'insight_title': "Energy Growth Rates",
+    },
+    'economic-agriculture': {
+        'pillar': 'economic',
+        'kind': 'line',
+        'columns': ['agri_value_worker'],
+        'title': 'Agriculture, Forestry, and Fishing Value Added per Worker',
+        'y_label': "Agriculture, forestry, and fishing, value per worker 2015 US$",
+        'colors': ['economic'],
+        'color': 'economic',
+        'annotation': {
+            'text': "Qatar's per-worker ag value: $10-11K<br>Regional peer (Oman): ~$6K<br>Advanced economies: >$50K",
+            'x': 'median', 'y': ['agri_value_worker'], 'y_stat': 'max',
+        },
+        'insight_title': "Agricultural Productivity",
+        'benchmark_card': ("Agricultural Productivity", 'agriculture_value'),
+        'highlights': ['agri_value_worker'],
+    },
+    'economic-business': {
+        'pillar': 'economic',
+        'kind': 'line',
+        'columns': ['business_grads'],
+        'title': 'Business, Administration and Law Graduates (%)',
+        'y_label': "Business & Law Graduates (%)",
+        'colors': ['economic'],
+        'color': 'economic',
+        'annotation': {
+            'text': "Qatar 2018: ~26% business/law graduates<br>Regional comparison (Bahrain): ~50%<br>"
+                    "Vision 2030 aims to balance with STEM fields",
+            'x': 'median', 'y': ['business_grads'], 'y_stat': 'mean',
+        },
+        'insight_title': "Business, Administration and Law Graduates",
+        'highlights': ['business_grads'],
+    },
+
+    # Environmental Development
+    'environmental-co2': {
+        'pillar': 'environmental',
+        'kind': 'line',
+        'columns': ['co2', 'co2_oil'],
+        'title': 'Annual CO₂ Emissions (tonnes)',
+        'y_label': "Annual CO₂ emissions and Annual CO₂ emissions from oil",
+        'colors': ['environmental', '#17becf'],
+        'color': 'environmental',
+        'annotation': {
+            'text': "Qatar 2023: ~128M tonnes CO₂<br>Global total: 36.8B tonnes<br>Saudi Arabia: ~600M tonnes<br>"
+                    "UAE: ~230M tonnes",
+            'x': 'median', 'y': ['co2'], 'y_stat': 'max',
+        },
+        'insight_title': "CO₂ Emissions",
+        'highlights': ['co2'],
+    },
+    'environmental-co2-per-capita': {
+        'pillar': 'environmental',
+        'kind': 'line',
+        'columns': ['co2_pc', 'co2_oil_pc'],
+        'title': 'Annual CO₂ Emissions per Capita',
+        'y_label': "Annual CO₂ emissions and CO₂ emissions from oil per capita",
+        'colors': ['environmental', '#17becf'],
+        'color': 'environmental',
+        'benchmark_lines': [
+            {'benchmark': ('co2_per_capita', 'global_avg'), 'text': "Global Average: {value} tonnes",
+             'style': 'global', 'position': "top right"},
+            {'benchmark': ('co2_per_capita', 'regional'), 'text': "{name}: {value} tonnes",
+             'style': 'regional', 'position': "bottom right"},
+        ],
+        'layout': dict(margin=dict(t=70), legend=LOW_BOXED_LEGEND),
+        'benchmark_card': ("CO₂ Emissions per Capita Benchmarks", 'co2_per_capita'),
+        'highlights': ['co2_pc'],
+    },
+    'environmental-energy-change': {
+        'pillar': 'environmental',
+        'kind': 'bar',
+        'columns': ['energy_change_pct'],
+        'title': 'Annual Change in Primary Energy Consumption (%)',
+        'y_label': "Annual change in primary energy consumption (%)",
+        'colors': ['environmental'],
+        'color': 'environmental',
+        'show_legend': True,
+        'annotation': {
+            'text': "Global energy demand growth: ~1.9% (2022)<br>Qatar's historical growth: ~5-6% in 2010s<br>"
+                    "Qatar's 2030 target: <3% annually",
+            'x': 'median', 'y': ['energy_change_pct'], 'y_stat': 'max',
+        },
+        # Single series: keep its legend beside the plot instead of above it
+        'layout': dict(legend=dict(orientation="v", yanchor="auto", y=1, xanchor="left", x=1.02)),
+        'insight_title': "Energy Consumption Change",
+    },
+    'environmental-electricity': {
+        'pillar': 'environmental',
+        'kind': 'area',
+        'columns': ['elec_fossil', 'elec_nuclear', 'elec_renewables'],
+        'labels': {
+            'elec_fossil': 'Fossil Fuels (TWh)',
+            'elec_nuclear': 'Nuclear (TWh)',
+            'elec_renewables': 'Renewables (TWh)',
+        },
+        'title': 'Electricity Production by Source (TWh)',
+        'y_label': "Electricity Production (TWh)",
+        'colors': ['#636EFA', '#EF553B', 'environmental'],
+        'color': 'environmental',
+        # Keep the thin default outline on the stacked areas
+        'line_width': 2,
+        'connectgaps': False,
+        'annotation': {
+            'text': "Qatar 2023: >99% fossil fuels<br>Global mix: 61% non-renewables<br>"
+                    "Qatar's 2030 target: 20% renewables",
+            'x': 'median', 'y': ['elec_fossil'], 'y_stat': 'max',
+        },
+        'insight_title': "Electricity Production",
+        'highlights': ['elec_fossil', 'elec_renewables'],
+    },
+    'environmental-renewable-detail': {
+        'pillar': 'environmental',
+        'kind': 'area',
+        'columns': ['elec_solar', 'elec_bioenergy'],
+        'labels': {
+            'elec_solar': 'Solar (TWh)',
+            'elec_bioenergy': 'Bioenergy (TWh)',
+        },
+        'title': 'Renewable Electricity Production Detail (TWh)',
+        'y_label': "Solar, Bioenergy (TWh)",
+        'colors': ['environmental', '#17becf'],
+        'color': 'environmental',
+        'line_width': 2,
+        'annotation': {
+            'text': "Qatar renewable output: ~0.15 TWh<br>Global renewables: 7,858 TWh (2021)<br>"
+                    "Middle East renewables: 47 TWh (2022)",
+            'x': 'median', 'y': ['elec_solar'], 'y_stat': 'max', 'y_scale': 1.5,
+        },
+        'insight_title': "Renewable Energy Detail",
+        'highlights': ['elec_solar'],
+    },
+    'environmental-solar': {
+        'pillar': 'environmental',
+        'kind': 'dual_axis',
+        'series': [
+            {'column': 'solar_capacity', 'name': "Solar Capacity (GW)", 'color': 'environmental'},
+            {'column': 'solar_growth', 'name': "Solar Growth (%)", 'color': "#17becf", 'dash': "dash",
+             'secondary_y': True},
+        ],
+        'title': "Solar Capacity and Growth",
+        'y_label': "Capacity (GW)",
+        'secondary_y_label': "Growth (%)",
+        'color': 'environmental',
+        'annotation': {
+            'text': "Qatar 2023: 0.8 GW<br>Qatar target 2030: 4 GW<br>15,686% growth from 2016-2023",
+            'x': 'max', 'y': ['solar_capacity'], 'y_stat': 'max',
+        },
+        'layout': dict(margin=dict(t=50)),
+        'insight_title': "Solar Energy Development",
+        'benchmark_card': ("Renewables Share Benchmarks", 'renewables_share'),
+        'highlights': ['solar_capacity'],
+    },
+
+    # Human Development
+    'human-education-levels': {
+        'pillar': 'human',
+        'kind': 'line',
+        'columns': ['attain_primary', 'attain_secondary', 'attain_bachelor'],
+        'labels': {
+            'attain_primary': 'Primary Education (%)',
+            'attain_secondary': 'Secondary Education (%)',
+            'attain_bachelor': 'Bachelor Degree (%)',
+        },
+        'title': 'Population Education Levels (%)',
+        'y_label': "Primary Education, Secondary Education and Bachelor Degree (%)",
+        'colors': ['human', '#17becf', '#ff7f0e'],
+        'color': 'human',
+        'annotation': {
+            'text': "Qatar tertiary attainment: ~30%<br>High-income countries: 30-45%<br>"
+                    "Leading countries (Canada/Korea): >55%",
+            'x': 'median', 'y': ['attain_bachelor'], 'y_stat': 'max',
+        },
+        'layout': dict(margin=dict(t=50)),
+        'insight_title': "Educational Attainment",
+        'benchmark_card': ("Tertiary Education", 'tertiary_enrollment'),
+        'highlights': ['attain_secondary', 'attain_bachelor'],
+    },
+    'human-advanced-education': {
+        'pillar': 'human',
+        'kind': 'line',
+        'columns': ['attain_master', 'attain_doctoral'],
+        'labels': {
+            'attain_master': 'Master Degree (%)',
+            'attain_doctoral': 'Doctoral Degree (%)',
+        },
+        'title': 'Advanced Education Levels (%)',
+        'y_label': "Master Degree and Doctoral Degree (%)",
+        'colors': ['human', '#17becf'],
+        'color': 'human',
+        'annotation': {
+            'text': "OECD tertiary attainment: ~39%<br>Qatar aims to lead Arab world<br>in higher education outcomes",
+            'x': 'median', 'y': ['attain_master'], 'y_stat': 'max',
+        },
+        'layout': dict(margin=dict(t=50)),
+        'insight_title': "Advanced Education",
+        'highlights': ['attain_master', 'attain_doctoral'],
+    },
+    'human-completion-rates': {
+        'pillar': 'human',
+        'kind': 'line',
+        'columns': ['completion_primary', 'completion_lower_secondary'],
+        'title': 'Education Completion Rates (%)',
+        'y_label': "Primary and Lower secondary completion rate total",
+        'colors': ['human', '#17becf'],
+        'color': 'human',
+        'annotation': {
+            'text': "Qatar primary: ~98-99%<br>Global average: ~89%<br>Global secondary: ~75%",
+            'x': 'median', 'y': ['completion_primary'], 'y_stat': 'max',
+        },
+        'insight_title': "Completion Rates",
+        'highlights': ['completion_primary', 'completion_lower_secondary'],
+    },
+    'human-school-life': {
+        'pillar': 'human',
+        'kind': 'line',
+        'columns': ['school_life', 'expected_school', 'learning_adjusted_school'],
+        'title': 'School Life Expectancy and Learning Years',
+        'y_label': "'School life expectancy, primary to tertiary and Learning-Adjusted",
+        'colors': ['human', '#17becf', '#ff7f0e'],
+        'color': 'human',
+        'benchmark_lines': [
+            {'benchmark': ('education_years', 'expected', 'global_avg'),
+             'text': "Global Avg Expected: {value} years", 'style': 'global', 'position': "bottom left"},
+            {'benchmark': ('education_years', 'learning_adjusted', 'global_avg'),
+             'text': "Global Avg Learning-Adjusted: {value} years", 'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('education_years', 'expected', 'leading'),
+             'text': "Leading Countries Expected: {value} years", 'style': 'leading', 'position': "top right"},
+            {'benchmark': ('education_years', 'learning_adjusted', 'leading'),
+             'text': "Leading Countries Learning-Adjusted: {value} years", 'style': 'leading',
+             'position': "bottom left"},
+        ],
+        'layout': dict(margin=dict(t=70), legend=LOW_BOXED_LEGEND),
+        'insight_title': "Education Quality",
+        'highlights': ['school_life'],
+    },
+
+    # Social Development
+    'social-sanitation': {
+        'pillar': 'social',
+        'kind': 'line',
+        'columns': ['sanitation'],
+        'title': 'Population with Safely Managed Sanitation Services (%)',
+        'y_label': "Share of the population using safely managed sanitation services",
+        'colors': ['social'],
+        'color': 'social',
+        'dropna': True,
+        'empty_text': "No data available for sanitation services",
+        'benchmark_lines': [
+            {'benchmark': ('sanitation', 'global_avg'), 'text': "Global Average: {value}%",
+             'style': 'global', 'position': "bottom right"},
+            {'benchmark': ('sanitation', 'regional'), 'text': "{name}: {value}%",
+             'style': 'regional', 'position': "bottom right"},
+            {'benchmark': ('sanitation', 'leading'), 'text': "{name}: {value}%",
+             'style': 'leading', 'position': "top left"},
+        ],
+        'insight_title': "Sanitation Services",
+        'benchmark_card': ("Sanitation Access Benchmarks", 'sanitation'),
+        'highlights': ['sanitation'],
+    },
+    'social-gender-parity': {
+        'pillar': 'social',
+        'kind': 'line',
+        'columns': ['gpi_primary', 'gpi_tertiary'],
+        'labels': {
+            'gpi_primary': 'Primary Education GPI',
+            'gpi_tertiary': 'Tertiary Education GPI',
+        },
+        'title': 'Gender Parity Indices in Education',
+        'y_label': "Primary and Tertiary Education GPI",
+        'colors': ['social', '#17becf'],
+        'color': 'social',
+        'benchmark_lines': [
+            {'value': 1.0, 'text': "Gender Parity (GPI = 1.0)", 'dash': "dash", 'color': "#888888",
+             'position': "bottom right"},
+        ],
+        'annotation': {
+            'text': "Qatar 2019: GPI >1.0 indicates slight<br>advantage for female students<br>"
+                    "Women: 51.6% of engineering students",
+            'x': 'median', 'y': ['gpi_primary'], 'y_stat': 'max',
+        },
+        'layout': dict(margin=dict(t=50)),
+        'insight_title': "Gender Equality in Education",
+    },
+    'social-stem-ict': {
+        'pillar': 'social',
+        'kind': 'line',
+        'columns': ['stem_grads', 'ict_grads'],
+        'labels': {
+            'stem_grads': 'STEM Graduates (%)',
+            'ict_grads': 'ICT Graduates (%)',
+        },
+        'title': 'STEM & ICT Graduates (%)',
+        'y_label': "STEM and ICT Graduates (%)",
+        'colors': ['social', '#17becf'],
+        'color': 'social',
+        'benchmark_lines': [
+            {'benchmark': ('stem_graduates', 'global_avg'), 'text': "Global Average STEM: {value}%",
+             'style': 'global', 'position': "top right"},
+            {'benchmark': ('stem_graduates', 'regional', 'Saudi Arabia'), 'text': "Saudi Arabia: {value}%",
+             'style': 'regional', 'position': "bottom right"},
+            {'benchmark': ('stem_graduates', 'leading'), 'text': "{name}: {value}%",
+             'style': 'leading', 'position': "top right"},
+        ],
+        'layout': dict(margin=dict(t=50)),
+        'insight_title': "STEM Education",
+        'benchmark_card': ("STEM Graduates Benchmarks", 'stem_graduates'),
+        'highlights': ['stem_grads', 'ict_grads'],
+    },
+    'social-programming': {
+        'pillar': 'social',
+        'kind': 'line',
+        'columns': ['skill_programming'],
+        'title': 'Programming Skills (%)',
+        'y_label': "Proportion of youth and adults who wrote a computer program",
+        'colors': ['social'],
+        'color': 'social',
+        'annotation': {
+            'text': "Qatar's divergent digital skills:<br>Improving basic skills (email: 58.72%)<br>"
+                    "Declining advanced skills (programming: 5.06%)",
+            'x': 'median', 'y': ['skill_programming'], 'y_stat': 'max',
+        },
+        'highlights': ['skill_programming'],
+    },
+}
+
+# Charts shown on each tab, in page order
+TAB_CHARTS = {
+    'key-indicators': ['key-gdp', 'key-hci', 'key-co2', 'key-renewables', 'key-energy', 'key-education', 'key-stem'],
+    'economic': ['economic-gdp', 'economic-energy-production', 'economic-energy-consumption',
+                 'economic-energy-growth', 'economic-agriculture', 'economic-business'],
+    'environmental': ['environmental-co2', 'environmental-co2-per-capita', 'environmental-energy-change',
+                      'environmental-electricity', 'environmental-solar', 'environmental-renewable-detail'],
+    'human': ['human-education-levels', 'human-advanced-education', 'human-school-life', 'human-completion-rates'],
+    'social': ['social-sanitation', 'social-gender-parity', 'social-stem-ict', 'social-programming'],
+}
@@ -0,0 +1,78 @@
+"""
+Chart Templates
+---------------
+Plotly templates holding the styling shared by every dashboard figure:
+Poppins font, transparent backgrounds, faint grid lines, the horizontal legend
+above the plot and thick lines with large markers. They are registered once in
+plotly.io.templates, one for English and a right-to-left variant for Arabic,
+and applied to each figure by name.
+
+Only the parts of the default plotly template that 2D scatter and bar charts
+use are carried over, so every figure serializes a much smaller template.
+"""
+
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+FONT_FAMILY = "Poppins, sans-serif"
+GRID_COLOR = 'rgba(220, 220, 220, 0.2)'
+
+# Registered template name for each dashboard language
+TEMPLATE_NAMES = {'english': 'qv2030', 'arabic': 'qv2030_rtl'}
+
+# Layout properties of the default plotly template used by 2D cartesian charts
+BASE_LAYOUT_KEYS = (
+    'autotypenumbers', 'colorway', 'font', 'hoverlabel', 'hovermode', 'paper_bgcolor',
+    'plot_bgcolor', 'xaxis', 'yaxis', 'shapedefaults', 'annotationdefaults', 'title'
+)
+
+
+# Build the dashboard template on top of the trimmed default plotly template
+def build_template(text_color, rtl=False):
+    base = pio.templates['plotly']
+    template = go.layout.Template(
+        layout={key: base.layout[key] for key in BASE_LAYOUT_KEYS},
+        data={'scatter': base.data.scatter, 'bar': base.data.bar}
+    )
+
+    template.layout.update(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family=FONT_FAMILY, color=text_color),
+        margin=dict(l=40, r=40, t=40, b=40),
+        hovermode="x unified",
+        title=dict(font=dict(size=18, family=FONT_FAMILY)),
+        xaxis=dict(gridcolor=GRID_COLOR, tickfont=dict(family=FONT_FAMILY)),
+        yaxis=dict(gridcolor=GRID_COLOR, tickfont=dict(family=FONT_FAMILY)),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(family=FONT_FAMILY, size=12)
+        )
+    )
+
+    # Right-to-left: title on the right, legend on the left, hover text right-aligned
+    if rtl:
+        template.layout.update(
+            title=dict(x=0.95, xanchor="right"),
+            legend=dict(xanchor="left", x=0),
+            hoverlabel=dict(align="right")
+        )
+
+    template.data.scatter[0].update(line=dict(width=3), marker=dict(size=8))
+    return template
+
+
+# Register the English and Arabic templates in plotly.io.templates
+def register_templates(text_color):
+    pio.templates[TEMPLATE_NAMES['english']] = build_template(text_color)
+    pio.templates[TEMPLATE_NAMES['arabic']] = build_template(text_color, rtl=True)
+
+
+# Name of the registered template for a dashboard language
+def chart_template(language='english'):
+    return TEMPLATE_NAMES.get(language, TEMPLATE_NAMES['english'])
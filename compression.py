@@ -0,0 +1,107 @@
+"""
+Compression
+-----------
+Compression of the dashboard server's responses. The page, the layout, every
+callback response and the static files (Dash's component bundles and the
+files under assets/) are sent brotli-encoded to clients that accept it when
+the brotli package is installed, and gzip-encoded otherwise.
+
+- Callback and layout responses differ per request and are compressed as they
+  are sent, at a fast level.
+- Static files, recognised by an ETag or a cache lifetime (Dash serves its
+  versioned component bundles with one), are the same for every request. They
+  are compressed once at a high level and the result is kept in memory under
+  the URL, ETag and encoding.
+
+Small responses, other media types, partial content and responses that are
+already encoded are sent as they are. Compressible responses carry
+"Vary: Accept-Encoding" so that shared caches keep the variants apart.
+"""
+
+
+import gzip
+
+import flask
+
+from lru_cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Media types worth compressing
+COMPRESSIBLE_TYPES = frozenset({
+    'application/json', 'application/javascript', 'text/javascript',
+    'text/html', 'text/css', 'text/plain', 'image/svg+xml',
+})
+
+# Responses smaller than this many bytes are sent uncompressed
+MIN_SIZE = 500
+
+
+# Encoding to use for a request's Accept-Encoding header: 'br', 'gzip' or None
+def choose_encoding(accept_encodings, use_brotli=True):
+    if use_brotli and brotli is not None and accept_encodings.quality('br') > 0:
+        return 'br'
+    if accept_encodings.quality('gzip') > 0:
+        return 'gzip'
+    return None
+
+
+# gzip levels run from 1 to 9, brotli qualities from 0 to 11
+def compress(data, encoding, level):
+    if encoding == 'br':
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+class Compressor:
+    def __init__(self, min_size=MIN_SIZE, gzip_level=6, brotli_quality=4, use_brotli=True, static_cache_size=64):
+        self.min_size = min_size
+        self.levels = {'gzip': gzip_level, 'br': brotli_quality}
+        # Brotli's top quality (11) is about 30 times slower than 9 for a few percent
+        self.static_levels = {'gzip': 9, 'br': 9}
+        self.use_brotli = use_brotli
+        self.cache = LRUCache(maxsize=static_cache_size)
+
+    # Hits and misses of the compressed static files
+    def stats(self):
+        return self.cache.stats()
+
+    def compress_response(self, response):
+        if (response.status_code != 200 or response.mimetype not in COMPRESSIBLE_TYPES
+                or 'Content-Encoding' in response.headers):
+            return response
+        etag = response.headers.get('ETag')
+        static = etag is not None or bool(response.cache_control.max_age)
+        # Files sent with send_file stream from disk; they are only read when
+        # their compressed form is kept
+        if response.is_streamed and not static:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding(flask.request.accept_encodings, self.use_brotli)
+        if encoding is None:
+            return response
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        if not static:
+            compressed = compress(data, encoding, self.levels[encoding])
+        else:
+            key = (flask.request.full_path, etag, encoding)
+            compressed = self.cache.get_or_compute(
+                key, lambda: compress(data, encoding, self.static_levels[encoding]), size=len)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    # Compress the responses of a Dash app's server. Register this before any
+    # after_request hook that should see the uncompressed body, since Flask
+    # runs those hooks in reverse order of registration.
+    def instrument(self, app):
+        app.server.after_request(self.compress_response)
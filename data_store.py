@@ -0,0 +1,292 @@
+"""
+Data Store
+----------
+Columnar in-memory store for the development pillar CSV files. Each pillar is
+loaded once into a year-indexed, column-contiguous NumPy float block, and every
+indicator gets a short stable ID that maps to its (often 100+ character) source
+column name.
+
+Slicing a year range is an offset computation that returns views into the
+block, so callbacks no longer filter or copy DataFrames.
+
+Parsing the CSVs is skipped on later starts: the first load writes a binary
+cache next to each CSV (`<name>.cache.npy` holding the float block and
+`<name>.cache.json` holding years, columns and the CSV fingerprint). The cache
+is reused while the CSV's mtime and size, or failing that its SHA-256, are
+unchanged, and the block is memory-mapped rather than read into memory.
+"""
+
+
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Source CSV files for each development pillar
+DATA_FILES = {
+    'economic': 'data/economic_development.csv',
+    'environmental': 'data/environmental_development.csv',
+    'human': 'data/human_development.csv',
+    'social': 'data/social_development.csv',
+    'key_indicators': 'data/qatar_vision_key_indicators.csv',
+}
+
+# Stable indicator IDs for every pillar, mapped to the source CSV column names
+INDICATORS = {
+    'economic': {
+        'gdp_pc_ppp': 'GDP per capita, PPP (constant 2021 international $)',
+        'gdp_ppp': 'GDP, PPP (constant 2021 international $)',
+        'gdp_pc': 'GDP per capita',
+        'oil_prod': 'Oil production (TWh)',
+        'gas_prod': 'Gas production - TWh',
+        'energy_cons': 'Primary energy consumption - TWh',
+        'energy_cons_pc': 'Primary energy consumption per capita (kWh/person)',
+        'oil_cons': 'Oil consumption - TWh',
+        'gas_cons': 'Gas consumption - TWh',
+        'coal_cons': 'Coal consumption - TWh',
+        'elec_share_energy': 'Electricity generation as share of direct primary energy consumption - %',
+        'agri_value_worker': 'Agriculture, forestry, and fishing, value added per worker (constant 2015 US$)',
+        'agri_employment_share': 'share_employed_agri',
+        'oil_growth': 'Oil (% growth)',
+        'gas_growth': 'Gas (% growth)',
+        'coal_growth': 'Coal (% growth)',
+        'business_grads': 'Percentage of graduates from tertiary education graduating from Business, Administration and Law programmes, (%)',
+    },
+    'environmental': {
+        'co2': 'Annual CO₂ emissions',
+        'co2_pc': 'Annual CO₂ emissions (per capita)',
+        'co2_oil': 'Annual CO₂ emissions from oil',
+        'co2_oil_pc': 'Annual CO₂ emissions from oil (per capita)',
+        'energy_change_pct': 'Annual change in primary energy consumption (%)',
+        'energy_change_twh': 'Annual change in primary energy consumption (TWh)',
+        'elec_renewables': 'Electricity from renewables - TWh (adapted for visualization of chart elec-fossil-nuclear-renewables)',
+        'elec_nuclear': 'Electricity from nuclear - TWh (adapted for visualization of chart elec-fossil-nuclear-renewables)',
+        'elec_fossil': 'Electricity from fossil fuels - TWh (adapted for visualization of chart elec-fossil-nuclear-renewables)',
+        'elec_solar': 'Electricity from solar - TWh (adapted for visualization of chart electricity-prod-source-stacked)',
+        'elec_bioenergy': 'Electricity from bioenergy - TWh (adapted for visualization of chart electricity-prod-source-stacked)',
+        'solar_capacity': 'Solar capacity (total) (GW)',
+        'solar_growth': 'Solar (% growth)',
+        'other_renewables_growth': 'Other renewables (% growth)',
+        'agri_land': 'Agricultural land | 00006610 || Area | 005110 || hectares',
+        'arable_land': 'Arable land | 00006621 || Area | 005110 || hectares',
+        'food_kcal': 'Total | 00002901 || Food available for consumption | 000664 || kilocalories per day',
+        'meat_prod': 'Meat, total | 00001765 || Production | 005510 || tonnes',
+        'cereal_yield': 'Cereals | 00001717 || Yield | 005419 || tonnes per hectare',
+        'fisheries_prod': 'Total fisheries production (metric tons)',
+    },
+    'human': {
+        'mean_schooling': 'UIS: Mean years of schooling (ISCED 1 or higher), population 25+ years,',
+        'attain_primary': 'UIS: Percentage of population age 25+ with at least completed primary education (ISCED 1 or higher). Total',
+        'attain_secondary': 'UIS: Percentage of population age 25+ with at least completed upper secondary education (ISCED 3 or higher). Total',
+        'attain_bachelor': "UIS: Percentage of population age 25+ with at least a completed bachelor's or equivalent degree (ISCED 6 or higher). Total",
+        'attain_master': "UIS: Percentage of population age 25+ with at least a completed master's degree or equivalent (ISCED 7 or higher). Total",
+        'attain_doctoral': 'UIS: Percentage of population age 25+ with a doctoral degree or equivalent (ISCED 8). Total',
+        'completion_primary': 'Primary completion rate, total (% of relevant age group)',
+        'completion_lower_secondary': 'Lower secondary completion rate, total (% of relevant age group)',
+        'school_life': 'School life expectancy, primary to tertiary, both sexes (years)',
+        'expected_school': 'Expected Years of School',
+        'learning_adjusted_school': 'Learning-Adjusted Years of School',
+        'survival_15_60': 'Survival Rate from Age 15-60',
+        'survival_5': 'Probability of Survival to Age 5',
+        'hci': 'Human Capital Index (HCI) (scale 0-1)',
+        'enrol_tertiary': 'School enrollment, tertiary (% gross)',
+        'enrol_primary': 'School enrollment, primary (% gross)',
+        'enrol_secondary': 'School enrollment, secondary (% gross)',
+        'gpia_pre_primary': 'Gross enrolment ratio, pre-primary, adjusted gender parity index (GPIA)',
+        'test_scores': 'Harmonized Test Scores',
+    },
+    'social': {
+        'sanitation': 'Share of the population using safely managed sanitation services',
+        'gpi_primary': 'School enrollment, primary (gross), gender parity index (GPI)',
+        'gpi_tertiary': 'Gross graduation ratio from first degree programmes (ISCED 6 and 7) in tertiary education, gender parity index (GPI)',
+        'skill_email': 'Proportion of youth and adults who have sent e-mails with attached files (e.g. document, picture, video), (%)',
+        'skill_spreadsheet': 'Proportion of youth and adults who have used basic arithmetic formulae in a spreadsheet, (%)',
+        'skill_files': 'Proportion of youth and adults who have copied or moved a file or folder (%)',
+        'skill_presentation': 'Proportion of youth and adults who have created electronic presentations with presentation software (%)',
+        'skill_software': 'Proportion of youth and adults who have found, downloaded, installed and configured software, (%)',
+        'skill_transfer': 'Proportion of youth and adults who have transferred files between a computer and other devices, (%)',
+        'skill_devices': 'Proportion of youth and adults who have connected and installed new devices (%)',
+        'skill_programming': 'Proportion of youth and adults who have wrote a computer program using a specialised programming language, (%)',
+        'teachers_primary': 'Primary education, teachers',
+        'teachers_secondary': 'Secondary education, teachers',
+        'teachers_tertiary': 'Teachers in tertiary education programmes, both sexes (number)',
+        'female_teachers_lower_secondary': 'Percentage of teachers in lower secondary education who are female (%)',
+        'female_teachers_upper_secondary': 'Percentage of teachers in upper secondary education who are female (%)',
+        'stem_grads': 'Percentage of graduates from Science, Technology, Engineering and Mathematics programmes in tertiary education, (%)',
+        'ict_grads': 'Percentage of graduates from tertiary education graduating from Information and Communication Technologies programmes, (%)',
+    },
+    'key_indicators': {
+        'gdp_pc_ppp': 'GDP per capita, PPP (constant 2021 international $)',
+        'hci': 'Human Capital Index (HCI) (scale 0-1)',
+        'co2_pc': 'Annual CO₂ emissions (per capita)',
+        'elec_renewables': 'Electricity from renewables - TWh (adapted for visualization of chart elec-fossil-nuclear-renewables)',
+        'expected_school': 'Expected Years of School',
+        'learning_adjusted_school': 'Learning-Adjusted Years of School',
+        'enrol_tertiary': 'School enrollment, tertiary (% gross)',
+        'oil_prod': 'Oil production (TWh)',
+        'gas_prod': 'Gas production - TWh',
+        'solar_capacity': 'Solar capacity (total) (GW)',
+        'sanitation': 'Share of the population using safely managed sanitation services',
+        'stem_grads': 'Percentage of graduates from Science, Technology, Engineering and Mathematics programmes in tertiary education, (%)',
+    },
+}
+
+# Non-numeric columns that are not carried into the store
+ID_COLUMNS = ('Entity', 'Code', 'Year')
+
+
+class PillarStore:
+    def __init__(self, name, years, values, columns):
+        self.name = name
+        self.years = np.asarray(years, dtype=np.int64)
+        # Fortran order keeps each indicator's values contiguous in memory
+        self.values = np.asfortranarray(values, dtype=np.float64)
+        self.columns = list(columns)
+
+        # Unknown columns fall back to their source name as ID
+        names = {column: indicator_id for indicator_id, column in INDICATORS.get(name, {}).items()}
+        self.ids = [names.get(column, column) for column in self.columns]
+        self._positions = {column: i for i, column in enumerate(self.columns)}
+        self._positions.update({indicator_id: i for i, indicator_id in enumerate(self.ids)})
+
+        self.min_year = int(self.years[0]) if len(self.years) else None
+        self.max_year = int(self.years[-1]) if len(self.years) else None
+        # Consecutive years let a range be sliced with plain offset arithmetic
+        self._contiguous = bool(len(self.years)) and np.array_equal(
+            self.years, np.arange(self.min_year, self.max_year + 1))
+
+    @classmethod
+    def from_frame(cls, name, frame):
+        frame = frame.sort_values('Year')
+        columns = [column for column in frame.columns if column not in ID_COLUMNS]
+        return cls(name, frame['Year'].to_numpy(), frame[columns].to_numpy(dtype=np.float64), columns)
+
+    @classmethod
+    def from_csv(cls, name, path):
+        return cls.from_frame(name, pd.read_csv(path))
+
+    # Row slice covering min_year..max_year (inclusive)
+    def span(self, min_year=None, max_year=None):
+        min_year = self.min_year if min_year is None else int(min_year)
+        max_year = self.max_year if max_year is None else int(max_year)
+        if self._contiguous:
+            start = min(max(min_year - self.min_year, 0), len(self.years))
+            stop = min(max(max_year - self.min_year + 1, start), len(self.years))
+        else:
+            start = int(np.searchsorted(self.years, min_year, side='left'))
+            stop = int(np.searchsorted(self.years, max_year, side='right'))
+        return slice(start, stop)
+
+    # Source column name for an indicator ID (or column name)
+    def column(self, indicator):
+        return self.columns[self._positions[indicator]]
+
+    def __contains__(self, indicator):
+        return indicator in self._positions
+
+    # Year values for a range, as a view
+    def year_range(self, min_year=None, max_year=None):
+        return self.years[self.span(min_year, max_year)]
+
+    # Values of one indicator for a range, as a contiguous view
+    def series(self, indicator, min_year=None, max_year=None):
+        return self.values[self.span(min_year, max_year), self._positions[indicator]]
+
+    # Zero-copy DataFrame over a year range with a 'Year' column and the source
+    # column names; labels renames selected indicators, e.g. {'elec_solar': 'Solar (TWh)'}
+    def frame(self, min_year=None, max_year=None, labels=None):
+        rows = self.span(min_year, max_year)
+        columns = list(self.columns)
+        for indicator, label in (labels or {}).items():
+            columns[self._positions[indicator]] = label
+        frame = pd.DataFrame(self.values[rows], columns=columns, copy=False)
+        frame.insert(0, 'Year', self.years[rows])
+        return frame
+
+
+# Paths of the binary cache files that sit next to a CSV file
+def cache_paths(csv_path):
+    base = os.path.splitext(csv_path)[0]
+    return base + '.cache.npy', base + '.cache.json'
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Write to a temporary file and rename, so readers never see a partial cache
+def _atomic_write(path, write):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as target:
+            write(target)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+# Memory-map a cached pillar if its fingerprint still matches the CSV
+def _load_cached(name, csv_path):
+    npy_path, meta_path = cache_paths(csv_path)
+    try:
+        with open(meta_path, encoding='utf-8') as meta_file:
+            meta = json.load(meta_file)
+        stat = os.stat(csv_path)
+        if (meta['mtime_ns'], meta['size']) != (stat.st_mtime_ns, stat.st_size):
+            # Touched but possibly unchanged (e.g. after a checkout): compare contents
+            if meta['size'] != stat.st_size or meta['sha256'] != _file_digest(csv_path):
+                return None
+            meta['mtime_ns'] = stat.st_mtime_ns
+            _atomic_write(meta_path, lambda target: target.write(json.dumps(meta).encode('utf-8')))
+        values = np.load(npy_path, mmap_mode='r')
+    except (OSError, ValueError, KeyError):
+        return None
+    if values.shape != (len(meta['years']), len(meta['columns'])):
+        return None
+    return PillarStore(name, meta['years'], values, meta['columns'])
+
+
+# Persist a pillar's block and metadata next to its CSV; failures only cost speed
+def _write_cache(store, csv_path):
+    npy_path, meta_path = cache_paths(csv_path)
+    try:
+        stat = os.stat(csv_path)
+        meta = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': _file_digest(csv_path),
+            'years': [int(year) for year in store.years],
+            'columns': store.columns,
+        }
+        _atomic_write(npy_path, lambda target: np.save(target, store.values))
+        _atomic_write(meta_path, lambda target: target.write(json.dumps(meta).encode('utf-8')))
+    except OSError as error:
+        logger.warning("Could not write data cache for %s: %s", csv_path, error)
+
+
+# Load one pillar, from its binary cache when valid and from the CSV otherwise
+def load_store(name, csv_path, use_cache=True):
+    if use_cache:
+        store = _load_cached(name, csv_path)
+        if store is not None:
+            return store
+    store = PillarStore.from_csv(name, csv_path)
+    if use_cache:
+        _write_cache(store, csv_path)
+    return store
+
+
+# Load every pillar into a PillarStore, keyed by pillar name
+def load_stores(paths, use_cache=True):
+    return {name: load_store(name, path, use_cache) for name, path in paths.items()}
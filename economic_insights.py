@@ -1,69 +0,0 @@
-#economic_insights.py    
-# Key Insightsfor Economic Development with added benchmark comparisons
-gdp_insights = [
-        "Qatar's GDP per capita has shown notable volatility between 2016-2023, with a 3.24% overall decline.",
-        "The most significant drop occurred in 2020 (to $103,062), representing a 14% decline from 2016 levels.",
-        "The economy showed strong resilience with a rapid recovery to $116,833 in 2021.",
-        "The stabilization around $115,000 in recent years suggests a 'new normal' that balances energy market realities with economic diversification efforts.",
-        "Qatar's GDP per capita remains approximately 5.4x the global average ($22,450) and significantly higher than regional neighbors (UAE: $83,900, Saudi Arabia: $54,992)."
-    ]
-    
-oil_insights = [
-        "Oil production declined from 582.57 TWh in 2016 to a low of 511.54 TWh in 2020 (-12.2%), but has since recovered to 616.21 TWh in 2023.",
-        "The initial reduction reflects Qatar's strategic decision to focus more on natural gas, where it holds comparative advantage.",
-        "The 20.5% increase from 2020 to 2023 shows Qatar's response to higher global energy demand and prices after the pandemic.",
-        "The upward trend in recent years raises questions about alignment with climate commitments and sustainability goals.",
-        "Qatar's oil output (~0.67 million barrels/day) is modest compared to other GCC producers, reflecting its strategic focus on natural gas production."
-    ]
-    
-gas_insights = [
-        "Qatar has been investing heavily in liquefied natural gas (LNG) infrastructure, aiming to increase production capacity from 77 to 126 million tons annually by 2027.",
-        "The focus on gas aligns with Qatar's positioning of natural gas as a 'transition fuel' with lower carbon emissions than oil or coal.",
-        "Sustained gas production provides Qatar with economic stability as global demand for cleaner burning fuels increases.",
-        "The vast majority of Qatar's gas production is destined for export markets, making it a critical component of the country's revenue stream.",
-        "Qatar aims to maintain its position as one of the world's largest LNG exporters, competing with the U.S. which surpassed Qatar as the top LNG exporter in 2023."
-    ]
-    
-energy_consumption_insights = [
-        "Energy consumption fluctuated significantly, from 168.92 TWh in 2016 to a low of 126.88 TWh in 2020 (-24.9%), before rebounding to 170.21 TWh in 2023.",
-        "The consumption pattern closely mirrors GDP trends, with the 2020 pandemic-related drop and subsequent recovery.",
-        "The data suggests limited progress in improving energy efficiency, as consumption has grown in line with economic recovery.",
-        "Qatar has one of the world's highest per capita energy consumption rates, reflecting its energy-intensive industries and high standard of living.",
-        "Global energy demand typically grows at 1-2% annually, while Qatar experienced 6-7% annual growth in the 2010s, though it targets moderating to 2-3% by the late 2020s."
-    ]
-    
-    # New insights for Energy Growth Rates chart that was missing dedicated insights
-energy_growth_insights = [
-        "Qatar's energy growth rates show significant volatility, reflecting both global energy market fluctuations and domestic economic changes.",
-        "Growth rates were particularly negative during the 2020 pandemic period, with sharp contractions across all energy sources.",
-        "Post-pandemic recovery shows positive growth rates, particularly in oil consumption, which may contradict Vision 2030's sustainability goals.",
-        "Qatar's historical energy demand growth of 6-7% annually significantly exceeds the global average (1-2%), highlighting the challenge of energy-intensive development.",
-        "Vision 2030 and the National Environment and Climate Strategy aim to reduce these high growth rates to a more sustainable 2-3% annually by 2030, still higher than typical OECD countries that have achieved near-zero growth through efficiency measures."
-    ]
-    
-    # New insights for Agriculture Value chart that was missing dedicated insights
-agriculture_insights = [
-        "Despite Qatar's challenging desert environment, agricultural productivity per worker is relatively high at $10,000-$11,000 (2015 US$) in value-added terms.",
-        "Qatar's agricultural productivity exceeds regional peers like Oman (~$6,000) but remains well below advanced economies (>$50,000 per worker).",
-        "The high per-worker value reflects Qatar's capital-intensive agricultural approach, utilizing advanced technologies like hydroponics and climate-controlled greenhouses.",
-        "Following the 2017 blockade, Qatar has heavily invested in agricultural self-sufficiency, with arable land increasing by 14.75% (18,300 to 21,000 hectares).",
-        "By 2030, Qatar aims to further improve agricultural efficiency through high-yield technology to enhance food security, even as the sector remains <1% of GDP."
-    ]
-    
-    # New insights for Business Graduates chart that was missing dedicated insights
-business_graduates_insights = [
-        "Business, administration, and law have historically been popular fields of study in Qatar, with approximately 26% of tertiary graduates specializing in these areas in 2018.",
-        "This proportion is lower than in some other service-driven Gulf economies, such as Bahrain, where nearly 50% of graduates focus on business and law.",
-        "Vision 2030 doesn't discourage these fields but seeks a better balance with STEM subjects to support innovation and knowledge economy development.",
-        "The inverse relationship between business/law and STEM graduates represents a challenge for Qatar's diversification - as one increases, the other tends to decrease.",
-        "Qatar aims to keep business/law graduates around or below one-third of total graduates while boosting STEM and technical fields to better align with labor market needs in a diversifying economy."
-    ]
-    
-overall_economic_insights = [
-        "The data confirms Qatar's continued heavy reliance on oil and gas, despite diversification efforts under Vision 2030.",
-        "Qatar has demonstrated economic resilience, quickly recovering from the 2020 pandemic-induced downturn.",
-        "While educational reforms show progress, the economic structure remains heavily tilted toward energy production.",
-        "Qatar is pursuing a careful balance between maximizing short-term revenue from its hydrocarbon resources while investing in long-term diversification.",
-        "There remains an inherent tension between Qatar's role as a major hydrocarbon producer and its sustainability ambitions under Vision 2030.",
-        "Qatar's GDP per capita (5.4x global average) and per-worker agricultural value (higher than regional peers) demonstrate its economic efficiency."
-    ]
\ No newline at end of file
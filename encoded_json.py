@@ -0,0 +1,120 @@
+"""
+Encoded JSON
+------------
+JSON that is encoded once and then sent as it is. The chart engine keeps every
+figure, and the render cache every tab, as the bytes they were encoded to
+(EncodedJSON), and responses carry those bytes instead of the structures being
+encoded again for every request:
+
+- encode() uses orjson when it is installed, which writes numpy arrays as they
+  are, calling to_plotly_json() on Plotly figures and Dash components. Values
+  it cannot write go through Plotly's encoder, which is also used without
+  orjson.
+- dumps() encodes a structure holding EncodedJSON values, e.g. a tab whose
+  graphs hold cached figures: each value is written as a placeholder, which is
+  then replaced by the value's bytes.
+- A callback may return EncodedJSON, or a structure holding it. Dash encodes
+  the placeholders, and the hook added by instrument(app) splices the bytes
+  into the response.
+"""
+
+
+import json
+import re
+import secrets
+import threading
+
+import flask
+from plotly.io.json import to_json_plotly
+
+try:
+    import orjson
+except ImportError:  # Plotly's encoder is used throughout
+    orjson = None
+
+ENCODER = 'orjson' if orjson is not None else 'json'
+
+# Placeholder written for an EncodedJSON value, numbered per document; the
+# random part keeps it from matching any text in the data
+PLACEHOLDER = f"__encoded_json_{secrets.token_hex(8)}_"
+PLACEHOLDER_PATTERN = re.compile(b'"' + PLACEHOLDER.encode('ascii') + rb'(\d+)"')
+
+# Fragments collected by the dumps() call running on this thread
+_local = threading.local()
+
+
+# Plotly figures, Dash components and EncodedJSON values for orjson
+def _plotly_json(value):
+    if hasattr(value, 'to_plotly_json'):
+        return value.to_plotly_json()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# JSON of a value as UTF-8 bytes
+def encode(value):
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_plotly_json, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # e.g. arrays of Python objects, dates or non-string keys
+            pass
+    return to_json_plotly(value).encode('utf-8')
+
+
+def decode(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Replace the placeholders in encoded JSON with their fragments
+def splice(data, fragments):
+    if not fragments:
+        return data
+    return PLACEHOLDER_PATTERN.sub(lambda match: fragments[int(match.group(1))], data)
+
+
+# JSON of a structure as UTF-8 bytes, with the EncodedJSON values in it copied
+# in as they were encoded
+def dumps(value):
+    _local.fragments = []
+    try:
+        data = encode(value)
+        fragments = _local.fragments
+    finally:
+        _local.fragments = None
+    return splice(data, fragments)
+
+
+class EncodedJSON:
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data.encode('utf-8') if isinstance(data, str) else data
+
+    # Decoded structure; decoded on every call and not kept, so that a cached
+    # value holds only its bytes
+    def decode(self):
+        return decode(self.data)
+
+    # Written by an encoder: a placeholder for dumps() or, during a request, for
+    # the response hook to replace; otherwise the decoded structure
+    def to_plotly_json(self):
+        fragments = getattr(_local, 'fragments', None)
+        if fragments is None and flask.has_request_context():
+            fragments = flask.g.setdefault('encoded_json', [])
+        if fragments is None:
+            return self.decode()
+        fragments.append(self.data)
+        return f"{PLACEHOLDER}{len(fragments) - 1}"
+
+
+# Splice the EncodedJSON values returned by the callbacks of a Dash app into
+# their responses. Register this after any after_request hook that should see
+# the complete body (metrics, compression), since Flask runs those hooks in
+# reverse order of registration.
+def instrument(app):
+    @app.server.after_request
+    def splice_response(response):
+        fragments = flask.g.pop('encoded_json', None)
+        if fragments and not response.is_streamed:
+            response.set_data(splice(response.get_data(), fragments))
+        return response
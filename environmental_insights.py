@@ -1,60 +0,0 @@
-#environmental_insights.py
-# Key Insights for Environmental Development with added benchmark comparisons
-co2_insights = [
-        "Total CO₂ emissions rose by 32.42% from 87.4 million tonnes in 2016 to 115.7 million tonnes in 2023, showing a concerning upward trajectory.",
-        "CO₂ emissions per capita increased by 15.54% from 33.62 tonnes in 2016 to 38.84 tonnes in 2023, maintaining Qatar's position among the world's highest per capita emitters.",
-        "The data shows an accelerating emissions trend, with the most significant jump occurring between 2022 and 2023 (9% increase in just one year).",
-        "The rising emissions directly conflict with Qatar's environmental sustainability goals under Vision 2030 and its international climate commitments.",
-        "Qatar's per capita emissions (38.84 tonnes) are approximately 8x the global average (4.8 tonnes) and higher than regional peers (Kuwait: 25 tonnes, UAE: 20 tonnes, Saudi Arabia: 18 tonnes)."
-    ]
-    
-electricity_insights = [
-        "Fossil fuels generate over 99.7% of Qatar's electricity, with renewables contributing a minimal 0.28-0.31% throughout the period.",
-        "Total electricity production increased by 28.2% from 42.44 TWh in 2016 to 54.39 TWh in 2023, driving up absolute emissions.",
-        "Despite global renewable energy trends, Qatar's renewable electricity generation has plateaued at around 0.15 TWh since 2018.",
-        "The data reveals a significant gap between Qatar's sustainability rhetoric and actual energy transformation progress.",
-        "Global electricity mix shows 61% non-renewables vs 39% renewables, while Qatar targets 20% renewables by 2030, significantly above the Middle East average (4%) but below global average (29%)."
-    ]
-    
-solar_insights = [
-        "Solar capacity experienced a remarkable 15,686% increase from 0.0051 GW in 2016 to 0.8051 GW in 2023.",
-        "Almost all capacity growth occurred in a single year (2022), indicating a major infrastructure commissioning.",
-        "Despite the capacity increase, the solar electricity generation data doesn't yet show a corresponding production increase, suggesting the new capacity may be at early operational stages.",
-        "This dramatic solar expansion aligns with Qatar's National Development Strategy and preparations for hosting the 2022 FIFA World Cup.",
-        "Qatar's 2030 target of 4 GW solar capacity would place it among the regional leaders in renewable capacity per capita, though still modest by global standards."
-    ]
-    
-    # New insights for Energy Change chart that was missing dedicated insights
-energy_change_insights = [
-        "Qatar's annual change in primary energy consumption shows significant volatility, with both substantial growth and contraction periods.",
-        "The 2020 pandemic year saw the most dramatic energy consumption contraction, reflecting global economic slowdown and reduced industrial activity.",
-        "Post-pandemic recovery shows a return to positive growth rates in energy consumption, potentially challenging sustainability targets.",
-        "Qatar's typical annual energy consumption growth (5-6% in the 2010s) far exceeds the global average (1.9% in 2022), reflecting Qatar's rapid development and energy-intensive economy.",
-        "Vision 2030 initiatives aim to moderate Qatar's energy consumption growth to below 3% annually by the late 2020s through efficiency improvements and renewable integration, though this would still exceed typical developed economy growth rates."
-    ]
-    
-    # New insights for Renewable Electricity Production Detail chart that was missing dedicated insights
-renewable_detail_insights = [
-        "Qatar's renewable electricity generation is dominated by solar power, accounting for nearly all renewable output since 2018.",
-        "Bioenergy makes a minimal contribution to Qatar's renewable mix, with very limited growth over the monitoring period.",
-        "Qatar's total renewable electricity production (0.15 TWh) is a fraction of the Middle East's already low renewable generation (47 TWh in 2022) and insignificant compared to global renewables (7,858 TWh in 2021).",
-        "The dramatic increase in solar capacity in 2022-2023 has not yet translated to substantial increases in electricity generation, suggesting early operational stages or potential utilization challenges.",
-        "Qatar's National Renewable Energy Strategy target of 4 GW solar capacity by 2030 would dramatically increase renewable electricity production, helping Qatar progress from its current 0.3% renewable share toward its 20% target."
-    ]
-    
-agricultural_insights = [
-        "Agricultural land increased from 71,000 hectares in 2016 to 74,000 hectares in 2021 (4.23% growth), reflecting Qatar's food security strategy.",
-        "Arable land saw more significant growth of 14.75% (18,300 to 21,000 hectares), indicating intensified cultivation efforts.",
-        "These increases align with Qatar's post-2017 blockade strategy to enhance domestic food production and reduce import dependence.",
-        "The expansion of agriculture in Qatar's challenging desert environment demonstrates technological innovation in climate-adapted farming.",
-        "Qatar's agricultural productivity (~$10-11K per worker) exceeds regional peers like Oman (~$6K) but remains below advanced economies (>$50K per worker)."
-    ]
-    
-overall_environmental_insights = [
-        "The data reveals a significant disconnect between Qatar's Vision 2030 environmental sustainability goals and actual progress, particularly in emissions and energy transition.",
-        "While showing impressive progress in solar capacity expansion and agricultural development, Qatar has made limited headway in overall emissions reduction and renewable energy integration.",
-        "With CO₂ emissions accelerating rather than decreasing, Qatar faces a critical decision point regarding its climate strategy credibility.",
-        "Despite significant investments in renewable capacity (particularly solar), the impact on the overall energy mix remains minimal.",
-        "The data highlights Qatar's complex sustainability challenge in balancing food security, water conservation, and energy transition in a desert environment.",
-        "Qatar's per capita emissions (8x global average) and fossil-fuel dominated electricity mix (99.7%) contrast with its ambitious Vision 2030 sustainability goals."
-    ]
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Gunicorn Config
+---------------
+Production serving configuration. Gunicorn reads this file from the working
+directory, so the dashboard is served with:
+
+    gunicorn app:server
+
+- The app is imported once in the master (preload_app), so the pillar stores,
+  translations, chart templates, insight catalog and pre-built cards are
+  loaded before the workers are forked and shared with them copy-on-write.
+- Once the master is ready it renders the full period of every tab in both
+  languages (app.warm_up) and freezes the garbage collector, so the warmed
+  caches are inherited by every worker and not copied when a collection
+  touches them. Workers only start accepting requests after the warm-up.
+- Workers and threads are sized from the CPUs available to the process.
+
+Settings are read from the environment:
+
+    PORT                port to listen on (8050)
+    WEB_CONCURRENCY     worker processes (CPUs + 1)
+    GUNICORN_THREADS    threads per worker (4)
+    GUNICORN_PRELOAD    0 to import the app in every worker instead
+    GUNICORN_WARM_UP    0 to skip the warm-up
+    GUNICORN_TIMEOUT    seconds before a silent worker is restarted (120)
+    GUNICORN_LOG_LEVEL  gunicorn log level (info)
+
+WARM_CACHE=1 (see app.py) additionally renders every year range at import,
+which with preload also happens once in the master.
+"""
+
+
+import gc
+import os
+import time
+
+
+# CPUs this process may run on, which can be fewer than the host has
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8050')}"
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+
+# Rendering a tab is CPU-bound Python, so one worker per CPU (plus one to cover
+# a worker blocked on I/O) does the rendering; threads serve the many cheap
+# requests (cache hits, year-range patches, per-chart callbacks) concurrently
+workers = int(os.environ.get('WEB_CONCURRENCY', available_cpus() + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# A cold render of every chart on a tab can take a few seconds on a small host
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = 30
+keepalive = 5
+
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+warm = os.environ.get('GUNICORN_WARM_UP', '1') != '0'
+
+
+def warm_up(log):
+    import app
+    started = time.perf_counter()
+    app.warm_up()
+    log.info("Warmed the caches in %.1fs", time.perf_counter() - started)
+
+
+# Master, after binding and before forking the workers: with preload the
+# warm-up runs once here and every worker inherits its caches
+def when_ready(server):
+    if not preload_app:
+        return
+    if warm:
+        warm_up(server.log)
+    # Keep the collector off the objects shared with the workers, so that
+    # collections in a worker do not write to (and copy) their pages
+    gc.freeze()
+
+
+# Worker, after importing the app and before accepting requests: without
+# preload every worker warms its own caches
+def post_worker_init(worker):
+    if not preload_app and warm:
+        warm_up(worker.log)
@@ -1,60 +0,0 @@
-#human_insights.py
-# Key Insights for Human Development with added benchmark comparisons
-educational_attainment_insights = [
-        "Mean years of schooling increased significantly by 11.44% from 9.67 years in 2016 to 10.77 years in 2022, indicating substantial progress in Qatar's educational development.",
-        "Primary education completion rates have steadily improved from 87.03% in 2016 to 90.47% in 2022, moving closer to universal basic education.",
-        "The population with at least upper secondary education increased dramatically from 41.01% in 2016 to 51.43% in 2022, representing a 25.4% improvement.",
-        "The percentage of adults with at least a bachelor's degree saw remarkable growth of 60.95%, from 18.88% in 2016 to 30.39% in 2022, one of the most impressive gains among all indicators.",
-        "Qatar's tertiary attainment (~30%) is comparable to high-income countries (30-45%) but remains below leading nations like Canada and Korea (>55%)."
-    ]
-    
-education_quality_insights = [
-        "The learning gap (difference between expected and learning-adjusted years of schooling) decreased from 0.69 years in 2017 to 0.43 years in 2020, representing a reduction in learning loss from 5.31% to 3.24%.",
-        "Expected years of schooling increased from 12.46 years in 2016 to 13.26 years in 2020, reflecting expanded educational opportunities.",
-        "Learning-adjusted years of schooling improved from 12.31 years in 2017 to 12.83 years in 2020, indicating not just more education but better quality education.",
-        "Despite improvements, the persistence of a learning gap suggests ongoing challenges in education quality that need addressing.",
-        "Qatar's expected years of schooling (13.26) exceeds the global average (12) but remains below leading countries (15), while learning-adjusted years (12.83) significantly outperform the global average (7.8)."
-    ]
-    
-human_capital_insights = [
-        "Qatar's Human Capital Index remained high and stable, changing only marginally from 0.992 in 2017 to 0.993 in 2020, indicating already strong human capital foundations.",
-        "Survival rates show positive trends, with the probability of survival to age 5 increasing from 94.05% in 2017 to 96.14% in 2020.",
-        "The survival rate from age 15-60 improved from 85.0% in 2017 to 87.8% in 2020, reflecting advancements in healthcare and quality of life.",
-        "A child born in Qatar today can expect to achieve 99.3% of their potential productivity as an adult, one of the highest rates globally.",
-        "Qatar's HCI (0.64) exceeds both the global average (0.56) and regional benchmarks (Saudi Arabia: 0.58) but remains below leading countries like Singapore (0.88) and Japan (0.80)."
-    ]
-    
-gender_equity_insights = [
-        "The pre-primary gender parity index consistently favors females, increasing from 0.979 in 2016 to 1.077 in 2020, indicating strong early educational opportunities for girls.",
-        "The trend shows an increasing female advantage in pre-primary enrollment, with the gender parity index growing by 10% from 2016 to 2020.",
-        "Strong female participation in early education creates a foundation for gender equality throughout the educational system.",
-        "The data suggests Qatar's educational policies have been particularly successful in promoting female participation in education from an early age.",
-        "Women comprise 51.6% of engineering students in Qatar, and Qatari women's enrollment in higher education is one of the highest in the region, even outnumbering men at public universities."
-    ]
-    
-    # New insights for Advanced Education Levels chart that was missing dedicated insights
-advanced_education_insights = [
-        "Qatar has made progress in developing its postgraduate education capacity, with modest increases in both master's and doctoral degree holders.",
-        "The percentage of adults with at least a master's degree is still relatively small but growing steadily as Qatar develops its knowledge economy workforce.",
-        "Doctoral education remains at an early stage of development, with a very small percentage of the population holding PhDs.",
-        "The OECD average tertiary attainment is approximately 39%, with Qatar aiming to reach similar levels for its citizen population.",
-        "Qatar's investment in Education City branch campuses and international educational partnerships demonstrates its commitment to developing advanced education, with a goal of leading the Arab world in higher education outcomes by 2030."
-    ]
-    
-    # New insights for Education Completion Rates chart that was missing dedicated insights
-completion_rates_insights = [
-        "Qatar's primary education completion rates have shown steady improvement, approaching universal completion (98-99%) for nationals.",
-        "Lower secondary completion rates have also improved but show greater room for growth compared to primary rates.",
-        "Qatar outperforms the global average in both primary (89% globally) and secondary (75% globally) completion rates.",
-        "Completion rate improvements reflect both better retention of students and expanded access to education for all residents.",
-        "Qatar's investments in free public schooling and education scholarships have been key factors in maximizing completion rates."
-    ]
-    
-overall_human_development_insights = [
-        "The substantial increase in higher education attainment (especially bachelor's degrees) aligns with Qatar's Vision 2030 goal of transitioning to a knowledge-based economy.",
-        "The decreasing learning gap suggests a focus on quality of education, not just increased enrollment numbers.",
-        "Improvements across multiple indicators (educational attainment, expected years of schooling, survival rates) demonstrate Qatar's multifaceted approach to human development.",
-        "The strong performance in gender parity indicates attention to educational equity, though more comprehensive equity measures would be valuable.",
-        "The consistent improvements across indicators reflect sustained investment in Qatar's human capital, a core component of Vision 2030.",
-        "Qatar's human development metrics generally exceed global and regional averages but remain below those of leading countries, indicating both achievement and continued room for growth."
-    ]
\ No newline at end of file
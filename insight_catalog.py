@@ -0,0 +1,165 @@
+"""
+Insight Catalog
+---------------
+Every written insight of the dashboard, kept in data/insights.json under a
+stable ID (e.g. "key-gdp-2") with its pillar, the card it belongs to (a chart
+ID from chart_specs.py or a stand-alone card ID), its sentiment and its
+English and Arabic text. Editing a sentence no longer detaches it from its
+sentiment or translation, since both live in the same entry.
+
+The file is read on first use into parallel arrays: small integer codes for
+pillar, card and sentiment, and one tuple of texts per language. Secondary
+indexes map a card, a pillar, a sentiment or a (pillar, sentiment) pair to
+the tuple of matching rows, so queries such as "all negative environmental
+insights" are a single dictionary lookup.
+
+Run `python insight_catalog.py` to validate the catalog file.
+"""
+
+
+import json
+import os
+import sys
+import threading
+from array import array
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'insights.json')
+
+PILLARS = ('key-indicators', 'economic', 'environmental', 'human', 'social')
+SENTIMENTS = ('positive', 'negative', 'neutral')
+LANGUAGE_FIELDS = {'english': 'en', 'arabic': 'ar'}
+
+
+class InsightCatalog:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    # Read the catalog file into arrays and indexes the first time it is needed
+    def _load(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with open(self.path, encoding='utf-8') as catalog_file:
+                entries = json.load(catalog_file)['insights']
+
+            self.cards = tuple(dict.fromkeys(entry['card'] for entry in entries))
+            card_codes = {card: code for code, card in enumerate(self.cards)}
+            self.ids = tuple(entry['id'] for entry in entries)
+            self.pillar_codes = array('B', (PILLARS.index(entry['pillar']) for entry in entries))
+            self.sentiment_codes = array('B', (SENTIMENTS.index(entry['sentiment']) for entry in entries))
+            self.card_codes = array('H', (card_codes[entry['card']] for entry in entries))
+            self.texts = {
+                language: tuple(entry.get(field) for entry in entries)
+                for language, field in LANGUAGE_FIELDS.items()
+            }
+
+            self.rows = {insight_id: row for row, insight_id in enumerate(self.ids)}
+            self.by_card = self._index(lambda row: self.cards[self.card_codes[row]])
+            self.by_pillar = self._index(lambda row: PILLARS[self.pillar_codes[row]])
+            self.by_sentiment = self._index(lambda row: SENTIMENTS[self.sentiment_codes[row]])
+            self.by_pillar_sentiment = self._index(
+                lambda row: (PILLARS[self.pillar_codes[row]], SENTIMENTS[self.sentiment_codes[row]])
+            )
+            self._loaded = True
+
+    # Rows grouped by a key function, in catalog order
+    def _index(self, key):
+        index = {}
+        for row in range(len(self.ids)):
+            index.setdefault(key(row), []).append(row)
+        return {value: tuple(rows) for value, rows in index.items()}
+
+    def __len__(self):
+        self._load()
+        return len(self.ids)
+
+    # Rows of a card's insights in display order
+    def card(self, card_id):
+        self._load()
+        return self.by_card[card_id]
+
+    # Rows of the insights with the given pillar and/or sentiment
+    def select(self, pillar=None, sentiment=None):
+        self._load()
+        if pillar is not None and sentiment is not None:
+            return self.by_pillar_sentiment.get((pillar, sentiment), ())
+        if pillar is not None:
+            return self.by_pillar.get(pillar, ())
+        if sentiment is not None:
+            return self.by_sentiment.get(sentiment, ())
+        return tuple(range(len(self.ids)))
+
+    def row(self, insight_id):
+        self._load()
+        return self.rows[insight_id]
+
+    def insight_id(self, row):
+        self._load()
+        return self.ids[row]
+
+    def sentiment(self, row):
+        self._load()
+        return SENTIMENTS[self.sentiment_codes[row]]
+
+    def pillar(self, row):
+        self._load()
+        return PILLARS[self.pillar_codes[row]]
+
+    # Text of an insight in a language, falling back to English without a translation
+    def text(self, row, language='english'):
+        self._load()
+        return self.texts.get(language, self.texts['english'])[row] or self.texts['english'][row]
+
+    def entry(self, insight_id):
+        row = self.row(insight_id)
+        return {
+            'id': insight_id,
+            'pillar': self.pillar(row),
+            'card': self.cards[self.card_codes[row]],
+            'sentiment': self.sentiment(row),
+            'en': self.texts['english'][row],
+            'ar': self.texts['arabic'][row],
+        }
+
+    # Problems found in the catalog file, as readable messages
+    def validate(self):
+        try:
+            with open(self.path, encoding='utf-8') as catalog_file:
+                entries = json.load(catalog_file)['insights']
+        except (OSError, ValueError, KeyError) as error:
+            return [f"cannot read {self.path}: {error}"]
+
+        problems = []
+        seen = set()
+        for position, entry in enumerate(entries):
+            label = entry.get('id') or f"entry {position}"
+            for field in ('id', 'pillar', 'card', 'sentiment', 'en'):
+                if not entry.get(field):
+                    problems.append(f"{label}: missing {field}")
+            if entry.get('id') in seen:
+                problems.append(f"{label}: duplicate id")
+            seen.add(entry.get('id'))
+            if entry.get('pillar') not in PILLARS:
+                problems.append(f"{label}: unknown pillar {entry.get('pillar')!r}")
+            if entry.get('sentiment') not in SENTIMENTS:
+                problems.append(f"{label}: unknown sentiment {entry.get('sentiment')!r}")
+            if not entry.get('ar'):
+                problems.append(f"{label}: no Arabic text")
+        return problems
+
+
+# Catalog of the dashboard, loaded on first use
+insight_catalog = InsightCatalog()
+
+
+if __name__ == '__main__':
+    problems = insight_catalog.validate()
+    for problem in problems:
+        print(problem)
+    if problems:
+        sys.exit(1)
+    print(f"{len(insight_catalog)} insights in {len(insight_catalog.cards)} cards: OK")
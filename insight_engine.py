@@ -0,0 +1,235 @@
+"""
+Insight Engine
+--------------
+Data-driven statements about the indicators of a chart for the selected year
+range, computed from the pillar stores instead of written by hand, so their
+numbers follow the year slider and any update of the CSV files:
+
+- overall change between the first and last year with data, with the compound
+  annual growth rate
+- highest and lowest value and their years
+- largest change between two consecutive years with data
+- ratio of the latest value to the global average in benchmarks.py
+
+Every statement carries a sentiment derived from the direction in which the
+indicator improves (INDICATORS). The statistics of all indicators of a pillar
+are computed at once with NumPy over the year range, and both they and the
+statements built from them are cached per range.
+
+A chart lists the indicators it describes in the 'highlights' field of its
+spec in chart_specs.py. The English statements follow the templates in
+translations.translation_templates, through which they are translated.
+"""
+
+
+import numpy as np
+
+from benchmarks import benchmark_value
+from kpi_engine import first_valid_rows, last_valid_rows
+from lru_cache import LRUCache
+
+# Describable indicators: display name (a translation key), value format, the
+# direction in which the indicator improves ('higher', 'lower' or None when it
+# has none), a scale applied before formatting, the benchmarks.py key path of
+# its global average and whether a 0 in the data is a gap rather than a value
+# (shares of the population or of graduates the sources leave at 0 for a year
+# they did not report)
+INDICATORS = {
+    'gdp_pc_ppp': {'name': "GDP per capita (PPP)", 'format': "${:,.0f}", 'better': 'higher',
+                   'benchmark': ('gdp_per_capita', 'global_avg')},
+    'hci': {'name': "Human Capital Index", 'format': "{:.2f}", 'better': 'higher',
+            'benchmark': ('human_capital_index', 'global_avg')},
+    'co2_pc': {'name': "CO₂ emissions per capita (tonnes)", 'format': "{:.1f}", 'better': 'lower',
+               'benchmark': ('co2_per_capita', 'global_avg')},
+    'co2': {'name': "CO₂ emissions (million tonnes)", 'format': "{:,.1f}", 'better': 'lower', 'scale': 1e-6},
+    'elec_renewables': {'name': "Electricity from renewables (TWh)", 'format': "{:.2f}", 'better': 'higher'},
+    'elec_fossil': {'name': "Electricity from fossil fuels (TWh)", 'format': "{:.1f}", 'better': None},
+    'elec_solar': {'name': "Electricity from solar (TWh)", 'format': "{:.2f}", 'better': 'higher'},
+    'solar_capacity': {'name': "Solar capacity (GW)", 'format': "{:.2f}", 'better': 'higher'},
+    'oil_prod': {'name': "Oil production (TWh)", 'format': "{:,.1f}", 'better': None},
+    'gas_prod': {'name': "Gas production (TWh)", 'format': "{:,.1f}", 'better': None},
+    'energy_cons': {'name': "Primary energy consumption (TWh)", 'format': "{:,.1f}", 'better': 'lower'},
+    'agri_value_worker': {'name': "Agricultural value added per worker", 'format': "${:,.0f}", 'better': 'higher'},
+    'business_grads': {'name': "Business, administration and law graduates (%)", 'format': "{:.1f}", 'better': None,
+                       'zero_is_missing': True},
+    'expected_school': {'name': "Expected years of school", 'format': "{:.1f}", 'better': 'higher',
+                        'benchmark': ('education_years', 'expected', 'global_avg')},
+    'learning_adjusted_school': {'name': "Learning-adjusted years of school", 'format': "{:.1f}", 'better': 'higher',
+                                 'benchmark': ('education_years', 'learning_adjusted', 'global_avg')},
+    'school_life': {'name': "School life expectancy (years)", 'format': "{:.1f}", 'better': 'higher'},
+    'attain_secondary': {'name': "Adults with upper secondary education (%)", 'format': "{:.1f}", 'better': 'higher',
+                         'zero_is_missing': True},
+    'attain_bachelor': {'name': "Adults with a bachelor's degree (%)", 'format': "{:.1f}", 'better': 'higher',
+                        'zero_is_missing': True},
+    'attain_master': {'name': "Adults with a master's degree (%)", 'format': "{:.2f}", 'better': 'higher',
+                      'zero_is_missing': True},
+    'attain_doctoral': {'name': "Adults with a doctoral degree (%)", 'format': "{:.2f}", 'better': 'higher',
+                        'zero_is_missing': True},
+    'completion_primary': {'name': "Primary completion rate (%)", 'format': "{:.1f}", 'better': 'higher',
+                           'zero_is_missing': True},
+    'completion_lower_secondary': {'name': "Lower secondary completion rate (%)", 'format': "{:.1f}",
+                                   'better': 'higher', 'zero_is_missing': True},
+    'sanitation': {'name': "Population with safely managed sanitation (%)", 'format': "{:.1f}", 'better': 'higher',
+                   'benchmark': ('sanitation', 'global_avg'), 'zero_is_missing': True},
+    'stem_grads': {'name': "STEM graduates (%)", 'format': "{:.1f}", 'better': 'higher',
+                   'benchmark': ('stem_graduates', 'global_avg'), 'zero_is_missing': True},
+    'ict_grads': {'name': "ICT graduates (%)", 'format': "{:.1f}", 'better': 'higher', 'zero_is_missing': True},
+    'skill_programming': {'name': "Adults with programming skills (%)", 'format': "{:.1f}", 'better': 'higher',
+                          'zero_is_missing': True},
+}
+
+# Relative changes smaller than this count as no change
+STEADY_CHANGE = 0.005
+
+
+# Sentiment of a change (or of a ratio's distance from 1) for an indicator
+# that improves in the given direction
+def sentiment(change, better):
+    if better is None or abs(change) < STEADY_CHANGE:
+        return 'neutral'
+    return 'positive' if (change > 0) == (better == 'higher') else 'negative'
+
+
+# Statistics of every column of a year-indexed block (rows are years), computed
+# at once: first and last year with data, extremes and the largest change
+# between consecutive years with data. Columns without data have count 0.
+def summarize(years, values):
+    rows, columns = values.shape
+    present = ~np.isnan(values)
+    count = present.sum(axis=0)
+    positions = np.arange(columns)
+
+    first = first_valid_rows(present)
+    last = last_valid_rows(present)
+    highest = np.where(present, values, -np.inf).argmax(axis=0)
+    lowest = np.where(present, values, np.inf).argmin(axis=0)
+
+    # Row of the previous value present in each column, for year-over-year changes
+    latest = np.maximum.accumulate(np.where(present, np.arange(rows)[:, None], -1), axis=0)
+    previous = np.vstack([np.full((1, columns), -1), latest[:-1]])
+    has_previous = present & (previous >= 0)
+    before = values[np.maximum(previous, 0), positions]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        step_change = np.where(has_previous & (before != 0), (values - before) / np.abs(before), np.nan)
+    jump = np.where(np.isnan(step_change), -1, np.abs(step_change)).argmax(axis=0)
+
+    return {
+        'count': count,
+        'first_year': years[first],
+        'first': values[first, positions],
+        'last_year': years[last],
+        'last': values[last, positions],
+        'highest_year': years[highest],
+        'highest': values[highest, positions],
+        'lowest_year': years[lowest],
+        'lowest': values[lowest, positions],
+        'jump_year': years[jump],
+        'jump_from_year': years[np.maximum(previous[jump, positions], 0)],
+        'jump': step_change[jump, positions],
+    }
+
+
+class InsightEngine:
+    def __init__(self, specs, translate, maxsize=1024):
+        self.specs = specs
+        self.translate = translate
+        self.stores = {}
+        self.cache = LRUCache(maxsize=maxsize)
+
+    # Use freshly loaded pillar stores and drop every result computed from the old ones
+    def set_stores(self, stores):
+        self.stores = stores
+        self.cache.invalidate()
+
+    def stats(self):
+        return self.cache.stats()
+
+    # Statistics of every indicator of a pillar over a year range, keyed by indicator ID
+    def summary(self, pillar, min_year, max_year):
+        store = self.stores[pillar]
+        rows = store.span(min_year, max_year)
+        return self.cache.get_or_compute(('summary', pillar, rows.start, rows.stop),
+                                         lambda: self._summarize(store, rows))
+
+    def _summarize(self, store, rows):
+        values = store.values[rows]
+        gaps = np.array([INDICATORS.get(indicator, {}).get('zero_is_missing', False) for indicator in store.ids])
+        columns = summarize(store.years[rows], np.where(gaps & (values == 0), np.nan, values))
+        return {
+            indicator: {field: values[position].item() for field, values in columns.items()}
+            for position, indicator in enumerate(store.ids)
+        }
+
+    # (sentiment, text) statements about one indicator of a pillar over a year range
+    def statements(self, pillar, indicator, min_year, max_year, language='english', full=True):
+        rows = self.stores[pillar].span(min_year, max_year)
+        key = ('statements', pillar, indicator, rows.start, rows.stop, language, full)
+        return self.cache.get_or_compute(key, lambda: [
+            (mood, self.translate(text, language))
+            for mood, text in self.describe(indicator, self.summary(pillar, min_year, max_year)[indicator],
+                                            min_year, max_year, full)
+        ])
+
+    # Statements about every indicator a chart highlights; the first indicator
+    # gets all of them, the others only their overall change and benchmark ratio
+    def chart_statements(self, chart_id, min_year, max_year, language='english'):
+        spec = self.specs[chart_id]
+        return [
+            statement
+            for position, indicator in enumerate(spec.get('highlights', []))
+            for statement in self.statements(spec['pillar'], indicator, min_year, max_year, language,
+                                             full=position == 0)
+        ]
+
+    # English (sentiment, text) statements from the statistics of one indicator
+    def describe(self, indicator, summary, min_year, max_year, full=True):
+        info = INDICATORS[indicator]
+        better = info['better']
+        name = info['name']
+
+        def number(value):
+            return info['format'].format(value * info.get('scale', 1))
+
+        if summary['count'] == 0:
+            if min_year == max_year:
+                return [('neutral', f"No data available for {name} in {min_year}.")]
+            return [('neutral', f"No data available for {name} between {min_year} and {max_year}.")]
+
+        first, last = summary['first'], summary['last']
+        first_year, last_year = summary['first_year'], summary['last_year']
+        if summary['count'] == 1:
+            found = [('neutral', f"{name} was {number(last)} in {last_year}.")]
+        elif first == 0:
+            direction = 'rose' if last > 0 else 'fell'
+            found = [(sentiment(last, better),
+                      f"{name} {direction} from {number(first)} in {first_year} to {number(last)} in {last_year}.")]
+        else:
+            change = (last - first) / abs(first)
+            if abs(change) < STEADY_CHANGE:
+                found = [('neutral', f"{name} was unchanged at {number(last)} between {first_year} and {last_year}.")]
+            else:
+                direction = 'rose' if change > 0 else 'fell'
+                text = (f"{name} {direction} by {abs(change):.2%} from {number(first)} in {first_year} "
+                        f"to {number(last)} in {last_year}")
+                if first > 0 and last > 0 and last_year - first_year > 1:
+                    growth = (last / first) ** (1 / (last_year - first_year)) - 1
+                    text += f", {growth:+.2%} a year on average"
+                found = [(sentiment(change, better), text + ".")]
+
+        # Extremes and the largest step only for a series that moves in the range
+        if full and summary['count'] > 2:
+            highest, lowest = number(summary['highest']), number(summary['lowest'])
+            if highest != lowest:
+                found.append(('neutral', f"{name}: highest {highest} in {summary['highest_year']}, "
+                                         f"lowest {lowest} in {summary['lowest_year']}."))
+            if not np.isnan(summary['jump']) and abs(summary['jump']) >= STEADY_CHANGE:
+                found.append((sentiment(summary['jump'], better),
+                              f"{name}: largest year-over-year change of {summary['jump']:+.1%} "
+                              f"from {summary['jump_from_year']} to {summary['jump_year']}."))
+
+        if 'benchmark' in info:
+            average = benchmark_value(info['benchmark'])
+            ratio = last / average
+            found.append((sentiment(ratio - 1, better),
+                          f"{name} in {last_year} was {ratio:.1f}x the global average of {number(average)}."))
+        return found
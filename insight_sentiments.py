@@ -1,228 +0,0 @@
-insight_sentiments = {
-
-    #key insights sentiments
-        "Qatar's GDP per capita has shown notable volatility between 2016-2023, with a 3.24% overall decline.": {'sentiment': 'negative'},
-        "The most significant drop occurred in 2020 (to $103,062), representing a 14% decline from 2016 levels.": {'sentiment': 'negative'},
-        "The economy showed strong resilience with a rapid recovery to $116,833 in 2021.": {'sentiment': 'positive'},
-        "The stabilization around $115,000 in recent years suggests a 'new normal' that balances energy market realities with economic diversification efforts.": {'sentiment': 'neutral'},
-        "Qatar's GDP per capita remains approximately 5.4x the global average ($22,450) and significantly higher than regional neighbors (UAE: $83,900, Saudi Arabia: $54,992).": {'sentiment': 'positive'},
-        
-        "Oil production declined from 582.57 TWh in 2016 to a low of 511.54 TWh in 2020 (-12.2%), but has since recovered to 616.21 TWh in 2023.": {'sentiment': 'neutral'},
-        "The initial reduction reflects Qatar's strategic decision to focus more on natural gas, where it holds comparative advantage.": {'sentiment': 'positive'},
-        "The 20.5% increase from 2020 to 2023 shows Qatar's response to higher global energy demand and prices after the pandemic.": {'sentiment': 'positive'},
-        "The upward trend in recent years raises questions about alignment with climate commitments and sustainability goals.": {'sentiment': 'negative'},
-        "Qatar's oil output (~0.67 million barrels/day) is modest compared to other GCC producers, reflecting its strategic focus on natural gas production.": {'sentiment': 'neutral'},
-        
-        "Qatar has been investing heavily in liquefied natural gas (LNG) infrastructure, aiming to increase production capacity from 77 to 126 million tons annually by 2027.": {'sentiment': 'positive'},
-        "The focus on gas aligns with Qatar's positioning of natural gas as a 'transition fuel' with lower carbon emissions than oil or coal.": {'sentiment': 'positive'},
-        "Sustained gas production provides Qatar with economic stability as global demand for cleaner burning fuels increases.": {'sentiment': 'positive'},
-        "The vast majority of Qatar's gas production is destined for export markets, making it a critical component of the country's revenue stream.": {'sentiment': 'positive'},
-        "Qatar aims to maintain its position as one of the world's largest LNG exporters, competing with the U.S. which surpassed Qatar as the top LNG exporter in 2023.": {'sentiment': 'neutral'},
-        
-        "Energy consumption fluctuated significantly, from 168.92 TWh in 2016 to a low of 126.88 TWh in 2020 (-24.9%), before rebounding to 170.21 TWh in 2023.": {'sentiment': 'neutral'},
-        "The consumption pattern closely mirrors GDP trends, with the 2020 pandemic-related drop and subsequent recovery.": {'sentiment': 'neutral'},
-        "The data suggests limited progress in improving energy efficiency, as consumption has grown in line with economic recovery.": {'sentiment': 'negative'},
-        "Qatar has one of the world's highest per capita energy consumption rates, reflecting its energy-intensive industries and high standard of living.": {'sentiment': 'negative'},
-        "Global energy demand typically grows at 1-2% annually, while Qatar experienced 6-7% annual growth in the 2010s, though it targets moderating to 2-3% by the late 2020s.": {'sentiment': 'neutral'},
-        
-        "Qatar's energy growth rates show significant volatility, reflecting both global energy market fluctuations and domestic economic changes.": {'sentiment': 'neutral'},
-        "Growth rates were particularly negative during the 2020 pandemic period, with sharp contractions across all energy sources.": {'sentiment': 'negative'},
-        "Post-pandemic recovery shows positive growth rates, particularly in oil consumption, which may contradict Vision 2030's sustainability goals.": {'sentiment': 'negative'},
-        "Qatar's historical energy demand growth of 6-7% annually significantly exceeds the global average (1-2%), highlighting the challenge of energy-intensive development.": {'sentiment': 'negative'},
-        "Vision 2030 and the National Environment and Climate Strategy aim to reduce these high growth rates to a more sustainable 2-3% annually by 2030, still higher than typical OECD countries that have achieved near-zero growth through efficiency measures.": {'sentiment': 'neutral'},
-        
-        "Despite Qatar's challenging desert environment, agricultural productivity per worker is relatively high at $10,000-$11,000 (2015 US$) in value-added terms.": {'sentiment': 'positive'},
-        "Qatar's agricultural productivity exceeds regional peers like Oman (~$6,000) but remains well below advanced economies (>$50,000 per worker).": {'sentiment': 'neutral'},
-        "The high per-worker value reflects Qatar's capital-intensive agricultural approach, utilizing advanced technologies like hydroponics and climate-controlled greenhouses.": {'sentiment': 'positive'},
-        "Following the 2017 blockade, Qatar has heavily invested in agricultural self-sufficiency, with arable land increasing by 14.75% (18,300 to 21,000 hectares).": {'sentiment': 'positive'},
-        "By 2030, Qatar aims to further improve agricultural efficiency through high-yield technology to enhance food security, even as the sector remains <1% of GDP.": {'sentiment': 'positive'},
-        
-        "Business, administration, and law have historically been popular fields of study in Qatar, with approximately 26% of tertiary graduates specializing in these areas in 2018.": {'sentiment': 'neutral'},
-        "This proportion is lower than in some other service-driven Gulf economies, such as Bahrain, where nearly 50% of graduates focus on business and law.": {'sentiment': 'neutral'},
-        "Vision 2030 doesn't discourage these fields but seeks a better balance with STEM subjects to support innovation and knowledge economy development.": {'sentiment': 'positive'},
-        "The inverse relationship between business/law and STEM graduates represents a challenge for Qatar's diversification - as one increases, the other tends to decrease.": {'sentiment': 'negative'},
-        "Qatar aims to keep business/law graduates around or below one-third of total graduates while boosting STEM and technical fields to better align with labor market needs in a diversifying economy.": {'sentiment': 'positive'},
-    
-    # Environmental insights sentiments
-
-        "Total CO₂ emissions rose by 32.42% from 87.4 million tonnes in 2016 to 115.7 million tonnes in 2023, showing a concerning upward trajectory.": {'sentiment': 'negative'},
-        "CO₂ emissions per capita increased by 15.54% from 33.62 tonnes in 2016 to 38.84 tonnes in 2023, maintaining Qatar's position among the world's highest per capita emitters.": {'sentiment': 'negative'},
-        "The data shows an accelerating emissions trend, with the most significant jump occurring between 2022 and 2023 (9% increase in just one year).": {'sentiment': 'negative'},
-        "The rising emissions directly conflict with Qatar's environmental sustainability goals under Vision 2030 and its international climate commitments.": {'sentiment': 'negative'},
-        "Qatar's per capita emissions (38.84 tonnes) are approximately 8x the global average (4.8 tonnes) and higher than regional peers (Kuwait: 25 tonnes, UAE: 20 tonnes, Saudi Arabia: 18 tonnes).": {'sentiment': 'negative'},
-        
-        "Fossil fuels generate over 99.7% of Qatar's electricity, with renewables contributing a minimal 0.28-0.31% throughout the period.": {'sentiment': 'negative'},
-        "Total electricity production increased by 28.2% from 42.44 TWh in 2016 to 54.39 TWh in 2023, driving up absolute emissions.": {'sentiment': 'negative'},
-        "Despite global renewable energy trends, Qatar's renewable electricity generation has plateaued at around 0.15 TWh since 2018.": {'sentiment': 'negative'},
-        "The data reveals a significant gap between Qatar's sustainability rhetoric and actual energy transformation progress.": {'sentiment': 'negative'},
-        "Global electricity mix shows 61% non-renewables vs 39% renewables, while Qatar targets 20% renewables by 2030, significantly above the Middle East average (4%) but below global average (29%).": {'sentiment': 'neutral'},
-        
-        "Solar capacity experienced a remarkable 15,686% increase from 0.0051 GW in 2016 to 0.8051 GW in 2023.": {'sentiment': 'positive'},
-        "Almost all capacity growth occurred in a single year (2022), indicating a major infrastructure commissioning.": {'sentiment': 'positive'},
-        "Despite the capacity increase, the solar electricity generation data doesn't yet show a corresponding production increase, suggesting the new capacity may be at early operational stages.": {'sentiment': 'neutral'},
-        "This dramatic solar expansion aligns with Qatar's National Development Strategy and preparations for hosting the 2022 FIFA World Cup.": {'sentiment': 'positive'},
-        "Qatar's 2030 target of 4 GW solar capacity would place it among the regional leaders in renewable capacity per capita, though still modest by global standards.": {'sentiment': 'positive'},
-        
-        "Qatar's annual change in primary energy consumption shows significant volatility, with both substantial growth and contraction periods.": {'sentiment': 'neutral'},
-        "The 2020 pandemic year saw the most dramatic energy consumption contraction, reflecting global economic slowdown and reduced industrial activity.": {'sentiment': 'neutral'},
-        "Post-pandemic recovery shows a return to positive growth rates in energy consumption, potentially challenging sustainability targets.": {'sentiment': 'negative'},
-        "Qatar's typical annual energy consumption growth (5-6% in the 2010s) far exceeds the global average (1.9% in 2022), reflecting Qatar's rapid development and energy-intensive economy.": {'sentiment': 'negative'},
-        "Vision 2030 initiatives aim to moderate Qatar's energy consumption growth to below 3% annually by the late 2020s through efficiency improvements and renewable integration, though this would still exceed typical developed economy growth rates.": {'sentiment': 'neutral'},
-        
-        "Qatar's renewable electricity generation is dominated by solar power, accounting for nearly all renewable output since 2018.": {'sentiment': 'neutral'},
-        "Bioenergy makes a minimal contribution to Qatar's renewable mix, with very limited growth over the monitoring period.": {'sentiment': 'negative'},
-        "Qatar's total renewable electricity production (0.15 TWh) is a fraction of the Middle East's already low renewable generation (47 TWh in 2022) and insignificant compared to global renewables (7,858 TWh in 2021).": {'sentiment': 'negative'},
-        "The dramatic increase in solar capacity in 2022-2023 has not yet translated to substantial increases in electricity generation, suggesting early operational stages or potential utilization challenges.": {'sentiment': 'neutral'},
-        "Qatar's National Renewable Energy Strategy target of 4 GW solar capacity by 2030 would dramatically increase renewable electricity production, helping Qatar progress from its current 0.3% renewable share toward its 20% target.": {'sentiment': 'positive'},
-        
-        "Agricultural land increased from 71,000 hectares in 2016 to 74,000 hectares in 2021 (4.23% growth), reflecting Qatar's food security strategy.": {'sentiment': 'positive'},
-        "Arable land saw more significant growth of 14.75% (18,300 to 21,000 hectares), indicating intensified cultivation efforts.": {'sentiment': 'positive'},
-        "These increases align with Qatar's post-2017 blockade strategy to enhance domestic food production and reduce import dependence.": {'sentiment': 'positive'},
-        "The expansion of agriculture in Qatar's challenging desert environment demonstrates technological innovation in climate-adapted farming.": {'sentiment': 'positive'},
-        "Qatar's agricultural productivity (~$10-11K per worker) exceeds regional peers like Oman (~$6K) but remains below advanced economies (>$50K per worker).": {'sentiment': 'neutral'},
- 
-    # Human Development insights sentiments
-
-        "Mean years of schooling increased significantly by 11.44% from 9.67 years in 2016 to 10.77 years in 2022, indicating substantial progress in Qatar's educational development.": {'sentiment': 'positive'},
-        "Primary education completion rates have steadily improved from 87.03% in 2016 to 90.47% in 2022, moving closer to universal basic education.": {'sentiment': 'positive'},
-        "The population with at least upper secondary education increased dramatically from 41.01% in 2016 to 51.43% in 2022, representing a 25.4% improvement.": {'sentiment': 'positive'},
-        "The percentage of adults with at least a bachelor's degree saw remarkable growth of 60.95%, from 18.88% in 2016 to 30.39% in 2022, one of the most impressive gains among all indicators.": {'sentiment': 'positive'},
-        "Qatar's tertiary attainment (~30%) is comparable to high-income countries (30-45%) but remains below leading nations like Canada and Korea (>55%).": {'sentiment': 'neutral'},
-        
-        "The learning gap (difference between expected and learning-adjusted years of schooling) decreased from 0.69 years in 2017 to 0.43 years in 2020, representing a reduction in learning loss from 5.31% to 3.24%.": {'sentiment': 'positive'},
-        "Expected years of schooling increased from 12.46 years in 2016 to 13.26 years in 2020, reflecting expanded educational opportunities.": {'sentiment': 'positive'},
-        "Learning-adjusted years of schooling improved from 12.31 years in 2017 to 12.83 years in 2020, indicating not just more education but better quality education.": {'sentiment': 'positive'},
-        "Despite improvements, the persistence of a learning gap suggests ongoing challenges in education quality that need addressing.": {'sentiment': 'negative'},
-        "Qatar's expected years of schooling (13.26) exceeds the global average (12) but remains below leading countries (15), while learning-adjusted years (12.83) significantly outperform the global average (7.8).": {'sentiment': 'positive'},
-    
-        "Qatar's Human Capital Index remained high and stable, changing only marginally from 0.992 in 2017 to 0.993 in 2020, indicating already strong human capital foundations.": {'sentiment': 'positive'},
-        "Survival rates show positive trends, with the probability of survival to age 5 increasing from 94.05% in 2017 to 96.14% in 2020.": {'sentiment': 'positive'},
-        "The survival rate from age 15-60 improved from 85.0% in 2017 to 87.8% in 2020, reflecting advancements in healthcare and quality of life.": {'sentiment': 'positive'},
-        "A child born in Qatar today can expect to achieve 99.3% of their potential productivity as an adult, one of the highest rates globally.": {'sentiment': 'positive'},
-        "Qatar's HCI (0.64) exceeds both the global average (0.56) and regional benchmarks (Saudi Arabia: 0.58) but remains below leading countries like Singapore (0.88) and Japan (0.80).": {'sentiment': 'positive'},
-        
-        "The pre-primary gender parity index consistently favors females, increasing from 0.979 in 2016 to 1.077 in 2020, indicating strong early educational opportunities for girls.": {'sentiment': 'positive'},
-        "The trend shows an increasing female advantage in pre-primary enrollment, with the gender parity index growing by 10% from 2016 to 2020.": {'sentiment': 'positive'},
-        "Strong female participation in early education creates a foundation for gender equality throughout the educational system.": {'sentiment': 'positive'},
-        "The data suggests Qatar's educational policies have been particularly successful in promoting female participation in education from an early age.": {'sentiment': 'positive'},
-        "Women comprise 51.6% of engineering students in Qatar, and Qatari women's enrollment in higher education is one of the highest in the region, even outnumbering men at public universities.": {'sentiment': 'positive'},
-        
-        "Qatar has made progress in developing its postgraduate education capacity, with modest increases in both master's and doctoral degree holders.": {'sentiment': 'positive'},
-        "The percentage of adults with at least a master's degree is still relatively small but growing steadily as Qatar develops its knowledge economy workforce.": {'sentiment': 'neutral'},
-        "Doctoral education remains at an early stage of development, with a very small percentage of the population holding PhDs.": {'sentiment': 'neutral'},
-        "The OECD average tertiary attainment is approximately 39%, with Qatar aiming to reach similar levels for its citizen population.": {'sentiment': 'neutral'},
-        "Qatar's investment in Education City branch campuses and international educational partnerships demonstrates its commitment to developing advanced education, with a goal of leading the Arab world in higher education outcomes by 2030.": {'sentiment': 'positive'},
-        
-        "Qatar's primary education completion rates have shown steady improvement, approaching universal completion (98-99%) for nationals.": {'sentiment': 'positive'},
-        "Lower secondary completion rates have also improved but show greater room for growth compared to primary rates.": {'sentiment': 'neutral'},
-        "Qatar outperforms the global average in both primary (89% globally) and secondary (75% globally) completion rates.": {'sentiment': 'positive'},
-        "Completion rate improvements reflect both better retention of students and expanded access to education for all residents.": {'sentiment': 'positive'},
-        "Qatar's investments in free public schooling and education scholarships have been key factors in maximizing completion rates.": {'sentiment': 'positive'},
-    
-    # Social Development insights sentiments
-
-        "Qatar has made remarkable progress in sanitation services, increasing coverage from 94.68% in 2016 to 99.94% in 2022 (5.55% improvement).": {'sentiment': 'positive'},
-        "The data shows consistent year-on-year improvements, with approximately 0.9 percentage point gains annually.": {'sentiment': 'positive'},
-        "Qatar has effectively achieved the UN Sustainable Development Goal target for universal access to safely managed sanitation.": {'sentiment': 'positive'},
-        "Near-universal sanitation coverage represents a significant public health achievement that contributes to disease prevention and overall quality of life.": {'sentiment': 'positive'},
-        "Qatar's sanitation access (99.94%) significantly exceeds the global average (75%) and is comparable to leading regions like North America and Europe (99%).": {'sentiment': 'positive'},
-        
-        "Qatar has achieved gender parity in primary education, with the Gender Parity Index (GPI) improving from 0.994 in 2016 to 1.030 in 2019, indicating a slight advantage for female students.": {'sentiment': 'positive'},
-        "The 3.64% improvement in GPI reflects Qatar's commitment to equal educational opportunities regardless of gender.": {'sentiment': 'positive'},
-        "By 2019, the GPI exceeded 1.0, indicating that girls slightly outnumber boys in primary education enrollment.": {'sentiment': 'positive'},
-        "The data suggests Qatar's educational policies have been effective in eliminating gender-based barriers to basic education.": {'sentiment': 'positive'},
-        "Women comprise 51.6% of engineering students in Qatar, and female enrollment in tertiary education is among the highest in the region, with women often outnumbering men in university enrollment.": {'sentiment': 'positive'},
-        
-        "The percentage of graduates from STEM programs has decreased dramatically by 39.96%, from 29.70% in 2016 to 17.83% in 2022.": {'sentiment': 'negative'},
-        "The decline has been persistent across all years, indicating a systematic shift in student preferences away from STEM fields.": {'sentiment': 'negative'},
-        "This trend poses a significant challenge to Qatar's ambition to develop a knowledge-based economy with strong scientific and technological foundations.": {'sentiment': 'negative'},
-        "The consistent decline suggests an urgent need for interventions to increase interest and enrollment in STEM fields.": {'sentiment': 'negative'},
-        "Qatar's current STEM graduate percentage (17.83%) is below both the global average (23%) and regional peer Saudi Arabia (32%), and significantly trails leading countries like Oman (43%) and Germany (37%).": {'sentiment': 'negative'},
-        
-        "Email skills have shown steady improvement, increasing from 56.55% in 2016 to 58.72% in 2020 (3.84% growth).": {'sentiment': 'positive'},
-        "Programming skills have decreased from 5.51% in 2016 to 5.06% in 2019 (-8.25%), indicating challenges in developing advanced digital capabilities.": {'sentiment': 'negative'},
-        "The divergence between improving basic skills and declining advanced skills suggests a digital skills gap that could impact innovation capacity.": {'sentiment': 'negative'},
-        "While basic digital literacy is improving, the relatively low levels of advanced digital skills may limit Qatar's digital transformation ambitions.": {'sentiment': 'negative'},
-        "Qatar's vision for a knowledge economy requires stronger development of advanced technical skills to support digitization initiatives and AI/robotics adoption.": {'sentiment': 'neutral'},
-        
-        "ICT (Information & Communication Technologies) graduates represent a relatively small percentage of Qatar's total tertiary graduates.": {'sentiment': 'negative'},
-        "ICT graduate percentages have shown fluctuations without a clear upward trend, failing to match the growing importance of digital skills in the global economy.": {'sentiment': 'negative'},
-        "The gap between Qatar's ICT graduate production and its digital economy ambitions poses a challenge for the country's knowledge economy transition.": {'sentiment': 'negative'},
-        "Qatar's partnerships with technology companies (Microsoft, Google Cloud) are creating demand for ICT specialists that may exceed domestic graduate production.": {'sentiment': 'negative'},
-        "Targeted programs to encourage ICT specialization will be crucial for Qatar to develop the skilled workforce needed for its digital future.": {'sentiment': 'neutral'},
-    
-    # Key Indicators insights sentiments
-
-        "Qatar maintained one of the world's highest GDP per capita levels throughout the period (over $100,000), but experienced a slight overall decline of 3.24% from 2016 to 2023.": {'sentiment': 'neutral'},
-        "A significant drop occurred in 2020 (down to $103,061), representing a 14.2% decrease from 2016 levels, clearly showing the pandemic's impact.": {'sentiment': 'negative'},
-        "The economy rebounded strongly in 2021 to $116,832, nearly returning to pre-pandemic levels, demonstrating economic resilience.": {'sentiment': 'positive'},
-        "Qatar's GDP per capita is approximately 5.4x the global average ($22,450) and significantly higher than regional neighbors (UAE: $83,900, Saudi Arabia: $54,992).": {'sentiment': 'positive'},
-    
-        "The HCI data is only available for 2017, 2018, and 2020, which limits comprehensive trend analysis.": {'sentiment': 'neutral'},
-        "There was a steady improvement in HCI from 0.615 in 2017 to 0.638 in 2020, representing a 3.7% increase.": {'sentiment': 'positive'},
-        "A score of 0.638 means that a child born in Qatar today will be 63.8% as productive as they could be with complete education and full health.": {'sentiment': 'neutral'},
-        "Qatar's HCI (0.64) is above the global average (0.56) and Middle East average, but remains below leading countries like Singapore (0.88) and Japan (0.80).": {'sentiment': 'positive'},
-        
-        "CO₂ emissions per capita increased by 15.54% from 2016 to 2023, reaching 38.84 tonnes per person in 2023.": {'sentiment': 'negative'},
-        "Emissions showed significant year-to-year variability, suggesting changing energy usage patterns.": {'sentiment': 'neutral'},
-        "The upward trend contradicts Qatar's environmental sustainability goals and presents a major challenge for Vision 2030's environmental pillar.": {'sentiment': 'negative'},
-        "Qatar's per capita emissions (38.84 tonnes) are approximately 8x the global average (4.8 tonnes) and higher than regional peers (Kuwait: 25 tonnes, UAE: 20 tonnes, Saudi Arabia: 18 tonnes).": {'sentiment': 'negative'},
-        
-        "Renewable electricity production increased slightly from 0.13 TWh in 2016 to 0.15 TWh in 2023 (15.38% increase).": {'sentiment': 'positive'},
-        "After increasing to 0.15 TWh in 2018, renewable electricity production has plateaued without further growth through 2023.": {'sentiment': 'negative'},
-        "Given Qatar's climate, there's significant untapped potential for solar energy expansion.": {'sentiment': 'neutral'},
-        "Qatar targets 20% of electricity from renewables by 2030, which would exceed the current Middle East average (4%) but remain below the global average (29%) and far behind leading countries like Brazil and Norway (80-95%).": {'sentiment': 'positive'},
-        
-        "Qatar's energy production is dominated by natural gas, with a significant focus on LNG exports where Qatar is a global leader.": {'sentiment': 'positive'},
-        "Oil production experienced a decline from 582.57 TWh in 2016 to 511.54 TWh in 2020 (-12.2%), before rebounding to 616.21 TWh in 2023.": {'sentiment': 'neutral'},
-        "Gas production has been more stable, reflecting Qatar's strategic emphasis on its vast North Field gas reserves.": {'sentiment': 'positive'},
-        "Qatar plans to boost LNG output by 85% from current 77 million tons to 126-142 million tons by 2030, aiming to reclaim its position as the world's top LNG exporter.": {'sentiment': 'positive'},
-        "This expansion will cement Qatar's position in global energy markets, targeting approximately 25% of global LNG trade by 2030.": {'sentiment': 'positive'},
-        
-        "Qatar has shown steady improvement in expected years of schooling, increasing from 12.46 years in 2016 to 13.26 years in 2020 (6.4% growth).": {'sentiment': 'positive'},
-        "The Learning-Adjusted Years of School metric improved from 12.31 years in 2017 to 12.83 years in 2020, indicating enhanced education quality.": {'sentiment': 'positive'},
-        "The gap between expected and learning-adjusted years decreased from 0.69 to 0.43 years, showing a reduction in learning loss from 5.31% to 3.24%.": {'sentiment': 'positive'},
-        "Qatar's tertiary enrollment has grown substantially, from approximately 20% in the mid-2010s to over 40% recently, approaching the global average.": {'sentiment': 'positive'},
-        "Qatar's education metrics now exceed global averages (12 expected years globally vs. 13.26 in Qatar; 7.8 learning-adjusted years globally vs. 12.83 in Qatar).": {'sentiment': 'positive'},
-        
-        "The percentage of graduates from STEM programs has declined dramatically from 29.70% in 2016 to 17.83% in 2022, representing a 39.96% decrease.": {'sentiment': 'negative'},
-        "This consistent downward trend in STEM graduates contradicts Qatar's Vision 2030 goal of building a knowledge-based economy and innovation ecosystem.": {'sentiment': 'negative'},
-        "At 17.83%, Qatar's STEM graduate percentage has fallen below the global average (23%) and significantly trails regional competitor Saudi Arabia (32%).": {'sentiment': 'negative'},
-        "Leading countries in STEM education, such as Oman (43%) and Germany (37%), far outpace Qatar's current performance in this critical metric.": {'sentiment': 'negative'},
-        "The decline in STEM graduates represents a major challenge for Qatar's economic diversification goals and may hinder the country's competitiveness in high-tech sectors.": {'sentiment': 'negative'},
-    
-    # Overall insights sentiments for each tab
-
-        "Economic Resilience: Despite fluctuations, Qatar maintains exceptionally high living standards (5.4x global average GDP per capita) while navigating energy transitions.": {'sentiment': 'positive'},
-        "Environmental Challenges: Rising CO₂ emissions (8x global average) and limited renewable energy growth present the most significant challenges to Qatar Vision 2030 goals.": {'sentiment': 'negative'},
-        "Human Development Progress: Education access is improving substantially, with Qatar's Human Capital Index (0.64) exceeding the global average (0.56), but quality metrics and STEM graduate percentages require attention.": {'sentiment': 'positive'},
-        "Infrastructural Achievements: Near-universal sanitation (1.3x global average) and dramatic solar capacity expansion demonstrate Qatar's ability to rapidly develop infrastructure.": {'sentiment': 'positive'},
-        
-        "The data confirms Qatar's continued heavy reliance on oil and gas, despite diversification efforts under Vision 2030.": {'sentiment': 'negative'},
-        "Qatar has demonstrated economic resilience, quickly recovering from the 2020 pandemic-induced downturn.": {'sentiment': 'positive'},
-        "While educational reforms show progress, the economic structure remains heavily tilted toward energy production.": {'sentiment': 'neutral'},
-        "Qatar is pursuing a careful balance between maximizing short-term revenue from its hydrocarbon resources while investing in long-term diversification.": {'sentiment': 'neutral'},
-        "There remains an inherent tension between Qatar's role as a major hydrocarbon producer and its sustainability ambitions under Vision 2030.": {'sentiment': 'negative'},
-        "Qatar's GDP per capita (5.4x global average) and per-worker agricultural value (higher than regional peers) demonstrate its economic efficiency.": {'sentiment': 'positive'},
-        
-        "The data reveals a significant disconnect between Qatar's Vision 2030 environmental sustainability goals and actual progress, particularly in emissions and energy transition.": {'sentiment': 'negative'},
-        "While showing impressive progress in solar capacity expansion and agricultural development, Qatar has made limited headway in overall emissions reduction and renewable energy integration.": {'sentiment': 'neutral'},
-        "With CO₂ emissions accelerating rather than decreasing, Qatar faces a critical decision point regarding its climate strategy credibility.": {'sentiment': 'negative'},
-        "Despite significant investments in renewable capacity (particularly solar), the impact on the overall energy mix remains minimal.": {'sentiment': 'negative'},
-        "The data highlights Qatar's complex sustainability challenge in balancing food security, water conservation, and energy transition in a desert environment.": {'sentiment': 'neutral'},
-        "Qatar's per capita emissions (8x global average) and fossil-fuel dominated electricity mix (99.7%) contrast with its ambitious Vision 2030 sustainability goals.": {'sentiment': 'negative'},
-        
-        "The substantial increase in higher education attainment (especially bachelor's degrees) aligns with Qatar's Vision 2030 goal of transitioning to a knowledge-based economy.": {'sentiment': 'positive'},
-        "The decreasing learning gap suggests a focus on quality of education, not just increased enrollment numbers.": {'sentiment': 'positive'},
-        "Improvements across multiple indicators (educational attainment, expected years of schooling, survival rates) demonstrate Qatar's multifaceted approach to human development.": {'sentiment': 'positive'},
-        "The strong performance in gender parity indicates attention to educational equity, though more comprehensive equity measures would be valuable.": {'sentiment': 'positive'},
-        "The consistent improvements across indicators reflect sustained investment in Qatar's human capital, a core component of Vision 2030.": {'sentiment': 'positive'},
-        "Qatar's human development metrics generally exceed global and regional averages but remain below those of leading countries, indicating both achievement and continued room for growth.": {'sentiment': 'neutral'},
-        
-        "Qatar shows impressive achievements in basic social infrastructure (sanitation) and gender equity in education, but concerning trends in STEM education and advanced digital skills.": {'sentiment': 'neutral'},
-        "The data suggests that Qatar has successfully built social development foundations but faces challenges in developing the innovation capabilities needed for a knowledge economy.": {'sentiment': 'neutral'},
-        "The achievement of gender parity in primary education represents a significant milestone in Qatar's social development journey.": {'sentiment': 'positive'},
-        "The consistent decline in STEM and ICT graduates represents one of the most significant challenges to Qatar Vision 2030's knowledge economy objectives.": {'sentiment': 'negative'},
-        "The data reveals a potential gap between Qatar's educational system outputs and its economic diversification requirements, particularly in technical fields.": {'sentiment': 'negative'},
-        "Qatar's sanitation access (1.3x global average) is world-class, while its STEM graduate percentage (0.78x global average) indicates a critical area for improvement.": {'sentiment': 'neutral'},
-    }
\ No newline at end of file
@@ -1,64 +0,0 @@
-#key_insights.py
-#  Key Insights from the PDF with added benchmark comparisons
-gdp_insights = [
-        "Qatar maintained one of the world's highest GDP per capita levels throughout the period (over $100,000), but experienced a slight overall decline of 3.24% from 2016 to 2023.",
-        "A significant drop occurred in 2020 (down to $103,061), representing a 14.2% decrease from 2016 levels, clearly showing the pandemic's impact.",
-        "The economy rebounded strongly in 2021 to $116,832, nearly returning to pre-pandemic levels, demonstrating economic resilience.",
-        "Qatar's GDP per capita is approximately 5.4x the global average ($22,450) and significantly higher than regional neighbors (UAE: $83,900, Saudi Arabia: $54,992)."
-    ]
-    
-hci_insights = [
-        "The HCI data is only available for 2017, 2018, and 2020, which limits comprehensive trend analysis.",
-        "There was a steady improvement in HCI from 0.615 in 2017 to 0.638 in 2020, representing a 3.7% increase.",
-        "A score of 0.638 means that a child born in Qatar today will be 63.8% as productive as they could be with complete education and full health.",
-        "Qatar's HCI (0.64) is above the global average (0.56) and Middle East average, but remains below leading countries like Singapore (0.88) and Japan (0.80)."
-    ]
-    
-co2_insights = [
-        "CO₂ emissions per capita increased by 15.54% from 2016 to 2023, reaching 38.84 tonnes per person in 2023.",
-        "Emissions showed significant year-to-year variability, suggesting changing energy usage patterns.",
-        "The upward trend contradicts Qatar's environmental sustainability goals and presents a major challenge for Vision 2030's environmental pillar.",
-        "Qatar's per capita emissions (38.84 tonnes) are approximately 8x the global average (4.8 tonnes) and higher than regional peers (Kuwait: 25 tonnes, UAE: 20 tonnes, Saudi Arabia: 18 tonnes)."
-    ]
-    
-renewable_insights = [
-        "Renewable electricity production increased slightly from 0.13 TWh in 2016 to 0.15 TWh in 2023 (15.38% increase).",
-        "After increasing to 0.15 TWh in 2018, renewable electricity production has plateaued without further growth through 2023.",
-        "Given Qatar's climate, there's significant untapped potential for solar energy expansion.",
-        "Qatar targets 20% of electricity from renewables by 2030, which would exceed the current Middle East average (4%) but remain below the global average (29%) and far behind leading countries like Brazil and Norway (80-95%)."
-    ]
-    
-    # New insights for energy production chart that was missing dedicated insights
-energy_production_insights = [
-        "Qatar's energy production is dominated by natural gas, with a significant focus on LNG exports where Qatar is a global leader.",
-        "Oil production experienced a decline from 582.57 TWh in 2016 to 511.54 TWh in 2020 (-12.2%), before rebounding to 616.21 TWh in 2023.",
-        "Gas production has been more stable, reflecting Qatar's strategic emphasis on its vast North Field gas reserves.",
-        "Qatar plans to boost LNG output by 85% from current 77 million tons to 126-142 million tons by 2030, aiming to reclaim its position as the world's top LNG exporter.",
-        "This expansion will cement Qatar's position in global energy markets, targeting approximately 25% of global LNG trade by 2030."
-    ]
-    
-    # New insights for education metrics chart that was missing dedicated insights
-education_metrics_insights = [
-        "Qatar has shown steady improvement in expected years of schooling, increasing from 12.46 years in 2016 to 13.26 years in 2020 (6.4% growth).",
-        "The Learning-Adjusted Years of School metric improved from 12.31 years in 2017 to 12.83 years in 2020, indicating enhanced education quality.",
-        "The gap between expected and learning-adjusted years decreased from 0.69 to 0.43 years, showing a reduction in learning loss from 5.31% to 3.24%.",
-        "Qatar's tertiary enrollment has grown substantially, from approximately 20% in the mid-2010s to over 40% recently, approaching the global average.",
-        "Qatar's education metrics now exceed global averages (12 expected years globally vs. 13.26 in Qatar; 7.8 learning-adjusted years globally vs. 12.83 in Qatar)."
-    ]
-    
-    # New insights for STEM graduates chart that was missing dedicated insights
-stem_graduates_insights = [
-        "The percentage of graduates from STEM programs has declined dramatically from 29.70% in 2016 to 17.83% in 2022, representing a 39.96% decrease.",
-        "This consistent downward trend in STEM graduates contradicts Qatar's Vision 2030 goal of building a knowledge-based economy and innovation ecosystem.",
-        "At 17.83%, Qatar's STEM graduate percentage has fallen below the global average (23%) and significantly trails regional competitor Saudi Arabia (32%).",
-        "Leading countries in STEM education, such as Oman (43%) and Germany (37%), far outpace Qatar's current performance in this critical metric.",
-        "The decline in STEM graduates represents a major challenge for Qatar's economic diversification goals and may hinder the country's competitiveness in high-tech sectors."
-    ]
-    
-    # Overall dashboard insights from the PDF with added benchmark context
-overall_insights = [
-        "Economic Resilience: Despite fluctuations, Qatar maintains exceptionally high living standards (5.4x global average GDP per capita) while navigating energy transitions.",
-        "Environmental Challenges: Rising CO₂ emissions (8x global average) and limited renewable energy growth present the most significant challenges to Qatar Vision 2030 goals.",
-        "Human Development Progress: Education access is improving substantially, with Qatar's Human Capital Index (0.64) exceeding the global average (0.56), but quality metrics and STEM graduate percentages require attention.",
-        "Infrastructural Achievements: Near-universal sanitation (1.3x global average) and dramatic solar capacity expansion demonstrate Qatar's ability to rapidly develop infrastructure."
-    ]
\ No newline at end of file
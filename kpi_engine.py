@@ -0,0 +1,85 @@
+"""
+KPI Engine
+----------
+Latest values behind the KPI cards of every tab. For a pillar and year range
+the latest non-missing value and its year, and the first one, are found for
+all indicators at once with last-valid-index lookups on the pillar's NumPy
+block, instead of a dropna, a year filter and an .iloc per card. Results are
+cached per pillar and year range.
+
+The module functions derive the comparisons the cards show: the ratio of the
+latest value to a global average in benchmarks.py and the relative change
+over the range.
+"""
+
+
+from collections import namedtuple
+
+import numpy as np
+
+from benchmarks import benchmark_value
+from lru_cache import LRUCache
+
+# Latest and first non-missing value of an indicator in a year range, with their years
+Kpi = namedtuple('Kpi', ['value', 'year', 'first_value', 'first_year'])
+
+
+# Row of the first non-missing value of every column (0 for columns without any)
+def first_valid_rows(present):
+    return present.argmax(axis=0)
+
+
+# Row of the last non-missing value of every column (the last row for columns without any)
+def last_valid_rows(present):
+    return len(present) - 1 - present[::-1].argmax(axis=0)
+
+
+# Kpi of every column of a year-indexed block (rows are years), or None for
+# columns without data
+def latest_values(years, values):
+    if not len(years):
+        return [None] * values.shape[1]
+    present = ~np.isnan(values)
+    positions = np.arange(values.shape[1])
+    first = first_valid_rows(present)
+    last = last_valid_rows(present)
+    kpis = zip(
+        values[last, positions].tolist(), years[last].tolist(),
+        values[first, positions].tolist(), years[first].tolist(),
+    )
+    return [Kpi(*kpi) if has_data else None for kpi, has_data in zip(kpis, present.any(axis=0).tolist())]
+
+
+# Ratio of a KPI's latest value to the global average at a benchmarks.py key path
+def global_ratio(kpi, path):
+    return kpi.value / benchmark_value(path)
+
+
+# Relative change from the first to the latest value of a KPI; None when the
+# range holds a single value or starts at zero
+def range_change(kpi):
+    if kpi.year == kpi.first_year or kpi.first_value == 0:
+        return None
+    return (kpi.value - kpi.first_value) / abs(kpi.first_value)
+
+
+class KpiEngine:
+    def __init__(self, maxsize=256):
+        self.stores = {}
+        self.cache = LRUCache(maxsize=maxsize)
+
+    # Use freshly loaded pillar stores and drop every KPI computed from the old ones
+    def set_stores(self, stores):
+        self.stores = stores
+        self.cache.invalidate()
+
+    def stats(self):
+        return self.cache.stats()
+
+    # Kpi (or None) of every indicator of a pillar over a year range, keyed by indicator ID
+    def pillar_kpis(self, pillar, min_year, max_year):
+        store = self.stores[pillar]
+        rows = store.span(min_year, max_year)
+        return self.cache.get_or_compute(
+            (pillar, rows.start, rows.stop),
+            lambda: dict(zip(store.ids, latest_values(store.years[rows], store.values[rows]))))
@@ -0,0 +1,489 @@
+"""
+Load Test
+---------
+Replays simulated user sessions against the Dash callback endpoint
+(/_dash-update-component) of a locally started Gunicorn server and reports
+throughput, latency percentiles and error rates per callback and per user
+action.
+
+Each session behaves like a browser tab running the Dash renderer: it loads
+/_dash-layout and /_dash-dependencies, fires the initial callbacks, and then
+repeats random actions (tab switches, year slider drags and language toggles
+in the proportions given by --mix). After every action it follows the callback
+chain the way the renderer does: callbacks whose inputs changed, and callbacks
+whose inputs or outputs appear in newly returned layout, are fired together in
+one round, concurrently, until nothing is left to fire. Pattern-matching
+callbacks are fired once per matching component. Clientside callbacks are
+skipped; a language toggle sets the language store as the browser does. Requests accept gzip like a
+browser does, and the reported sizes are the bytes transferred.
+
+Every user event (a page load, a tab click, one step of a slider drag, a
+language click) is expected to render the tab content once. The report counts
+the tab renders each event set off, and --max-renders makes the run fail when
+an event renders the tab more often, e.g. when a callback recreates the tabs or
+the year slider and so fires the tab callback a second time.
+
+Usage:
+    python load_test.py [--workers 2] [--threads 4] [--concurrency 8]
+                        [--duration 60] [--mix tab=45,slider=45,language=10]
+                        [--env CHART_CALLBACKS=1] [--url http://host:port]
+                        [--max-renders 1] [--output results.json]
+"""
+
+
+import argparse
+import gzip
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+UPDATE_PATH = '/_dash-update-component'
+
+# Requests a browser sends to one host at the same time
+BROWSER_CONNECTIONS = 6
+
+# Default share of each user action, in percent
+DEFAULT_MIX = 'tab=45,slider=45,language=10'
+
+TABS = ["key-indicators", "economic", "environmental", "human", "social"]
+
+# Output of the callback that renders the tab content
+TAB_CONTENT = ('tab-content', 'children')
+
+
+# Key of a component id as the Dash renderer writes it: plain string ids as-is,
+# dict ids as JSON with sorted keys
+def id_key(component_id):
+    if isinstance(component_id, dict):
+        return json.dumps(component_id, sort_keys=True, separators=(',', ':'))
+    return component_id
+
+
+# Component id as given in /_dash-dependencies, where dict ids are JSON text
+def parse_id(component_id):
+    if isinstance(component_id, str) and component_id.startswith('{'):
+        return json.loads(component_id)
+    return component_id
+
+
+# Split a callback output string ("id.prop" or "..id.prop...id.prop..") into
+# (id, prop) pairs; pattern-matching ids are decoded back to dicts
+def parse_outputs(output):
+    multi = output.startswith('..')
+    parts = output[2:-2].split('...') if multi else [output]
+    outputs = []
+    for part in parts:
+        component_id, prop = part.rsplit('.', 1)
+        outputs.append((parse_id(component_id), prop))
+    return multi, outputs
+
+
+def is_pattern(component_id):
+    return isinstance(component_id, dict) and any(isinstance(value, list) for value in component_id.values())
+
+
+# Whether a concrete dict id matches a pattern id (wildcards match any value)
+def matches(pattern, component_id):
+    if not isinstance(component_id, dict) or set(pattern) != set(component_id):
+        return False
+    return all(isinstance(value, list) or component_id[key] == value for key, value in pattern.items())
+
+
+class Callback:
+    def __init__(self, dependency):
+        self.output = dependency['output']
+        self.multi, self.outputs = parse_outputs(self.output)
+        self.inputs = [(parse_id(item['id']), item['property']) for item in dependency['inputs']]
+        self.state = [(parse_id(item['id']), item['property']) for item in dependency['state']]
+        self.prevent_initial_call = dependency.get('prevent_initial_call')
+        self.pattern = next((component_id for component_id, _ in self.outputs if is_pattern(component_id)), None)
+        self.renders_tab = TAB_CONTENT in self.outputs
+        self.name = ','.join(
+            f"{component_id['type']}[MATCH].{prop}" if is_pattern(component_id) else f"{component_id}.{prop}"
+            for component_id, prop in self.outputs
+        )
+
+    # Concrete id of a dependency for the matched component
+    def resolve(self, component_id, match):
+        return match if is_pattern(component_id) else component_id
+
+
+class Session:
+    def __init__(self, url, callbacks, layout, stats, rng, pool):
+        self.url = url
+        self.callbacks = callbacks
+        self.stats = stats
+        self.rng = rng
+        self.pool = pool
+        self.props = {}
+        self.owned = defaultdict(set)
+        # Tab renders set off by each user event since the list was last cleared
+        self.event_renders = []
+        self.register(layout, owner=None)
+
+    # Record the props of every component with an id in a layout chunk; returns their id keys
+    def register(self, node, owner):
+        found = set()
+        if isinstance(node, list):
+            for child in node:
+                found |= self.register(child, owner)
+        elif isinstance(node, dict) and 'props' in node:
+            props = node['props']
+            if 'id' in props:
+                key = id_key(props['id'])
+                found.add(key)
+                for prop, value in props.items():
+                    if prop != 'children':
+                        self.props[(key, prop)] = value
+                if owner is not None:
+                    self.owned[owner].add(key)
+            found |= self.register(props.get('children'), owner)
+        return found
+
+    # Forget the components of a chunk that is being replaced
+    def unregister(self, owner):
+        for key in self.owned.pop(owner, ()):
+            for prop_key in [prop_key for prop_key in self.props if prop_key[0] == key]:
+                del self.props[prop_key]
+            self.unregister((key, 'children'))
+
+    # Concrete components a pattern id matches on the page
+    def matching(self, pattern):
+        return [value for (key, prop), value in self.props.items() if prop == 'id' and matches(pattern, value)]
+
+    # Callbacks fired by changed props and by components newly added to the page,
+    # as (callback, match, trigger, predecessors). Like the Dash renderer, a
+    # callback already in the chain that led to the change is not fired again.
+    def triggered(self, changed, added=frozenset(), predecessors=()):
+        present = self.present_keys()
+        fired = []
+        for callback in self.callbacks:
+            if callback.output in predecessors:
+                continue
+            for match in (self.matching(callback.pattern) if callback.pattern else [None]):
+                inputs = [(id_key(callback.resolve(component_id, match)), prop) for component_id, prop in callback.inputs]
+                outputs = {id_key(callback.resolve(component_id, match)) for component_id, _ in callback.outputs}
+                if not {key for key, _ in inputs} | outputs <= present:
+                    continue
+                # Inputs that were changed or added count as changed props; a
+                # callback with only its outputs added makes an initial call.
+                # With prevent_initial_call only changed props fire it.
+                trigger = [key for key in inputs if key in changed
+                           or (key[0] in added and not callback.prevent_initial_call)]
+                if trigger or (outputs & added and not callback.prevent_initial_call):
+                    fired.append((callback, match, trigger, tuple(predecessors) + (callback.output,)))
+        return fired
+
+    def present_keys(self):
+        return {key for key, prop in self.props if prop == 'id'}
+
+    def request_body(self, callback, match, trigger):
+        def entry(component_id, prop):
+            resolved = callback.resolve(component_id, match)
+            return {'id': resolved, 'property': prop, 'value': self.props.get((id_key(resolved), prop))}
+
+        outputs = [{'id': callback.resolve(component_id, match), 'property': prop}
+                   for component_id, prop in callback.outputs]
+        return {
+            'output': callback.output,
+            'outputs': outputs if callback.multi else outputs[0],
+            'inputs': [entry(component_id, prop) for component_id, prop in callback.inputs],
+            'state': [entry(component_id, prop) for component_id, prop in callback.state],
+            'changedPropIds': [f"{key}.{prop}" for key, prop in trigger],
+        }
+
+    def post(self, callback, match, trigger):
+        body = json.dumps(self.request_body(callback, match, trigger)).encode()
+        request = urllib.request.Request(self.url + UPDATE_PATH, data=body,
+                                         headers={'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                payload = response.read()
+                status = response.status
+                encoding = response.headers.get('Content-Encoding')
+        except urllib.error.HTTPError as error:
+            payload, status, encoding = error.read(), error.code, None
+        except (urllib.error.URLError, OSError):
+            payload, status, encoding = b'', 0, None
+        self.stats.record(callback.name, time.perf_counter() - started, len(payload), status)
+        if encoding == 'gzip':
+            payload = gzip.decompress(payload)
+        # 204 means every output was no_update
+        if status != 200:
+            return {}
+        return json.loads(payload).get('response', {})
+
+    # Fire rounds of callbacks until the chain settles, like the Dash renderer
+    def settle(self, changed, added=frozenset()):
+        pending = self.triggered(changed, added)
+        renders = 0
+        while pending:
+            # A callback triggered several times in a round is sent once
+            unique = {}
+            for callback, match, trigger, predecessors in pending:
+                key = (callback.output, id_key(match) if match else None)
+                if key in unique:
+                    unique[key][2].extend(item for item in trigger if item not in unique[key][2])
+                else:
+                    unique[key] = (callback, match, list(trigger), predecessors)
+            round_callbacks = list(unique.values())
+            renders += sum(callback.renders_tab for callback, *_ in round_callbacks)
+            responses = self.pool.map(lambda item: self.post(*item[:3]), round_callbacks)
+
+            pending = []
+            for (_, _, _, predecessors), response in zip(round_callbacks, responses):
+                changed, added = set(), set()
+                for key, props in response.items():
+                    for prop, value in props.items():
+                        changed.add((key, prop))
+                        if isinstance(value, dict) and '__dash_patch_update' in value:
+                            continue
+                        if prop == 'children':
+                            self.unregister((key, prop))
+                            added |= self.register(value, owner=(key, prop))
+                        else:
+                            self.props[(key, prop)] = value
+                pending.extend(self.triggered(changed, added, predecessors))
+        self.event_renders.append(renders)
+
+    def set_prop(self, component_id, prop, value):
+        self.props[(component_id, prop)] = value
+        self.settle({(component_id, prop)})
+
+    def switch_tab(self):
+        current = self.props.get(('tabs', 'active_tab'))
+        self.set_prop('tabs', 'active_tab', self.rng.choice([tab for tab in TABS if tab != current]))
+
+    # Drag one handle of the year slider over a few steps, one request round per step
+    def drag_slider(self):
+        slider = ('year-slider', 'value')
+        low, high = self.props[slider]
+        years = range(self.props[('year-slider', 'min')], self.props[('year-slider', 'max')] + 1)
+        for _ in range(self.rng.randint(2, 5)):
+            if self.rng.random() < 0.5:
+                low = min(max(years[0], low + self.rng.choice((-1, 1))), high)
+            else:
+                high = max(min(years[-1], high + self.rng.choice((-1, 1))), low)
+            self.set_prop('year-slider', 'value', [low, high])
+
+    # The language buttons set the language store in the browser (a clientside callback)
+    def toggle_language(self):
+        language = 'arabic' if self.props.get(('language-store', 'data')) != 'arabic' else 'english'
+        self.set_prop('language-store', 'data', language)
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = defaultdict(lambda: {'seconds': [], 'bytes': 0, 'errors': 0})
+        self.actions = defaultdict(list)
+        self.renders = defaultdict(list)
+
+    def record(self, name, seconds, size, status):
+        with self.lock:
+            entry = self.requests[name]
+            entry['seconds'].append(seconds)
+            entry['bytes'] += size
+            if status not in (200, 204):
+                entry['errors'] += 1
+
+    # Duration of a user action and the tab renders of each event it was made of
+    def record_action(self, name, seconds, renders):
+        with self.lock:
+            self.actions[name].append(seconds)
+            self.renders[name].extend(renders)
+
+
+def latency(seconds):
+    milliseconds = np.array(seconds) * 1000
+    return {
+        'p50_ms': float(np.percentile(milliseconds, 50)),
+        'p95_ms': float(np.percentile(milliseconds, 95)),
+        'p99_ms': float(np.percentile(milliseconds, 99)),
+        'max_ms': float(milliseconds.max()),
+    }
+
+
+def get_json(url):
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def run_user(url, callbacks, mix, stats, deadline, seed, think):
+    rng = random.Random(seed)
+    with ThreadPoolExecutor(max_workers=BROWSER_CONNECTIONS) as pool:
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            session = Session(url, callbacks, get_json(url + '/_dash-layout'), stats, rng, pool)
+            session.settle(set(), added=session.present_keys())
+            stats.record_action('page load', time.perf_counter() - started, session.event_renders)
+
+            actions = {'tab': session.switch_tab, 'slider': session.drag_slider, 'language': session.toggle_language}
+            # A session lasts for a handful of actions before the user reloads
+            for _ in range(rng.randint(5, 20)):
+                if time.monotonic() >= deadline:
+                    break
+                action = rng.choices(list(mix), weights=list(mix.values()))[0]
+                session.event_renders = []
+                started = time.perf_counter()
+                actions[action]()
+                stats.record_action(action, time.perf_counter() - started, session.event_renders)
+                if think:
+                    time.sleep(rng.uniform(0, think))
+
+
+# Cache hit rates reported by the worker that answers the /metrics request
+def cache_hit_rates(url):
+    try:
+        with urllib.request.urlopen(url + '/metrics', timeout=10) as response:
+            text = response.read().decode()
+    except (urllib.error.URLError, OSError):
+        return {}
+    rates = {}
+    for line in text.splitlines():
+        if line.startswith('qv2030_cache_hit_rate{'):
+            labels, value = line.rsplit(' ', 1)
+            rates[labels.split('"')[1]] = float(value)
+    return rates
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+# Start Gunicorn on a free local port and wait until it serves the layout
+def start_server(workers, threads, env, startup_timeout):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:server', '-b', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads), '--log-level', 'warning'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=dict(os.environ, **env)
+    )
+    url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"gunicorn exited with status {server.returncode}")
+        try:
+            get_json(url + '/_dash-layout')
+            return server, url
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.5)
+    server.terminate()
+    raise SystemExit(f"gunicorn did not start within {startup_timeout}s")
+
+
+def parse_pairs(text, convert=str):
+    pairs = {}
+    for item in filter(None, text.split(',')):
+        name, value = item.split('=', 1)
+        pairs[name.strip()] = convert(value)
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=4, help='gunicorn threads per worker')
+    parser.add_argument('--concurrency', type=int, default=8, help='simulated users')
+    parser.add_argument('--duration', type=float, default=60, help='seconds to run the sessions')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='percent of tab, slider and language actions')
+    parser.add_argument('--think', type=float, default=0, help='maximum pause between actions, in seconds')
+    parser.add_argument('--env', action='append', default=[], help='KEY=VALUE set for the server')
+    parser.add_argument('--url', help='test an already running server instead of starting gunicorn')
+    parser.add_argument('--startup-timeout', type=float, default=300, help='seconds to wait for gunicorn')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the simulated users')
+    parser.add_argument('--max-renders', type=int,
+                        help='exit with status 1 when a user event renders the tab more often than this')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    mix = parse_pairs(args.mix, float)
+    unknown = set(mix) - {'tab', 'slider', 'language'}
+    if unknown:
+        parser.error(f"unknown actions in --mix: {', '.join(sorted(unknown))}")
+
+    server = None
+    url = args.url.rstrip('/') if args.url else None
+    if url is None:
+        server, url = start_server(args.workers, args.threads, parse_pairs(','.join(args.env)), args.startup_timeout)
+
+    try:
+        callbacks = [Callback(dependency) for dependency in get_json(url + '/_dash-dependencies')
+                     if not dependency.get('clientside_function')]
+        stats = Stats()
+        deadline = time.monotonic() + args.duration
+        started = time.perf_counter()
+        users = [threading.Thread(target=run_user, args=(url, callbacks, mix, stats, deadline, args.seed + index, args.think))
+                 for index in range(args.concurrency)]
+        for user in users:
+            user.start()
+        for user in users:
+            user.join()
+        elapsed = time.perf_counter() - started
+        hit_rates = cache_hit_rates(url)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    results = {'callbacks': {}, 'actions': {}}
+    print(f"{args.concurrency} users for {elapsed:.1f}s against {'gunicorn' if server else url}"
+          + (f" ({args.workers} workers x {args.threads} threads)" if server else ''))
+    print(f"{'callback':<58}{'requests':>9}{'req/s':>8}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'KB/req':>8}")
+    for name, entry in sorted(stats.requests.items()):
+        count = len(entry['seconds'])
+        result = dict(latency(entry['seconds']), requests=count, throughput=count / elapsed,
+                      error_rate=entry['errors'] / count, bytes_per_request=entry['bytes'] / count)
+        results['callbacks'][name] = result
+        print(f"{name[:57]:<58}{count:>9}{result['throughput']:>8.1f}{result['error_rate']:>8.1%}"
+              f"{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}{result['max_ms']:>9.1f}"
+              f"{result['bytes_per_request'] / 1024:>8.1f}")
+
+    print(f"\n{'action':<14}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+          f"{'renders/event':>15}{'max':>5}")
+    for name, seconds in sorted(stats.actions.items()):
+        renders = stats.renders[name] or [0]
+        result = dict(latency(seconds), count=len(seconds),
+                      renders_per_event=sum(renders) / len(renders), max_renders=max(renders))
+        results['actions'][name] = result
+        print(f"{name:<14}{len(seconds):>7}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+              f"{result['p99_ms']:>9.1f}{result['max_ms']:>9.1f}"
+              f"{result['renders_per_event']:>15.2f}{result['max_renders']:>5}")
+
+    total = sum(len(entry['seconds']) for entry in stats.requests.values())
+    errors = sum(entry['errors'] for entry in stats.requests.values())
+    print(f"\n{total} requests, {total / elapsed:.1f} req/s, {errors} errors")
+    if hit_rates:
+        print("cache hit rate (one worker): " + ', '.join(f"{cache} {rate:.1%}" for cache, rate in sorted(hit_rates.items())))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(dict(results, elapsed=elapsed, concurrency=args.concurrency, mix=mix,
+                           workers=args.workers if server else None, threads=args.threads if server else None,
+                           env=args.env, requests=total, errors=errors, cache_hit_rates=hit_rates), output_file, indent=2)
+
+    if args.max_renders is not None:
+        over = sorted(name for name, result in results['actions'].items() if result['max_renders'] > args.max_renders)
+        if over:
+            print(f"\nMore than {args.max_renders} tab render(s) per event: {', '.join(over)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
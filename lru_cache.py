@@ -0,0 +1,89 @@
+"""
+LRU Cache
+---------
+Bounded, thread-safe least-recently-used cache for values computed in memory:
+chart figures, insight statistics and statements, KPI results and compressed
+static files. It counts hits and misses and keeps the size in bytes its
+callers report for each entry, all reported through stats() and /metrics.
+
+The tab render cache (render_cache.RenderCache) builds on it with watching
+of the data files and the shared payload store.
+"""
+
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+
+    # Value held for key, counted as a hit; None (not counted) when it is not held
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        return None
+
+    def get(self, key):
+        value = self._lookup(key)
+        if value is None:
+            with self._lock:
+                self.misses += 1
+        return value
+
+    # Value held for key, or None; not counted as a lookup and not marked as used
+    def peek(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, value, nbytes=0):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = nbytes
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._sizes.pop(evicted, None)
+
+    # Return the value held for key, or compute, store and return it; size(value)
+    # gives the size in bytes to keep for it
+    def get_or_compute(self, key, compute, size=None):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value, size(value) if size is not None else 0)
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'bytes': sum(self._sizes.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Whether key is held; not counted as a lookup
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
@@ -0,0 +1,190 @@
+"""
+Metrics
+-------
+In-process instrumentation of the dashboard server, exposed in the Prometheus
+text format at /metrics:
+
+- wall time and serialized response size of every Dash callback request,
+  labelled with the name of the callback function
+- build time of every tab rendered by a render_* function and of every chart
+  built by the chart engine
+- hits, misses, hit rate and size of the render and chart caches, read from
+  their stats() when /metrics is scraped
+
+Optionally every callback request is also logged as one JSON line. Each
+gunicorn worker keeps its own counters, so a scrape reports the worker that
+served it (labelled with its pid).
+"""
+
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import flask
+
+logger = logging.getLogger(__name__)
+
+# Bucket bounds of the latency histograms, in seconds
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bucket bounds of the response size histogram, in bytes
+SIZE_BUCKETS = (1000, 5000, 10000, 25000, 50000, 100000, 250000, 500000, 1000000)
+
+
+# Label set in the Prometheus text format, e.g. {callback="render_tab_content"}
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = ['{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+             for name, value in zip(names, values)]
+    return '{' + ','.join(pairs) + '}'
+
+
+class Histogram:
+    def __init__(self, name, help_text, label_names=(), buckets=TIME_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = {'counts': [0] * len(self.buckets), 'count': 0, 'sum': 0.0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][index] += 1
+            series['count'] += 1
+            series['sum'] += value
+
+    # Time the enclosed block and record it under the given labels
+    @contextmanager
+    def time(self, *labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def lines(self):
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = sorted((labels, dict(values, counts=list(values['counts'])))
+                            for labels, values in self._series.items())
+        for labels, values in series:
+            for bound, count in zip(self.buckets, values['counts']):
+                bucket_labels = _format_labels(self.label_names + ('le',), labels + (bound,))
+                yield f"{self.name}_bucket{bucket_labels} {count}"
+            bucket_labels = _format_labels(self.label_names + ('le',), labels + ('+Inf',))
+            yield f"{self.name}_bucket{bucket_labels} {values['count']}"
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {values['sum']}"
+            yield f"{self.name}_count{label_text} {values['count']}"
+
+
+class Metrics:
+    def __init__(self, namespace='qv2030', log_requests=False):
+        self.namespace = namespace
+        self.log_requests = log_requests
+        self.callback_seconds = Histogram(
+            f"{namespace}_callback_seconds", "Wall time of Dash callback requests.", ('callback',))
+        self.callback_bytes = Histogram(
+            f"{namespace}_callback_response_bytes", "Serialized size of Dash callback responses.",
+            ('callback',), SIZE_BUCKETS)
+        self.tab_render_seconds = Histogram(
+            f"{namespace}_tab_render_seconds", "Time to render and serialize a tab.", ('tab',))
+        self.chart_build_seconds = Histogram(
+            f"{namespace}_chart_build_seconds", "Time to build and serialize a single chart.", ('chart',))
+        self.histograms = [self.callback_seconds, self.callback_bytes,
+                           self.tab_render_seconds, self.chart_build_seconds]
+        self.caches = {}
+        self.callback_names = {}
+
+    # Report the stats() of a cache (LRUCache, RenderCache or an engine) on every scrape
+    def add_cache(self, name, stats):
+        self.caches[name] = stats
+
+    # Record one chart build; passed to the chart engine as its on_build hook
+    def observe_chart(self, chart_id, seconds):
+        self.chart_build_seconds.observe(seconds, chart_id)
+
+    def cache_lines(self):
+        cache_stats = {name: stats() for name, stats in self.caches.items()}
+        metrics = [
+            ('hits', 'counter', "Lookups answered from the in-memory cache.", 'hits'),
+            ('shared_hits', 'counter', "Lookups answered from the shared payload store.", 'shared_hits'),
+            ('misses', 'counter', "Lookups that had to render.", 'misses'),
+            ('hit_rate', 'gauge', "Share of lookups that did not render.", 'hit_rate'),
+            ('entries', 'gauge', "Entries held in memory.", 'size'),
+            ('bytes', 'gauge', "Serialized size of the entries held in memory.", 'bytes'),
+        ]
+        for suffix, kind, help_text, field in metrics:
+            name = f"{self.namespace}_cache_{suffix}" + ('_total' if kind == 'counter' else '')
+            yield f"# HELP {name} {help_text}"
+            yield f"# TYPE {name} {kind}"
+            for cache, stats in sorted(cache_stats.items()):
+                if field in stats:
+                    yield f"{name}{_format_labels(('cache',), (cache,))} {stats[field]}"
+
+    # Every metric in the Prometheus text exposition format
+    def render(self):
+        lines = [
+            f"# HELP {self.namespace}_worker_info Process serving this scrape.",
+            f"# TYPE {self.namespace}_worker_info gauge",
+            f"{self.namespace}_worker_info{_format_labels(('pid',), (os.getpid(),))} 1",
+        ]
+        for histogram in self.histograms:
+            lines.extend(histogram.lines())
+        lines.extend(self.cache_lines())
+        return '\n'.join(lines) + '\n'
+
+    # Name of the callback function behind a Dash request's output string
+    def callback_name(self, app, output):
+        if output not in self.callback_names:
+            callback = app.callback_map.get(output, {}).get('callback')
+            self.callback_names[output] = getattr(callback, '__name__', output)
+        return self.callback_names[output]
+
+    # Time every callback request of a Dash app and serve /metrics on its server
+    def instrument(self, app):
+        server = app.server
+        update_path = app.config.requests_pathname_prefix + '_dash-update-component'
+
+        @server.before_request
+        def start_timer():
+            if flask.request.path == update_path:
+                flask.g.metrics_start = time.perf_counter()
+
+        @server.after_request
+        def record_callback(response):
+            start = flask.g.pop('metrics_start', None)
+            if start is None:
+                return response
+            seconds = time.perf_counter() - start
+            body = flask.request.get_json(silent=True) or {}
+            callback = self.callback_name(app, body.get('output', ''))
+            size = response.calculate_content_length() or 0
+            self.callback_seconds.observe(seconds, callback)
+            self.callback_bytes.observe(size, callback)
+            if self.log_requests:
+                logger.info(json.dumps({
+                    'event': 'callback',
+                    'callback': callback,
+                    'triggered': body.get('changedPropIds', []),
+                    'status': response.status_code,
+                    'seconds': round(seconds, 6),
+                    'bytes': size,
+                }))
+            return response
+
+        @server.route('/metrics')
+        def metrics_endpoint():
+            return flask.Response(self.render(), mimetype='text/plain; version=0.0.4')
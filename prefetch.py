@@ -0,0 +1,172 @@
+"""
+Prefetch
+--------
+Background rendering of the views a user is likely to ask for next. After a
+tab is served, the tabs next to it in the tab bar are rendered for the same
+year range and language on a small thread pool, so that most tab switches
+find their content already in the render cache.
+
+- The pool is bounded (PREFETCH_WORKERS threads per worker process) and is
+  created on first use in each process: with preload_app the app is imported
+  in the gunicorn master, and threads do not survive the fork into workers.
+- Views waiting to be prefetched form a short queue served newest first. When
+  it overflows, the oldest are dropped, so a slider drag does not leave a
+  backlog of renders for year ranges the user has already moved past.
+- Prefetch renders only run while the process serves no request, so they use
+  idle time instead of competing with requests for the interpreter. A render
+  is paused between its steps (the render function calls wait_until_idle)
+  while requests are served, unless one of them waits for it.
+- A view is only rendered when it is neither cached nor already queued. A
+  request for a view that is being prefetched waits for that render instead
+  of rendering it a second time.
+
+The hit rate (tab switches served from a prefetched render, against tab
+switches rendered while the user waited) is reported through stats().
+"""
+
+
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    def __init__(self, cache, render, neighbours, max_workers=1, max_queued=4, wait_timeout=30):
+        self.cache = cache
+        self.render = render
+        self.neighbours = neighbours
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.wait_timeout = wait_timeout
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        # Notified when the last request being served finishes
+        self._idle = threading.Condition(self._lock)
+        self._serving = 0
+        # Keys that requests are waiting for
+        self._wanted = Counter()
+        self._executor = None
+        self._pid = None
+        self._queued = OrderedDict()
+        # Keys being rendered, with an event set when they are done
+        self._running = {}
+        self._draining = 0
+        # Keys rendered ahead of a request and not requested yet, oldest first
+        self._prefetched = OrderedDict()
+
+    # Thread pool of this process, created after any fork
+    def _pool(self):
+        if self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='prefetch')
+            self._pid = os.getpid()
+            self._queued.clear()
+            self._running.clear()
+            self._draining = 0
+        return self._executor
+
+    # Wrap the cache lookup of a request for key. A tab switch (counted=True) is
+    # counted as a prefetch hit or miss; afterwards the neighbours of key are queued.
+    @contextmanager
+    def serving(self, key, counted=False):
+        with self._lock:
+            self._serving += 1
+        try:
+            if counted:
+                self.record(key)
+            yield
+        finally:
+            with self._lock:
+                self._serving -= 1
+                if not self._serving:
+                    self._idle.notify_all()
+            self.schedule(key)
+
+    # Count a request for key as a prefetch hit, or as a miss when it has to be
+    # rendered while the user waits; call it before looking the key up. A key
+    # that is being prefetched is waited for.
+    def record(self, key):
+        with self._lock:
+            running = self._running.get(key)
+            if running is not None:
+                self._wanted[key] += 1
+                self._idle.notify_all()
+        if running is not None:
+            running.wait(self.wait_timeout)
+            with self._lock:
+                self._wanted -= Counter([key])
+        with self._lock:
+            if self._prefetched.pop(key, None) is not None and key in self.cache:
+                self.hits += 1
+            elif key not in self.cache:
+                self.misses += 1
+
+    # Block the prefetch render of key while requests are being served, unless
+    # one of them waits for key; render functions call it between their steps
+    def wait_until_idle(self, key):
+        with self._lock:
+            while self._serving and not self._wanted[key]:
+                self._idle.wait()
+
+    # Queue the neighbours of a view that was just served
+    def schedule(self, key):
+        with self._lock:
+            pool = self._pool()
+            for neighbour in self.neighbours(key):
+                if neighbour in self._running or neighbour in self.cache:
+                    continue
+                self._queued[neighbour] = True
+                self._queued.move_to_end(neighbour)
+            while len(self._queued) > self.max_queued:
+                self._queued.popitem(last=False)
+                self.dropped += 1
+            while self._draining < min(self.max_workers, len(self._queued)):
+                self._draining += 1
+                pool.submit(self._drain)
+
+    # Render queued keys, newest first, whenever no request is being served,
+    # until the queue is empty
+    def _drain(self):
+        while True:
+            with self._lock:
+                while self._serving:
+                    self._idle.wait()
+                if not self._queued:
+                    self._draining -= 1
+                    return
+                key, _ = self._queued.popitem(last=True)
+                if key in self.cache:
+                    continue
+                self._running[key] = threading.Event()
+            try:
+                self.cache.fill(key, lambda: self.render(key))
+                with self._lock:
+                    self.renders += 1
+                    self._prefetched[key] = True
+                    while len(self._prefetched) > self.cache.maxsize:
+                        self._prefetched.popitem(last=False)
+            except Exception:
+                logger.exception("Prefetching %s failed", key)
+            finally:
+                with self._lock:
+                    self._running.pop(key).set()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._prefetched),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'renders': self.renders,
+                'dropped': self.dropped,
+                'queued': len(self._queued),
+            }
@@ -0,0 +1,300 @@
+"""
+Render Cache
+------------
+Bounded LRU cache for rendered tab content (an lru_cache.LRUCache). Entries are
+keyed on the inputs of the tab callback (tab, min_year, max_year, language) so a
+repeated view costs a dictionary lookup instead of rebuilding every card and
+Plotly figure.
+
+Renderers hand the cache the serialized JSON of a component tree. The cache
+keeps what its decode function makes of it: by default the decoded structure,
+which Dash encodes far faster than live component and figure objects, or an
+EncodedJSON (encoded_json.py) that keeps the bytes to be sent as they are. It
+records the serialized size of every entry.
+
+The cache watches the source CSV files and drops every entry as soon as one of
+them changes on disk.
+
+An optional SharedPayloadStore (a SQLite file under a configurable directory)
+sits behind the in-memory LRU so that every gunicorn worker on a host reuses
+payloads rendered by any other worker instead of building its own copy.
+"""
+
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from lru_cache import LRUCache
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; warm-up then runs unserialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# Resident set size of the current process in bytes
+def current_rss():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# Flatten a cache key tuple into the text key used by the shared store
+def _key_text(key):
+    return '|'.join(str(part) for part in key)
+
+
+@contextmanager
+def _no_lock():
+    yield
+
+
+class SharedPayloadStore:
+    def __init__(self, directory, filename='render_cache.sqlite3'):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, filename)
+        self.lock_path = self.path + '.lock'
+        self.generation = ''
+        self._local = threading.local()
+        self._execute("CREATE TABLE IF NOT EXISTS payloads ("
+                      "key TEXT PRIMARY KEY, generation TEXT NOT NULL, payload BLOB NOT NULL)")
+
+    # One connection per thread and process; sqlite connections must not cross a fork
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _execute(self, sql, params=()):
+        return self._connection().execute(sql, params)
+
+    # Switch to a new data generation and drop payloads rendered from older data
+    def set_generation(self, generation):
+        self.generation = generation
+        self._execute("DELETE FROM payloads WHERE generation != ?", (generation,))
+
+    def get(self, key):
+        row = self._execute("SELECT payload FROM payloads WHERE key = ? AND generation = ?",
+                            (_key_text(key), self.generation)).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0])
+
+    # Payloads are JSON text or its UTF-8 bytes; get() returns the bytes
+    def put(self, key, payload):
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        self._execute("INSERT OR REPLACE INTO payloads (key, generation, payload) VALUES (?, ?, ?)",
+                      (_key_text(key), self.generation, zlib.compress(payload, 6)))
+
+    def keys(self):
+        rows = self._execute("SELECT key FROM payloads WHERE generation = ?", (self.generation,))
+        return {row[0] for row in rows}
+
+    def clear(self):
+        self._execute("DELETE FROM payloads")
+
+    def stats(self):
+        count, stored = self._execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM payloads WHERE generation = ?",
+            (self.generation,)).fetchone()
+        return {'entries': count, 'stored_bytes': stored}
+
+    # Exclusive lock so that only one process on the host warms the store at a time
+    @contextmanager
+    def warm_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class RenderCache(LRUCache):
+    def __init__(self, maxsize=128, watch_paths=(), on_change=None, check_interval=1.0, store=None, decode=json.loads):
+        super().__init__(maxsize)
+        self.store = store
+        self.decode = decode
+        self.shared_hits = 0
+        self._watch_paths = list(watch_paths)
+        self._on_change = on_change
+        self._check_interval = check_interval
+        self._last_check = time.monotonic()
+        self._signature = self._data_signature()
+        if self.store is not None:
+            self.store.set_generation(self._generation())
+
+    # Modification time and size of every watched file, used to detect CSV edits
+    def _data_signature(self):
+        signature = []
+        for path in self._watch_paths:
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    # Short digest of the data signature, tagging payloads in the shared store
+    def _generation(self):
+        return hashlib.sha1(repr(self._signature).encode('utf-8')).hexdigest()[:16]
+
+    # Drop all entries (and reload the data) when a watched file has changed
+    def check_data(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_check < self._check_interval:
+            return False
+        self._last_check = now
+
+        signature = self._data_signature()
+        if signature == self._signature:
+            return False
+
+        with self._lock:
+            self._signature = signature
+            if self._on_change is not None:
+                self._on_change()
+            # Drop the entries in memory; the store moves to the new generation
+            LRUCache.invalidate(self)
+            if self.store is not None:
+                self.store.set_generation(self._generation())
+        return True
+
+    def get(self, key):
+        self.check_data()
+        value = self._lookup(key)
+        if value is not None:
+            return value
+
+        # Fall back to payloads rendered by other worker processes
+        if self.store is not None:
+            payload = self.store.get(key)
+            if payload is not None:
+                with self._lock:
+                    self.shared_hits += 1
+                return self.put_serialized(key, payload)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    # Store a serialized payload under key and return its decoded form
+    def put_serialized(self, key, payload):
+        value = self.decode(payload)
+        self.put(key, value, len(payload))
+        return value
+
+    # Put key into the cache ahead of a request, from the shared store or by
+    # calling render() for its JSON text, without counting a lookup
+    def fill(self, key, render):
+        payload = self.store.get(key) if self.store is not None else None
+        if payload is None:
+            payload = render()
+            if self.store is not None:
+                self.store.put(key, payload)
+        self.put_serialized(key, payload)
+
+    # Return the cached value for key; on a miss render() must return the JSON
+    # text or its UTF-8 bytes
+    def get_or_render(self, key, render):
+        value = self.get(key)
+        if value is None:
+            payload = render()
+            if self.store is not None:
+                self.store.put(key, payload)
+            value = self.put_serialized(key, payload)
+        return value
+
+    # Render every key up front, in parallel worker processes, and report the cost.
+    # With a shared store the payloads are written there only, and each worker
+    # decodes into memory just the entries it actually serves.
+    def warm(self, keys, render, workers=None):
+        workers = workers or os.cpu_count() or 1
+        started = time.perf_counter()
+        rss_before = current_rss()
+        sizes = []
+
+        with self.store.warm_lock() if self.store is not None else _no_lock():
+            if self.store is not None:
+                stored = self.store.keys()
+                keys = [key for key in keys if _key_text(key) not in stored]
+            else:
+                keys = [key for key in keys if key not in self._entries]
+                self.maxsize = max(self.maxsize, len(self._entries) + len(keys))
+
+            for key, payload in self._render_all(keys, render, workers):
+                if self.store is not None:
+                    self.store.put(key, payload)
+                else:
+                    self.put_serialized(key, payload)
+                sizes.append(len(payload))
+
+        report = {
+            'entries': len(sizes),
+            'workers': workers,
+            'seconds': time.perf_counter() - started,
+            'total_bytes': sum(sizes),
+            'mean_entry_bytes': sum(sizes) / len(sizes) if sizes else 0,
+            'max_entry_bytes': max(sizes) if sizes else 0,
+            'rss_before': rss_before,
+            'rss_after': current_rss(),
+        }
+        if self.store is not None:
+            report['stored_bytes'] = self.store.stats()['stored_bytes']
+        logger.info(
+            "Warmed %d entries with %d workers in %.1fs: %.1f MB serialized "
+            "(mean %.1f KB, max %.1f KB per entry), RSS %.1f MB -> %.1f MB",
+            report['entries'], workers, report['seconds'], report['total_bytes'] / 1e6,
+            report['mean_entry_bytes'] / 1e3, report['max_entry_bytes'] / 1e3,
+            report['rss_before'] / 1e6, report['rss_after'] / 1e6
+        )
+        return report
+
+    # Yield (key, payload) pairs, fanning the renders out to a process pool
+    def _render_all(self, keys, render, workers):
+        if workers > 1 and len(keys) > 1:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                payloads = pool.map(render, keys, chunksize=max(1, len(keys) // (workers * 4)))
+                yield from zip(keys, payloads)
+        else:
+            for key in keys:
+                yield key, render(key)
+
+    def invalidate(self):
+        with self._lock:
+            super().invalidate()
+            if self.store is not None:
+                self.store.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = super().stats()
+            lookups = self.hits + self.shared_hits + self.misses
+            stats['shared_hits'] = self.shared_hits
+            stats['hit_rate'] = (self.hits + self.shared_hits) / lookups if lookups else 0.0
+            return stats
@@ -1,51 +0,0 @@
-#social_insights.py
-# Key Insights from the PDF for Social Development with added benchmark comparisons
-sanitation_insights = [
-        "Qatar has made remarkable progress in sanitation services, increasing coverage from 94.68% in 2016 to 99.94% in 2022 (5.55% improvement).",
-        "The data shows consistent year-on-year improvements, with approximately 0.9 percentage point gains annually.",
-        "Qatar has effectively achieved the UN Sustainable Development Goal target for universal access to safely managed sanitation.",
-        "Near-universal sanitation coverage represents a significant public health achievement that contributes to disease prevention and overall quality of life.",
-        "Qatar's sanitation access (99.94%) significantly exceeds the global average (75%) and is comparable to leading regions like North America and Europe (99%)."
-    ]
-    
-gender_equality_insights = [
-        "Qatar has achieved gender parity in primary education, with the Gender Parity Index (GPI) improving from 0.994 in 2016 to 1.030 in 2019, indicating a slight advantage for female students.",
-        "The 3.64% improvement in GPI reflects Qatar's commitment to equal educational opportunities regardless of gender.",
-        "By 2019, the GPI exceeded 1.0, indicating that girls slightly outnumber boys in primary education enrollment.",
-        "The data suggests Qatar's educational policies have been effective in eliminating gender-based barriers to basic education.",
-        "Women comprise 51.6% of engineering students in Qatar, and female enrollment in tertiary education is among the highest in the region, with women often outnumbering men in university enrollment."
-    ]
-    
-stem_insights = [
-        "The percentage of graduates from STEM programs has decreased dramatically by 39.96%, from 29.70% in 2016 to 17.83% in 2022.",
-        "The decline has been persistent across all years, indicating a systematic shift in student preferences away from STEM fields.",
-        "This trend poses a significant challenge to Qatar's ambition to develop a knowledge-based economy with strong scientific and technological foundations.",
-        "The consistent decline suggests an urgent need for interventions to increase interest and enrollment in STEM fields.",
-        "Qatar's current STEM graduate percentage (17.83%) is below both the global average (23%) and regional peer Saudi Arabia (32%), and significantly trails leading countries like Oman (43%) and Germany (37%)."
-    ]
-    
-digital_skills_insights = [
-        "Email skills have shown steady improvement, increasing from 56.55% in 2016 to 58.72% in 2020 (3.84% growth).",
-        "Programming skills have decreased from 5.51% in 2016 to 5.06% in 2019 (-8.25%), indicating challenges in developing advanced digital capabilities.",
-        "The divergence between improving basic skills and declining advanced skills suggests a digital skills gap that could impact innovation capacity.",
-        "While basic digital literacy is improving, the relatively low levels of advanced digital skills may limit Qatar's digital transformation ambitions.",
-        "Qatar's vision for a knowledge economy requires stronger development of advanced technical skills to support digitization initiatives and AI/robotics adoption."
-    ]
-    
-    # New insights for ICT graduates that was missing dedicated insights
-ict_graduates_insights = [
-        "ICT (Information & Communication Technologies) graduates represent a relatively small percentage of Qatar's total tertiary graduates.",
-        "ICT graduate percentages have shown fluctuations without a clear upward trend, failing to match the growing importance of digital skills in the global economy.",
-        "The gap between Qatar's ICT graduate production and its digital economy ambitions poses a challenge for the country's knowledge economy transition.",
-        "Qatar's partnerships with technology companies (Microsoft, Google Cloud) are creating demand for ICT specialists that may exceed domestic graduate production.",
-        "Targeted programs to encourage ICT specialization will be crucial for Qatar to develop the skilled workforce needed for its digital future."
-    ]
-    
-overall_social_insights = [
-        "Qatar shows impressive achievements in basic social infrastructure (sanitation) and gender equity in education, but concerning trends in STEM education and advanced digital skills.",
-        "The data suggests that Qatar has successfully built social development foundations but faces challenges in developing the innovation capabilities needed for a knowledge economy.",
-        "The achievement of gender parity in primary education represents a significant milestone in Qatar's social development journey.",
-        "The consistent decline in STEM and ICT graduates represents one of the most significant challenges to Qatar Vision 2030's knowledge economy objectives.",
-        "The data reveals a potential gap between Qatar's educational system outputs and its economic diversification requirements, particularly in technical fields.",
-        "Qatar's sanitation access (1.3x global average) is world-class, while its STEM graduate percentage (0.78x global average) indicates a critical area for improvement."
-    ]
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Static Assets
+-------------
+Long-lived browser caching of the files under assets/:
+
+- Every file is linked at a content-hashed URL (e.g. assets/style.css?v=<hash>).
+  A request carrying the current hash of its file is answered with
+  "Cache-Control: public, max-age=31536000, immutable", so browsers reuse the
+  file without asking again until its content, and with it the URL, changes.
+  Requests without the hash, or with an outdated one, must revalidate.
+- The page links the stylesheets and scripts at their hashed URLs itself, in
+  place of Dash's asset links, which carry the file modification time.
+- The logo is re-encoded at the size it is displayed at (twice its CSS height
+  for high-density screens, never upscaled) as WebP and as a palette PNG
+  under assets/generated/ when Pillow is installed; without Pillow, or when the
+  folder cannot be written, the original file is used.
+"""
+
+
+import hashlib
+import logging
+import os
+
+import flask
+
+try:
+    from PIL import Image
+except ImportError:  # the original logo is served as it is
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+ONE_YEAR = 31536000
+
+# Hex digits of the SHA-256 content hash kept in asset URLs
+HASH_LENGTH = 12
+
+# Sub-folder of the assets folder for generated files
+GENERATED_FOLDER = 'generated'
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as asset_file:
+        for chunk in iter(lambda: asset_file.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+# Asset names (paths relative to the assets folder, with forward slashes) of
+# the WebP and PNG variants of an image for display at css_height pixels high:
+# {'webp': name or None, 'png': name}. The variants are (re)made when missing
+# or older than the source.
+def image_variants(folder, name, css_height):
+    if Image is None:
+        return {'webp': None, 'png': name}
+    source = os.path.join(folder, name)
+    stem = os.path.splitext(os.path.basename(name))[0]
+    height = 2 * css_height
+    variants = {
+        'webp': f"{GENERATED_FOLDER}/{stem}-{height}.webp",
+        'png': f"{GENERATED_FOLDER}/{stem}-{height}.png",
+    }
+    paths = {kind: os.path.join(folder, *variant.split('/')) for kind, variant in variants.items()}
+    if all(os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(source) for path in paths.values()):
+        return variants
+
+    try:
+        os.makedirs(os.path.join(folder, GENERATED_FOLDER), exist_ok=True)
+        with Image.open(source) as image:
+            transparent = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if transparent else 'RGB')
+            if image.height > height:
+                image = image.resize((round(image.width * height / image.height), height), Image.LANCZOS)
+            image.save(paths['webp'], 'WEBP', quality=90, method=6)
+            # A 256-colour palette is ample for a logo and a fraction of the size of true colour
+            palette = image.quantize(256, method=Image.Quantize.FASTOCTREE if transparent else Image.Quantize.MEDIANCUT)
+            palette.save(paths['png'], 'PNG', optimize=True)
+    except OSError as error:
+        logger.warning("Could not write the variants of %s, serving the original: %s", name, error)
+        return {'webp': None, 'png': name}
+    # Keep the smaller PNG when re-encoding did not help
+    if os.path.getsize(paths['png']) >= os.path.getsize(source):
+        variants['png'] = name
+    return variants
+
+
+class AssetManifest:
+    def __init__(self, folder):
+        self.folder = folder
+        self.hashes = {}
+        self.asset_url = None
+        self.scan()
+
+    # Hash every file under the assets folder, keyed by its asset name
+    def scan(self):
+        hashes = {}
+        for root, _, files in os.walk(self.folder):
+            for filename in files:
+                path = os.path.join(root, filename)
+                hashes[os.path.relpath(path, self.folder).replace(os.sep, '/')] = file_hash(path)
+        self.hashes = hashes
+
+    # Content-hashed URL of an asset
+    def url(self, name):
+        return f"{self.asset_url(name)}?v={self.hashes[name]}"
+
+    # Top-level asset names with an extension, in the order Dash would include them
+    def names(self, extension):
+        return sorted(name for name in self.hashes if '/' not in name and name.endswith(extension))
+
+    def stylesheet_links(self):
+        return '\n'.join(f'<link rel="stylesheet" href="{self.url(name)}">' for name in self.names('.css'))
+
+    def script_tags(self):
+        return '\n'.join(f'<script src="{self.url(name)}"></script>' for name in self.names('.js'))
+
+    # Build asset URLs with a Dash app's path prefix and set the cache headers
+    # of the asset responses of its server
+    def instrument(self, app):
+        self.asset_url = app.get_asset_url
+        prefix = app.config.routes_pathname_prefix + app.config.assets_url_path.strip('/') + '/'
+
+        @app.server.after_request
+        def cache_assets(response):
+            path = flask.request.path
+            if not path.startswith(prefix):
+                return response
+            version = flask.request.args.get('v')
+            if version is not None and version == self.hashes.get(path[len(prefix):]):
+                response.cache_control.no_cache = None
+                response.cache_control.public = True
+                response.cache_control.max_age = ONE_YEAR
+                response.cache_control.immutable = True
+            else:
+                response.cache_control.max_age = None
+                response.cache_control.no_cache = True
+            return response
@@ -0,0 +1,16 @@
+"""
+Test Setup
+----------
+The app modules are flat modules at the repository root and read the data
+files at paths relative to it, so the tests import them from there and run
+with it as the working directory.
+"""
+
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,35 @@
+"""
+Insight Statements
+------------------
+Statements of insight_engine.py on the real data: gaps the sources leave at 0
+(the 2021 rows of the master's and doctoral attainment shares) are not taken
+for values, and a year range without data names its single year as such.
+"""
+
+
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize('language', ['english', 'arabic'])
+def test_zero_gaps_are_not_extremes_or_steps(language):
+    texts = [text for _, text in app.insight_engine.chart_statements('human-advanced-education', 2016, 2023, language)]
+    assert not [text for text in texts if '0.00' in text or '-100.0%' in text]
+
+
+def test_zero_gaps_give_no_negative_statement():
+    statements = app.insight_engine.chart_statements('human-advanced-education', 2016, 2023)
+    assert [mood for mood, _ in statements] == ['positive', 'neutral', 'positive', 'positive']
+    assert "lowest 1.44 in 2016" in statements[1][1]
+
+
+def test_zero_gap_alone_is_no_data():
+    statements = app.insight_engine.chart_statements('human-advanced-education', 2021, 2021)
+    assert statements[0] == ('neutral', "No data available for Adults with a master's degree (%) in 2021.")
+
+
+@pytest.mark.parametrize('chart_id', ['key-education', 'key-hci'])
+def test_no_data_for_one_year(chart_id):
+    for _, text in app.insight_engine.chart_statements(chart_id, 2016, 2016):
+        assert text.startswith("No data available for ") and text.endswith(" in 2016.")
@@ -0,0 +1,29 @@
+"""
+KPI Cards
+---------
+The global average comparison of a KPI card is coloured by the direction in
+which its indicator improves, as the statements under the charts are.
+"""
+
+
+import app
+
+
+def comparison_colors(tab):
+    content = app.render_tab(tab, 2016, 2023, 'english')
+    return {component.children: component.style['color'] for component in content._traverse()
+            if 'kpi-comparison' in (getattr(component, 'className', None) or '').split()}
+
+
+def test_ratio_above_average_is_negative_when_lower_is_better():
+    assert comparison_colors('environmental')['8.1x global average'] == app.colors['negative']
+    mood, _ = app.insight_engine.chart_statements('environmental-co2-per-capita', 2016, 2023)[-1]
+    assert mood == 'negative'
+
+
+def test_ratio_above_average_is_positive_when_higher_is_better():
+    assert comparison_colors('economic')['5.2x global average'] == app.colors['positive']
+
+
+def test_no_comparison_without_data():
+    assert app.kpi_comparison(None, 'co2_pc') == ("", None)
@@ -0,0 +1,221 @@
+"""
+Render Counts
+-------------
+Renders of the tab content per user action. A Page fires the app's callbacks
+through the Flask test client the way the Dash renderer does: every callback
+whose inputs changed, then the callbacks those outputs feed, until nothing is
+left to fire. Clientside callbacks cannot run here; a test gives the values
+they set, and their other outputs count as changed.
+
+A tab click, a slider step and a language toggle each render the tab once,
+with a single call of the tab callback; the language toggle leaves the tabs
+and the year slider as they are; and with CLIENTSIDE_YEAR_FILTER=1 a slider
+step reaches no server callback at all.
+"""
+
+
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+from dash.development.base_component import Component
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Flags read when app.py is imported, cleared for every loaded app
+FLAGS = ('CLIENTSIDE_YEAR_FILTER', 'CHART_CALLBACKS', 'PREFETCH_TABS', 'RENDER_CACHE_DIR')
+
+
+# Import app.py as a new module with the given flags set
+def load_app(name, **flags):
+    saved = {flag: os.environ.pop(flag, None) for flag in FLAGS}
+    os.environ.update(flags)
+    try:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, 'app.py'))
+        module = importlib.util.module_from_spec(spec)
+        # Dash finds the app's assets through the module registered under its name
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    finally:
+        for flag, value in saved.items():
+            os.environ.pop(flag, None)
+            if value is not None:
+                os.environ[flag] = value
+    return module
+
+
+# Output ids ('component.property') of a callback; pattern-matching ids are skipped
+def output_ids(dependency):
+    return [output for output in dependency['output'].strip('.').split('...') if not output.startswith('{')]
+
+
+def input_ids(dependency):
+    return [f"{item['id']}.{item['property']}" for item in dependency['inputs']]
+
+
+class Page:
+    def __init__(self, module):
+        self.module = module
+        self.client = module.server.test_client()
+        self.dependencies = self.client.get('/_dash-dependencies').get_json()
+        self.components = {
+            component.id: component for component in [module.app.layout, *module.app.layout._traverse()]
+            if isinstance(getattr(component, 'id', None), str)
+        }
+        self.values = {}
+        self.renders = 0
+        self.fired = []
+
+        # Count the tab renders; cached_tab looks render_tab_payload up when it renders
+        self.render_tab_payload = module.render_tab_payload
+
+        def counted_render(key):
+            self.renders += 1
+            return self.render_tab_payload(key)
+        module.render_tab_payload = counted_render
+
+    def close(self):
+        self.module.render_tab_payload = self.render_tab_payload
+
+    def value(self, prop_id):
+        if prop_id in self.values:
+            return self.values[prop_id]
+        component_id, prop = prop_id.rsplit('.', 1)
+        return getattr(self.components[component_id], prop, None)
+
+    # Name of the server function of a callback, None for a clientside one
+    def callback_name(self, dependency):
+        callback = self.module.app.callback_map[dependency['output']].get('callback')
+        return callback.__name__ if callback is not None else None
+
+    # Fire one server callback and keep the values it returned
+    def post(self, dependency, changed):
+        outputs = [dict(zip(('id', 'property'), output.rsplit('.', 1))) for output in output_ids(dependency)]
+        body = {
+            'output': dependency['output'],
+            'outputs': outputs if dependency['output'].startswith('..') else outputs[0],
+            'inputs': [{**item, 'value': self.value(f"{item['id']}.{item['property']}")} for item in dependency['inputs']],
+            'state': [{**item, 'value': self.value(f"{item['id']}.{item['property']}")} for item in dependency['state']],
+            'changedPropIds': changed,
+        }
+        response = self.client.post('/_dash-update-component', json=body)
+        assert response.status_code in (200, 204), response.get_data(as_text=True)
+        if response.status_code == 204:
+            return []
+        returned = []
+        for component_id, props in json.loads(response.get_data())['response'].items():
+            for prop, value in props.items():
+                self.values[f"{component_id}.{prop}"] = value
+                returned.append(f"{component_id}.{prop}")
+        return returned
+
+    # Load the page: the server callbacks that run on load, with nothing changed
+    def load(self):
+        for dependency in self.dependencies:
+            if self.callback_name(dependency) and not dependency.get('prevent_initial_call'):
+                self.post(dependency, [])
+        return self
+
+    # Change a property as the user does and follow the callbacks it sets off.
+    # clientside holds the values the clientside callbacks set in this action.
+    def change(self, prop_id, value, clientside=None):
+        self.values[prop_id] = value
+        self.renders = 0
+        self.fired = []
+        changed = [prop_id]
+        while changed:
+            prop_id = changed.pop(0)
+            for dependency in self.dependencies:
+                if prop_id not in input_ids(dependency):
+                    continue
+                self.fired.append(dependency)
+                if self.callback_name(dependency):
+                    changed += self.post(dependency, [prop_id])
+                else:
+                    self.values.update({output: value for output, value in (clientside or {}).items()
+                                        if output in output_ids(dependency)})
+                    changed += output_ids(dependency)
+        return self
+
+    def server_callbacks(self):
+        return [self.callback_name(dependency) for dependency in self.fired if self.callback_name(dependency)]
+
+
+# Ids of the components in the layout that contain the component with this id
+def ancestor_ids(component, component_id, path=()):
+    if getattr(component, 'id', None) == component_id:
+        return list(path)
+    children = getattr(component, 'children', None)
+    for child in children if isinstance(children, (list, tuple)) else [children]:
+        if isinstance(child, Component):
+            found = ancestor_ids(child, component_id, path + (getattr(component, 'id', None),))
+            if found is not None:
+                return found
+    return None
+
+
+@pytest.fixture(scope='module')
+def server_filtered_app():
+    return load_app('app_server_filtered')
+
+
+@pytest.fixture(scope='module')
+def clientside_filtered_app():
+    return load_app('app_clientside_filtered', CLIENTSIDE_YEAR_FILTER='1')
+
+
+@pytest.fixture
+def page(server_filtered_app):
+    server_filtered_app.render_cache.invalidate()
+    page = Page(server_filtered_app)
+    yield page.load()
+    page.close()
+
+
+@pytest.mark.parametrize('tab', ['economic', 'environmental', 'human', 'social', 'key-indicators'])
+def test_tab_click_renders_once(page, tab):
+    page.module.render_cache.invalidate()
+    page.change('tabs.active_tab', tab)
+    assert page.server_callbacks() == ['render_tab_content']
+    assert page.renders == 1
+
+
+def test_slider_step_renders_once(page):
+    store = page.module.data_stores['key_indicators']
+    for year_range in ([store.min_year + 1, store.max_year], [store.min_year + 1, store.max_year - 1],
+                       [store.min_year + 2, store.max_year - 1]):
+        page.change('year-slider.value', year_range)
+        assert page.server_callbacks() == ['render_tab_content']
+        assert page.renders == 1
+        assert '__dash_patch_update' in page.value('tab-content.children')
+
+
+@pytest.mark.parametrize('language', ['arabic', 'english'])
+def test_language_toggle_renders_once(page, language):
+    page.module.render_cache.invalidate()
+    button = 'btn-arabic' if language == 'arabic' else 'btn-english'
+    page.change(f"{button}.n_clicks", 1, clientside={'language-store.data': language})
+    assert page.server_callbacks() == ['render_tab_content']
+    assert page.renders == 1
+
+
+def test_language_toggle_keeps_tabs_and_slider(page):
+    page.change('btn-arabic.n_clicks', 1, clientside={'language-store.data': 'arabic'})
+    outputs = [output for dependency in page.fired for output in output_ids(dependency)]
+    layout = page.module.app.layout
+    for component_id in ('tabs', 'year-slider'):
+        assert not [output for output in outputs if output.rsplit('.', 1)[0] == component_id]
+        recreated = [f"{ancestor}.children" for ancestor in ancestor_ids(layout, component_id) if ancestor]
+        assert not set(recreated) & set(outputs)
+    assert page.value('tabs.active_tab') == page.components['tabs'].active_tab
+
+
+def test_clientside_slider_step_renders_nothing(clientside_filtered_app):
+    page = Page(clientside_filtered_app).load()
+    store = clientside_filtered_app.data_stores['key_indicators']
+    page.change('year-slider.value', [store.min_year + 1, store.max_year])
+    page.close()
+    assert page.server_callbacks() == []
+    assert page.renders == 0
@@ -0,0 +1,103 @@
+"""
+Translation Engine
+------------------
+Compiled English to Arabic translation for the dashboard. A text is looked up
+in three steps, and the result is memoized per language so every distinct
+string is resolved once per process:
+
+1. the exact-match table (translations.py)
+2. the template table, for texts built around numbers, e.g.
+   "{name}: {value} tonnes". Placeholders are {value} (a number such as 4.8,
+   $22,450 or 32%), {name} (a term translated through the exact table) and
+   {text} (kept as it is); a numeric suffix ({value1}, {value2}, ...) lets a
+   template hold several of one kind.
+3. the text itself, untranslated
+
+Numbers are copied into the translated template in the locale's numerals:
+Western digits by default, or Eastern Arabic digits and separators.
+"""
+
+
+import re
+from functools import lru_cache
+
+# Number as formatted by the dashboard: optional sign and currency, thousands
+# separators, decimals and a trailing percent sign
+NUMBER_PATTERN = r'[-+]?\$?\d[\d,]*(?:\.\d+)?%?'
+
+PLACEHOLDER_PATTERNS = {
+    'value': NUMBER_PATTERN,
+    'name': r'[^:<>]+?',
+    'text': r'.+',
+}
+
+PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+# Digits, thousands separator and decimal point of each numeral style
+NUMERALS = {
+    'western': None,
+    'eastern': str.maketrans('0123456789,.', '٠١٢٣٤٥٦٧٨٩٬٫'),
+}
+
+
+# Kind of a placeholder, without its numeric suffix: value2 -> value
+def placeholder_kind(placeholder):
+    return placeholder.rstrip('0123456789')
+
+
+# Regular expression matching a template, e.g. "{name}: {value} tonnes"
+def compile_template(template):
+    pattern = ''
+    position = 0
+    for placeholder in PLACEHOLDER.finditer(template):
+        pattern += re.escape(template[position:placeholder.start()])
+        pattern += f"(?P<{placeholder.group(1)}>{PLACEHOLDER_PATTERNS[placeholder_kind(placeholder.group(1))]})"
+        position = placeholder.end()
+    pattern += re.escape(template[position:])
+    return re.compile(pattern)
+
+
+class Translator:
+    def __init__(self, table, templates=None, numerals='western', maxsize=8192):
+        self.table = dict(table)
+        self.templates = [(compile_template(source), target) for source, target in (templates or {}).items()]
+        self.numerals = NUMERALS[numerals]
+        self.arabic = lru_cache(maxsize=maxsize)(self.lookup)
+
+    # Text in the given language; English is the source language of every string
+    def translate(self, text, language='english'):
+        if language != 'arabic' or not isinstance(text, str):
+            return text
+        return self.arabic(text)
+
+    # Arabic text of an English string, uncached
+    def lookup(self, text):
+        if text in self.table:
+            return self.table[text]
+        for pattern, target in self.templates:
+            match = pattern.fullmatch(text)
+            if match:
+                return target.format(**{
+                    placeholder: self.substitute(placeholder, value)
+                    for placeholder, value in match.groupdict().items()
+                })
+        return text
+
+    def substitute(self, placeholder, value):
+        kind = placeholder_kind(placeholder)
+        if kind == 'name':
+            return self.table.get(value, value)
+        if kind == 'value' and self.numerals is not None:
+            return value.translate(self.numerals)
+        return value
+
+    def stats(self):
+        info = self.arabic.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
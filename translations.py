@@ -220,6 +220,8 @@ translations = {
     "Primary and Tertiary Education GPI":"مؤشر المساواة بين الجنسين في التعليم الابتدائي والتعليم العالي",
     "12.8 years":"12.8 سنة",
     "8.8 years":"8.8 سنة",
+    'Oman: ~6K per worker':'عُمان: ~6000 لكل عامل',
+    'Advanced economies: >50K per worker':'الاقتصادات المتقدمة: >50000 لكل عامل',
     # Comparative phrases
     'global average': 'المتوسط العالمي',
     'Small share of global total': 'حصة صغيرة من المجموع العالمي',
@@ -231,7 +233,6 @@ translations = {
     'Favors female students': 'لصالح الطالبات',
     'Favors male students': 'لصالح الطلاب',
     'Perfect gender parity': 'تكافؤ تام بين الجنسين',
-    '8.25% decline from 2016': 'انخفاض بنسبة 8.25% من عام 2016',
     'Above global average, below leading countries': 'أعلى من المتوسط العالمي، أقل من الدول الرائدة',
     'below avg': 'أقل من المتوسط',
     
@@ -369,227 +370,6 @@ translations = {
     # No data available message
     'No data available for sanitation services': 'لا توجد بيانات متاحة لخدمات الصرف الصحي',
     
-    # Key insights - Key Indicators
-    "Qatar maintained one of the world's highest GDP per capita levels throughout the period (over $100,000), but experienced a slight overall decline of 3.24% from 2016 to 2023.": "حافظت قطر على واحدة من أعلى مستويات الناتج المحلي الإجمالي للفرد في العالم طوال الفترة (أكثر من 100,000 دولار)، لكنها شهدت انخفاضًا إجماليًا طفيفًا بنسبة 3.24% من 2016 إلى 2023.",
-    "A significant drop occurred in 2020 (down to $103,061), representing a 14.2% decrease from 2016 levels, clearly showing the pandemic's impact.": "حدث انخفاض كبير في عام 2020 (وصل إلى 103,061 دولارًا)، مما يمثل انخفاضًا بنسبة 14.2% من مستويات عام 2016، مما يوضح بوضوح تأثير الجائحة.",
-    "The economy rebounded strongly in 2021 to $116,832, nearly returning to pre-pandemic levels, demonstrating economic resilience.": "انتعش الاقتصاد بقوة في عام 2021 ليصل إلى 116,832 دولارًا، عائدًا تقريبًا إلى مستويات ما قبل الجائحة، مما يدل على المرونة الاقتصادية.",
-    "Qatar's GDP per capita is approximately 5.4x the global average ($22,450) and significantly higher than regional neighbors (UAE: $83,900, Saudi Arabia: $54,992).": "يبلغ الناتج المحلي الإجمالي للفرد في قطر حوالي 5.4 أضعاف المتوسط العالمي (22,450 دولارًا) وأعلى بكثير من الدول المجاورة (الإمارات: 83,900 دولار، المملكة العربية السعودية: 54,992 دولارًا).",
-    
-    "The HCI data is only available for 2017, 2018, and 2020, which limits comprehensive trend analysis.": "بيانات مؤشر رأس المال البشري متوفرة فقط للأعوام 2017 و2018 و2020، مما يحد من تحليل الاتجاهات الشامل.",
-    "There was a steady improvement in HCI from 0.615 in 2017 to 0.638 in 2020, representing a 3.7% increase.": "كان هناك تحسن مستمر في مؤشر رأس المال البشري من 0.615 في عام 2017 إلى 0.638 في عام 2020، بزيادة قدرها 3.7%.",
-    "A score of 0.638 means that a child born in Qatar today will be 63.8% as productive as they could be with complete education and full health.": "تعني درجة 0.638 أن الطفل المولود في قطر اليوم سيكون إنتاجه بنسبة 63.8% مما يمكن أن يكون عليه مع التعليم الكامل والصحة الكاملة.",
-    "Qatar's HCI (0.64) is above the global average (0.56) and Middle East average, but remains below leading countries like Singapore (0.88) and Japan (0.80).": "مؤشر رأس المال البشري في قطر (0.64) أعلى من المتوسط العالمي (0.56) ومتوسط الشرق الأوسط، لكنه لا يزال أقل من الدول الرائدة مثل سنغافورة (0.88) واليابان (0.80).",
-    
-    "CO₂ emissions per capita increased by 15.54% from 2016 to 2023, reaching 38.84 tonnes per person in 2023.": "ارتفعت انبعاثات ثاني أكسيد الكربون للفرد بنسبة 15.54% من 2016 إلى 2023، لتصل إلى 38.84 طن للشخص في عام 2023.",
-    "Emissions showed significant year-to-year variability, suggesting changing energy usage patterns.": "أظهرت الانبعاثات تقلبات كبيرة من سنة لأخرى، مما يشير إلى تغير أنماط استخدام الطاقة.",
-    "The upward trend contradicts Qatar's environmental sustainability goals and presents a major challenge for Vision 2030's environmental pillar.": "يتناقض الاتجاه التصاعدي مع أهداف الاستدامة البيئية في قطر ويمثل تحديًا كبيرًا لركيزة البيئة في رؤية 2030.",
-    "Qatar's per capita emissions (38.84 tonnes) are approximately 8x the global average (4.8 tonnes) and higher than regional peers (Kuwait: 25 tonnes, UAE: 20 tonnes, Saudi Arabia: 18 tonnes).": "انبعاثات قطر للفرد (38.84 طن) تعادل تقريبًا 8 أضعاف المتوسط العالمي (4.8 طن) وأعلى من الدول الإقليمية المماثلة (الكويت: 25 طن، الإمارات: 20 طن، المملكة العربية السعودية: 18 طن).",
-    
-    "Renewable electricity production increased slightly from 0.13 TWh in 2016 to 0.15 TWh in 2023 (15.38% increase).": "ارتفع إنتاج الكهرباء المتجددة قليلاً من 0.13 تيراواط ساعة في عام 2016 إلى 0.15 تيراواط ساعة في عام 2023 (زيادة بنسبة 15.38%).",
-    "After increasing to 0.15 TWh in 2018, renewable electricity production has plateaued without further growth through 2023.": "بعد زيادته إلى 0.15 تيراواط ساعة في عام 2018، استقر إنتاج الكهرباء المتجددة دون مزيد من النمو حتى عام 2023.",
-    "Given Qatar's climate, there's significant untapped potential for solar energy expansion.": "نظرًا لمناخ قطر، هناك إمكانات كبيرة غير مستغلة لتوسيع الطاقة الشمسية.",
-    "Qatar targets 20% of electricity from renewables by 2030, which would exceed the current Middle East average (4%) but remain below the global average (29%) and far behind leading countries like Brazil and Norway (80-95%).": "تستهدف قطر 20% من الكهرباء من مصادر الطاقة المتجددة بحلول عام 2030، وهو ما يتجاوز متوسط الشرق الأوسط الحالي (4%) ولكنه يظل أقل من المتوسط العالمي (29%) وبعيدًا عن الدول الرائدة مثل البرازيل والنرويج (80-95%).",
-    
-    "Qatar's energy production is dominated by natural gas, with a significant focus on LNG exports where Qatar is a global leader.": "يهيمن الغاز الطبيعي على إنتاج الطاقة في قطر، مع تركيز كبير على صادرات الغاز الطبيعي المسال حيث تعتبر قطر رائدة عالمية.",
-    "Oil production experienced a decline from 582.57 TWh in 2016 to 511.54 TWh in 2020 (-12.2%), before rebounding to 616.21 TWh in 2023.": "شهد إنتاج النفط انخفاضًا من 582.57 تيراواط ساعة في عام 2016 إلى 511.54 تيراواط ساعة في عام 2020 (-12.2%)، قبل أن ينتعش إلى 616.21 تيراواط ساعة في عام 2023.",
-    "Gas production has been more stable, reflecting Qatar's strategic emphasis on its vast North Field gas reserves.": "كان إنتاج الغاز أكثر استقرارًا، مما يعكس التركيز الاستراتيجي لقطر على احتياطيات حقل الشمال الضخمة من الغاز.",
-    "Qatar plans to boost LNG output by 85% from current 77 million tons to 126-142 million tons by 2030, aiming to reclaim its position as the world's top LNG exporter.": "تخطط قطر لزيادة إنتاج الغاز الطبيعي المسال بنسبة 85% من 77 مليون طن حاليًا إلى 126-142 مليون طن بحلول عام 2030، وتهدف إلى استعادة مكانتها كأكبر مصدر للغاز الطبيعي المسال في العالم.",
-    "This expansion will cement Qatar's position in global energy markets, targeting approximately 25% of global LNG trade by 2030.": "سيعزز هذا التوسع مكانة قطر في أسواق الطاقة العالمية، مستهدفًا حوالي 25% من تجارة الغاز الطبيعي المسال العالمية بحلول عام 2030.",
-    
-    "Qatar has shown steady improvement in expected years of schooling, increasing from 12.46 years in 2016 to 13.26 years in 2020 (6.4% growth).": "أظهرت قطر تحسنًا مطردًا في سنوات الدراسة المتوقعة، بزيادة من 12.46 سنة في عام 2016 إلى 13.26 سنة في عام 2020 (نمو بنسبة 6.4%).",
-    "The Learning-Adjusted Years of School metric improved from 12.31 years in 2017 to 12.83 years in 2020, indicating enhanced education quality.": "تحسن مقياس سنوات الدراسة المعدلة للتعلم من 12.31 سنة في عام 2017 إلى 12.83 سنة في عام 2020، مما يشير إلى تحسن جودة التعليم.",
-    "The gap between expected and learning-adjusted years decreased from 0.69 to 0.43 years, showing a reduction in learning loss from 5.31% to 3.24%.": "انخفضت الفجوة بين السنوات المتوقعة والسنوات المعدلة للتعلم من 0.69 إلى 0.43 سنة، مما يظهر انخفاضًا في فقدان التعلم من 5.31% إلى 3.24%.",
-    "Qatar's tertiary enrollment has grown substantially, from approximately 20% in the mid-2010s to over 40% recently, approaching the global average.": "نما الالتحاق بالتعليم العالي في قطر بشكل كبير، من حوالي 20% في منتصف 2010s إلى أكثر من 40% مؤخرًا، مقتربًا من المتوسط العالمي.",
-    "Qatar's education metrics now exceed global averages (12 expected years globally vs. 13.26 in Qatar; 7.8 learning-adjusted years globally vs. 12.83 in Qatar).": "تتجاوز مقاييس التعليم في قطر الآن المتوسطات العالمية (12 سنة متوقعة عالميًا مقابل 13.26 في قطر؛ 7.8 سنة معدلة للتعلم عالميًا مقابل 12.83 في قطر).",
-    
-    "The percentage of graduates from STEM programs has declined dramatically from 29.70% in 2016 to 17.83% in 2022, representing a 39.96% decrease.": "انخفضت نسبة الخريجين من برامج العلوم والتكنولوجيا والهندسة والرياضيات بشكل كبير من 29.70% في عام 2016 إلى 17.83% في عام 2022، مما يمثل انخفاضًا بنسبة 39.96%.",
-    "This consistent downward trend in STEM graduates contradicts Qatar's Vision 2030 goal of building a knowledge-based economy and innovation ecosystem.": "يتناقض هذا الاتجاه التنازلي المستمر في خريجي العلوم والتكنولوجيا والهندسة والرياضيات مع هدف رؤية قطر 2030 المتمثل في بناء اقتصاد قائم على المعرفة ونظام بيئي للابتكار.",
-    "At 17.83%, Qatar's STEM graduate percentage has fallen below the global average (23%) and significantly trails regional competitor Saudi Arabia (32%).": "عند 17.83%، انخفضت نسبة خريجي العلوم والتكنولوجيا والهندسة والرياضيات في قطر إلى ما دون المتوسط العالمي (23%) وتتخلف بشكل كبير عن المنافس الإقليمي المملكة العربية السعودية (32%).",
-    "Leading countries in STEM education, such as Oman (43%) and Germany (37%), far outpace Qatar's current performance in this critical metric.": "تتفوق الدول الرائدة في تعليم العلوم والتكنولوجيا والهندسة والرياضيات، مثل عمان (43%) وألمانيا (37%)، بشكل كبير على أداء قطر الحالي في هذا المقياس الحاسم.",
-    "The decline in STEM graduates represents a major challenge for Qatar's economic diversification goals and may hinder the country's competitiveness in high-tech sectors.": "يمثل انخفاض خريجي العلوم والتكنولوجيا والهندسة والرياضيات تحديًا كبيرًا لأهداف التنويع الاقتصادي في قطر وقد يعيق قدرة البلاد التنافسية في القطاعات عالية التقنية.",
-    
-    "Economic Resilience: Despite fluctuations, Qatar maintains exceptionally high living standards (5.4x global average GDP per capita) while navigating energy transitions.": "المرونة الاقتصادية: رغم التقلبات، تحافظ قطر على مستويات معيشية مرتفعة بشكل استثنائي (5.4 أضعاف متوسط الناتج المحلي الإجمالي العالمي للفرد) أثناء التنقل في تحولات الطاقة.",
-    "Environmental Challenges: Rising CO₂ emissions (8x global average) and limited renewable energy growth present the most significant challenges to Qatar Vision 2030 goals.": "التحديات البيئية: تمثل انبعاثات ثاني أكسيد الكربون المتزايدة (8 أضعاف المتوسط العالمي) والنمو المحدود للطاقة المتجددة التحديات الأكثر أهمية لأهداف رؤية قطر 2030.",
-    "Human Development Progress: Education access is improving substantially, with Qatar's Human Capital Index (0.64) exceeding the global average (0.56), but quality metrics and STEM graduate percentages require attention.": "تقدم التنمية البشرية: يتحسن الوصول إلى التعليم بشكل كبير، حيث يتجاوز مؤشر رأس المال البشري في قطر (0.64) المتوسط العالمي (0.56)، لكن مقاييس الجودة ونسب خريجي العلوم والتكنولوجيا والهندسة والرياضيات تتطلب اهتمامًا.",
-    "Infrastructural Achievements: Near-universal sanitation (1.3x global average) and dramatic solar capacity expansion demonstrate Qatar's ability to rapidly develop infrastructure.": "إنجازات البنية التحتية: تظهر الصرف الصحي شبه الشامل (1.3 ضعف المتوسط العالمي) والتوسع الدراماتيكي في قدرة الطاقة الشمسية قدرة قطر على تطوير البنية التحتية بسرعة.",
-    
-    # Key insights - Economic Development
-    "Qatar's GDP per capita has shown notable volatility between 2016-2023, with a 3.24% overall decline.": "أظهر الناتج المحلي الإجمالي للفرد في قطر تقلبات ملحوظة بين عامي 2016-2023، مع انخفاض إجمالي بنسبة 3.24%.",
-    "The most significant drop occurred in 2020 (to $103,062), representing a 14% decline from 2016 levels.": "حدث أكبر انخفاض في عام 2020 (إلى 103,062 دولار)، بما يمثل انخفاضًا بنسبة 14% من مستويات عام 2016.",
-    "The economy showed strong resilience with a rapid recovery to $116,833 in 2021.": "أظهر الاقتصاد مرونة قوية مع تعافٍ سريع إلى 116,833 دولار في عام 2021.",
-    "The stabilization around $115,000 in recent years suggests a 'new normal' that balances energy market realities with economic diversification efforts.": "يشير الاستقرار حول 115,000 دولار في السنوات الأخيرة إلى 'وضع طبيعي جديد' يوازن بين واقع سوق الطاقة وجهود التنويع الاقتصادي.",
-    "Qatar's GDP per capita remains approximately 5.4x the global average ($22,450) and significantly higher than regional neighbors (UAE: $83,900, Saudi Arabia: $54,992).": "لا يزال الناتج المحلي الإجمالي للفرد في قطر يمثل حوالي 5.4 ضعف المتوسط العالمي (22,450 دولار) وأعلى بكثير من الدول المجاورة (الإمارات: 83,900 دولار، المملكة العربية السعودية: 54,992 دولار).",
-    
-    "Oil production declined from 582.57 TWh in 2016 to a low of 511.54 TWh in 2020 (-12.2%), but has since recovered to 616.21 TWh in 2023.": "انخفض إنتاج النفط من 582.57 تيراواط ساعة في عام 2016 إلى 511.54 تيراواط ساعة في عام 2020 (-12.2%)، ولكنه تعافى منذ ذلك الحين ليصل إلى 616.21 تيراواط ساعة في عام 2023.",
-    "The initial reduction reflects Qatar's strategic decision to focus more on natural gas, where it holds comparative advantage.": "يعكس الانخفاض الأولي القرار الاستراتيجي لقطر للتركيز أكثر على الغاز الطبيعي، حيث تتمتع بميزة نسبية.",
-    "The 20.5% increase from 2020 to 2023 shows Qatar's response to higher global energy demand and prices after the pandemic.": "تُظهر الزيادة البالغة 20.5% من 2020 إلى 2023 استجابة قطر لارتفاع الطلب العالمي على الطاقة والأسعار بعد الجائحة.",
-    "The upward trend in recent years raises questions about alignment with climate commitments and sustainability goals.": "يثير الاتجاه التصاعدي في السنوات الأخيرة تساؤلات حول التوافق مع الالتزامات المناخية وأهداف الاستدامة.",
-    "Qatar's oil output (~0.67 million barrels/day) is modest compared to other GCC producers, reflecting its strategic focus on natural gas production.": "يعتبر إنتاج قطر من النفط (~0.67 مليون برميل/يوم) متواضعًا مقارنة بمنتجي دول مجلس التعاون الخليجي الآخرين، مما يعكس تركيزها الاستراتيجي على إنتاج الغاز الطبيعي.",
-    
-    "Qatar has been investing heavily in liquefied natural gas (LNG) infrastructure, aiming to increase production capacity from 77 to 126 million tons annually by 2027.": "استثمرت قطر بكثافة في البنية التحتية للغاز الطبيعي المسال، بهدف زيادة الطاقة الإنتاجية من 77 إلى 126 مليون طن سنويًا بحلول عام 2027.",
-    "The focus on gas aligns with Qatar's positioning of natural gas as a 'transition fuel' with lower carbon emissions than oil or coal.": "يتماشى التركيز على الغاز مع موقع قطر للغاز الطبيعي كـ 'وقود انتقالي' بانبعاثات كربونية أقل من النفط أو الفحم.",
-    "Sustained gas production provides Qatar with economic stability as global demand for cleaner burning fuels increases.": "يوفر إنتاج الغاز المستدام لقطر استقرارًا اقتصاديًا مع زيادة الطلب العالمي على الوقود الأنظف احتراقًا.",
-    "The vast majority of Qatar's gas production is destined for export markets, making it a critical component of the country's revenue stream.": "الغالبية العظمى من إنتاج الغاز في قطر مخصصة لأسواق التصدير، مما يجعلها عنصرًا حاسمًا في تدفق إيرادات البلاد.",
-    "Qatar aims to maintain its position as one of the world's largest LNG exporters, competing with the U.S. which surpassed Qatar as the top LNG exporter in 2023.": "تهدف قطر إلى الحفاظ على مكانتها كواحدة من أكبر مصدري الغاز الطبيعي المسال في العالم، متنافسة مع الولايات المتحدة التي تجاوزت قطر كأكبر مصدر للغاز الطبيعي المسال في عام 2023.",
-    
-    "Energy consumption fluctuated significantly, from 168.92 TWh in 2016 to a low of 126.88 TWh in 2020 (-24.9%), before rebounding to 170.21 TWh in 2023.": "تقلب استهلاك الطاقة بشكل كبير، من 168.92 تيراواط ساعة في عام 2016 إلى أدنى مستوى له عند 126.88 تيراواط ساعة في عام 2020 (-24.9%)، قبل أن ينتعش إلى 170.21 تيراواط ساعة في عام 2023.",
-    "The consumption pattern closely mirrors GDP trends, with the 2020 pandemic-related drop and subsequent recovery.": "يعكس نمط الاستهلاك بشكل وثيق اتجاهات الناتج المحلي الإجمالي، مع الانخفاض المرتبط بالجائحة في عام 2020 والتعافي اللاحق.",
-    "The data suggests limited progress in improving energy efficiency, as consumption has grown in line with economic recovery.": "تشير البيانات إلى تقدم محدود في تحسين كفاءة الطاقة، حيث نما الاستهلاك بما يتماشى مع التعافي الاقتصادي.",
-    "Qatar has one of the world's highest per capita energy consumption rates, reflecting its energy-intensive industries and high standard of living.": "تمتلك قطر واحدة من أعلى معدلات استهلاك الطاقة للفرد في العالم، مما يعكس صناعاتها كثيفة الاستهلاك للطاقة ومستوى المعيشة المرتفع.",
-    "Global energy demand typically grows at 1-2% annually, while Qatar experienced 6-7% annual growth in the 2010s, though it targets moderating to 2-3% by the late 2020s.": "ينمو الطلب العالمي على الطاقة عادة بنسبة 1-2% سنويًا، بينما شهدت قطر نموًا سنويًا بنسبة 6-7% في العقد 2010، على الرغم من أنها تستهدف التخفيف إلى 2-3% بحلول أواخر عشرينيات القرن الحالي.",
-    
-    "Qatar's energy growth rates show significant volatility, reflecting both global energy market fluctuations and domestic economic changes.": "تُظهر معدلات نمو الطاقة في قطر تقلبات كبيرة، مما يعكس تقلبات سوق الطاقة العالمية والتغيرات الاقتصادية المحلية.",
-    "Growth rates were particularly negative during the 2020 pandemic period, with sharp contractions across all energy sources.": "كانت معدلات النمو سلبية بشكل خاص خلال فترة جائحة عام 2020، مع انكماشات حادة عبر جميع مصادر الطاقة.",
-    "Post-pandemic recovery shows positive growth rates, particularly in oil consumption, which may contradict Vision 2030's sustainability goals.": "يُظهر التعافي بعد الجائحة معدلات نمو إيجابية، خاصة في استهلاك النفط، مما قد يتناقض مع أهداف الاستدامة في رؤية 2030.",
-    "Qatar's historical energy demand growth of 6-7% annually significantly exceeds the global average (1-2%), highlighting the challenge of energy-intensive development.": "يتجاوز النمو التاريخي للطلب على الطاقة في قطر البالغ 6-7% سنويًا المتوسط العالمي (1-2%) بشكل كبير، مما يسلط الضوء على تحدي التنمية كثيفة الاستهلاك للطاقة.",
-    "Vision 2030 and the National Environment and Climate Strategy aim to reduce these high growth rates to a more sustainable 2-3% annually by 2030, still higher than typical OECD countries that have achieved near-zero growth through efficiency measures.": "تهدف رؤية 2030 والاستراتيجية الوطنية للبيئة والمناخ إلى خفض معدلات النمو المرتفعة هذه إلى 2-3% سنويًا بشكل أكثر استدامة بحلول عام 2030، وهي لا تزال أعلى من دول منظمة التعاون الاقتصادي والتنمية النموذجية التي حققت نموًا شبه صفري من خلال تدابير الكفاءة.",
-    
-    "Despite Qatar's challenging desert environment, agricultural productivity per worker is relatively high at $10,000-$11,000 (2015 US$) in value-added terms.": "على الرغم من بيئة الصحراء الصعبة في قطر، فإن الإنتاجية الزراعية لكل عامل مرتفعة نسبيًا عند 10,000-11,000 دولار (بالدولار الأمريكي لعام 2015) من حيث القيمة المضافة.",
-    "Qatar's agricultural productivity exceeds regional peers like Oman (~$6,000) but remains well below advanced economies (>$50,000 per worker).": "تتجاوز الإنتاجية الزراعية في قطر نظرائها الإقليميين مثل عمان (~6,000 دولار) ولكنها تظل أقل بكثير من الاقتصادات المتقدمة (>50,000 دولار لكل عامل).",
-    "The high per-worker value reflects Qatar's capital-intensive agricultural approach, utilizing advanced technologies like hydroponics and climate-controlled greenhouses.": "تعكس القيمة المرتفعة لكل عامل النهج الزراعي كثيف رأس المال في قطر، واستخدام تقنيات متقدمة مثل الزراعة المائية والبيوت المحمية المتحكم في مناخها.",
-    "Following the 2017 blockade, Qatar has heavily invested in agricultural self-sufficiency, with arable land increasing by 14.75% (18,300 to 21,000 hectares).": "بعد حصار عام 2017، استثمرت قطر بكثافة في الاكتفاء الذاتي الزراعي، مع زيادة الأراضي الصالحة للزراعة بنسبة 14.75% (من 18,300 إلى 21,000 هكتار).",
-    "By 2030, Qatar aims to further improve agricultural efficiency through high-yield technology to enhance food security, even as the sector remains <1% of GDP.": "بحلول عام 2030، تهدف قطر إلى تحسين الكفاءة الزراعية من خلال تكنولوجيا عالية الإنتاجية لتعزيز الأمن الغذائي، حتى مع بقاء القطاع <1% من الناتج المحلي الإجمالي.",
-    
-    "Business, administration, and law have historically been popular fields of study in Qatar, with approximately 26% of tertiary graduates specializing in these areas in 2018.": "كانت الأعمال والإدارة والقانون تاريخيًا من المجالات الدراسية الشائعة في قطر، حيث تخصص حوالي 26% من خريجي التعليم العالي في هذه المجالات في عام 2018.",
-    "This proportion is lower than in some other service-driven Gulf economies, such as Bahrain, where nearly 50% of graduates focus on business and law.": "هذه النسبة أقل منها في بعض اقتصادات الخليج الأخرى التي تعتمد على الخدمات، مثل البحرين، حيث يركز ما يقرب من 50% من الخريجين على الأعمال والقانون.",
-    "Vision 2030 doesn't discourage these fields but seeks a better balance with STEM subjects to support innovation and knowledge economy development.": "لا تثبط رؤية 2030 هذه المجالات ولكنها تسعى إلى توازن أفضل مع مواد العلوم والتكنولوجيا والهندسة والرياضيات لدعم الابتكار وتطوير اقتصاد المعرفة.",
-    "The inverse relationship between business/law and STEM graduates represents a challenge for Qatar's diversification - as one increases, the other tends to decrease.": "تمثل العلاقة العكسية بين خريجي الأعمال/القانون وخريجي العلوم والتكنولوجيا والهندسة والرياضيات تحديًا لتنويع قطر - فكلما زاد أحدهما، يميل الآخر إلى الانخفاض.",
-    "Qatar aims to keep business/law graduates around or below one-third of total graduates while boosting STEM and technical fields to better align with labor market needs in a diversifying economy.": "تهدف قطر إلى الحفاظ على خريجي الأعمال/القانون حول أو أقل من ثلث إجمالي الخريجين مع تعزيز مجالات العلوم والتكنولوجيا والهندسة والرياضيات والمجالات التقنية لتتماشى بشكل أفضل مع احتياجات سوق العمل في اقتصاد متنوع.",
-    
-    "The data confirms Qatar's continued heavy reliance on oil and gas, despite diversification efforts under Vision 2030.": "تؤكد البيانات استمرار الاعتماد الكبير لقطر على النفط والغاز، على الرغم من جهود التنويع في إطار رؤية 2030.",
-    "Qatar has demonstrated economic resilience, quickly recovering from the 2020 pandemic-induced downturn.": "أظهرت قطر مرونة اقتصادية، متعافية بسرعة من الانكماش الناجم عن جائحة عام 2020.",
-    "While educational reforms show progress, the economic structure remains heavily tilted toward energy production.": "في حين تظهر الإصلاحات التعليمية تقدمًا، يظل الهيكل الاقتصادي مائلًا بشدة نحو إنتاج الطاقة.",
-    "Qatar is pursuing a careful balance between maximizing short-term revenue from its hydrocarbon resources while investing in long-term diversification.": "تسعى قطر إلى تحقيق توازن دقيق بين تعظيم الإيرادات قصيرة المدى من مواردها الهيدروكربونية مع الاستثمار في التنويع طويل المدى.",
-    "There remains an inherent tension between Qatar's role as a major hydrocarbon producer and its sustainability ambitions under Vision 2030.": "لا يزال هناك توتر متأصل بين دور قطر كمنتج رئيسي للهيدروكربونات وطموحاتها في الاستدامة بموجب رؤية 2030.",
-    "Qatar's GDP per capita (5.4x global average) and per-worker agricultural value (higher than regional peers) demonstrate its economic efficiency.": "يُظهر الناتج المحلي الإجمالي للفرد في قطر (5.4 أضعاف المتوسط العالمي) والقيمة الزراعية لكل عامل (أعلى من النظراء الإقليميين) كفاءتها الاقتصادية.",
-    
-    'Oman: ~6K per worker':'عُمان: ~6000 لكل عامل',
-    'Advanced economies: >50K per worker':'الاقتصادات المتقدمة: >50000 لكل عامل',
-    # Key insights - Environmental Development
-    "Total CO₂ emissions rose by 32.42% from 87.4 million tonnes in 2016 to 115.7 million tonnes in 2023, showing a concerning upward trajectory.": "ارتفعت انبعاثات ثاني أكسيد الكربون الإجمالية بنسبة 32.42% من 87.4 مليون طن في عام 2016 إلى 115.7 مليون طن في عام 2023، مما يظهر مسارًا تصاعديًا مثيرًا للقلق.",
-    "CO₂ emissions per capita increased by 15.54% from 33.62 tonnes in 2016 to 38.84 tonnes in 2023, maintaining Qatar's position among the world's highest per capita emitters.": "ارتفعت انبعاثات ثاني أكسيد الكربون للفرد بنسبة 15.54% من 33.62 طنًا في عام 2016 إلى 38.84 طنًا في عام 2023، مما حافظ على مكانة قطر بين أعلى الدول المنبعثة للفرد في العالم.",
-    "The data shows an accelerating emissions trend, with the most significant jump occurring between 2022 and 2023 (9% increase in just one year).": "تظهر البيانات اتجاهًا متسارعًا للانبعاثات، حيث حدثت أكبر قفزة بين عامي 2022 و2023 (زيادة بنسبة 9% في عام واحد فقط).",
-    "The rising emissions directly conflict with Qatar's environmental sustainability goals under Vision 2030 and its international climate commitments.": "تتعارض الانبعاثات المتزايدة مباشرة مع أهداف الاستدامة البيئية في قطر بموجب رؤية 2030 والتزاماتها المناخية الدولية.",
-    "Qatar's per capita emissions (38.84 tonnes) are approximately 8x the global average (4.8 tonnes) and higher than regional peers (Kuwait: 25 tonnes, UAE: 20 tonnes, Saudi Arabia: 18 tonnes).": "تبلغ انبعاثات قطر للفرد (38.84 طنًا) حوالي 8 أضعاف المتوسط العالمي (4.8 طن) وأعلى من نظرائها الإقليميين (الكويت: 25 طنًا، الإمارات: 20 طنًا، المملكة العربية السعودية: 18 طنًا).",
-    
-    "Fossil fuels generate over 99.7% of Qatar's electricity, with renewables contributing a minimal 0.28-0.31% throughout the period.": "يولد الوقود الأحفوري أكثر من 99.7% من كهرباء قطر، مع مساهمة الطاقة المتجددة بنسبة ضئيلة تبلغ 0.28-0.31% طوال الفترة.",
-    "Total electricity production increased by 28.2% from 42.44 TWh in 2016 to 54.39 TWh in 2023, driving up absolute emissions.": "ارتفع إجمالي إنتاج الكهرباء بنسبة 28.2% من 42.44 تيراواط ساعة في عام 2016 إلى 54.39 تيراواط ساعة في عام 2023، مما أدى إلى زيادة الانبعاثات المطلقة.",
-    "Despite global renewable energy trends, Qatar's renewable electricity generation has plateaued at around 0.15 TWh since 2018.": "على الرغم من اتجاهات الطاقة المتجددة العالمية، فقد استقر توليد الكهرباء المتجددة في قطر عند حوالي 0.15 تيراواط ساعة منذ عام 2018.",
-    "The data reveals a significant gap between Qatar's sustainability rhetoric and actual energy transformation progress.": "تكشف البيانات عن فجوة كبيرة بين خطاب الاستدامة في قطر والتقدم الفعلي في تحول الطاقة.",
-    "Global electricity mix shows 61% non-renewables vs 39% renewables, while Qatar targets 20% renewables by 2030, significantly above the Middle East average (4%) but below global average (29%).": "يُظهر مزيج الكهرباء العالمي 61% من الطاقة غير المتجددة مقابل 39% من الطاقة المتجددة، بينما تستهدف قطر 20% من الطاقة المتجددة بحلول عام 2030، وهو ما يفوق بشكل كبير متوسط الشرق الأوسط (4%) ولكنه أقل من المتوسط العالمي (29%).",
-    
-    "Solar capacity experienced a remarkable 15,686% increase from 0.0051 GW in 2016 to 0.8051 GW in 2023.": "شهدت قدرة الطاقة الشمسية زيادة ملحوظة بنسبة 15,686% من 0.0051 جيجاواط في عام 2016 إلى 0.8051 جيجاواط في عام 2023.",
-    "Almost all capacity growth occurred in a single year (2022), indicating a major infrastructure commissioning.": "حدث ما يقرب من جميع نمو القدرة في عام واحد (2022)، مما يشير إلى تكليف بنية تحتية رئيسية.",
-    "Despite the capacity increase, the solar electricity generation data doesn't yet show a corresponding production increase, suggesting the new capacity may be at early operational stages.": "على الرغم من زيادة القدرة، لا تظهر بيانات توليد الكهرباء بالطاقة الشمسية حتى الآن زيادة مقابلة في الإنتاج، مما يشير إلى أن القدرة الجديدة قد تكون في مراحل تشغيلية مبكرة.",
-    "This dramatic solar expansion aligns with Qatar's National Development Strategy and preparations for hosting the 2022 FIFA World Cup.": "يتماشى هذا التوسع الكبير في الطاقة الشمسية مع استراتيجية التنمية الوطنية لقطر والاستعدادات لاستضافة كأس العالم FIFA 2022.",
-    "Qatar's 2030 target of 4 GW solar capacity would place it among the regional leaders in renewable capacity per capita, though still modest by global standards.": "سيضع هدف قطر 2030 المتمثل في 4 جيجاواط من قدرة الطاقة الشمسية بين الرواد الإقليميين في قدرة الطاقة المتجددة للفرد، على الرغم من أنه لا يزال متواضعًا وفقًا للمعايير العالمية.",
-    
-    "Qatar's annual change in primary energy consumption shows significant volatility, with both substantial growth and contraction periods.": "يُظهر التغير السنوي في استهلاك الطاقة الأولية في قطر تقلبات كبيرة، مع فترات نمو وانكماش كبيرة.",
-    "The 2020 pandemic year saw the most dramatic energy consumption contraction, reflecting global economic slowdown and reduced industrial activity.": "شهد عام الجائحة 2020 أكثر انكماش في استهلاك الطاقة دراماتيكية، مما يعكس التباطؤ الاقتصادي العالمي وانخفاض النشاط الصناعي.",
-    "Post-pandemic recovery shows a return to positive growth rates in energy consumption, potentially challenging sustainability targets.": "يُظهر التعافي بعد الجائحة عودة إلى معدلات نمو إيجابية في استهلاك الطاقة، مما قد يتحدى أهداف الاستدامة.",
-    "Qatar's typical annual energy consumption growth (5-6% in the 2010s) far exceeds the global average (1.9% in 2022), reflecting Qatar's rapid development and energy-intensive economy.": "يتجاوز النمو السنوي النموذجي لاستهلاك الطاقة في قطر (5-6% في العقد 2010) المتوسط العالمي بكثير (1.9% في عام 2022)، مما يعكس التطور السريع في قطر واقتصادها كثيف الاستهلاك للطاقة.",
-    "Vision 2030 initiatives aim to moderate Qatar's energy consumption growth to below 3% annually by the late 2020s through efficiency improvements and renewable integration, though this would still exceed typical developed economy growth rates.": "تهدف مبادرات رؤية 2030 إلى تخفيف نمو استهلاك الطاقة في قطر إلى أقل من 3% سنويًا بحلول أواخر عشرينيات القرن الحالي من خلال تحسينات الكفاءة ودمج الطاقة المتجددة، على الرغم من أن هذا سيظل يتجاوز معدلات نمو الاقتصاد المتطور النموذجية.",
-    
-    "Qatar's renewable electricity generation is dominated by solar power, accounting for nearly all renewable output since 2018.": "يهيمن على توليد الكهرباء المتجددة في قطر الطاقة الشمسية، التي تمثل ما يقرب من كل الإنتاج المتجدد منذ عام 2018.",
-    "Bioenergy makes a minimal contribution to Qatar's renewable mix, with very limited growth over the monitoring period.": "تساهم الطاقة الحيوية بشكل ضئيل في مزيج الطاقة المتجددة في قطر، مع نمو محدود للغاية خلال فترة المراقبة.",
-    "Qatar's total renewable electricity production (0.15 TWh) is a fraction of the Middle East's already low renewable generation (47 TWh in 2022) and insignificant compared to global renewables (7,858 TWh in 2021).": "يمثل إجمالي إنتاج الكهرباء المتجددة في قطر (0.15 تيراواط ساعة) جزءًا صغيرًا من توليد الطاقة المتجددة المنخفض بالفعل في الشرق الأوسط (47 تيراواط ساعة في عام 2022) وغير مهم مقارنة بالطاقة المتجددة العالمية (7,858 تيراواط ساعة في عام 2021).",
-    "The dramatic increase in solar capacity in 2022-2023 has not yet translated to substantial increases in electricity generation, suggesting early operational stages or potential utilization challenges.": "لم تترجم الزيادة الكبيرة في قدرة الطاقة الشمسية في 2022-2023 بعد إلى زيادات كبيرة في توليد الكهرباء، مما يشير إلى مراحل تشغيلية مبكرة أو تحديات محتملة في الاستخدام.",
-    "Qatar's National Renewable Energy Strategy target of 4 GW solar capacity by 2030 would dramatically increase renewable electricity production, helping Qatar progress from its current 0.3% renewable share toward its 20% target.": "سيؤدي هدف استراتيجية الطاقة المتجددة الوطنية في قطر المتمثل في 4 جيجاواط من قدرة الطاقة الشمسية بحلول عام 2030 إلى زيادة إنتاج الكهرباء المتجددة بشكل كبير، مما يساعد قطر على التقدم من حصتها الحالية البالغة 0.3% من الطاقة المتجددة نحو هدفها البالغ 20%.",
-    
-    "Agricultural land increased from 71,000 hectares in 2016 to 74,000 hectares in 2021 (4.23% growth), reflecting Qatar's food security strategy.": "زادت الأراضي الزراعية من 71,000 هكتار في عام 2016 إلى 74,000 هكتار في عام 2021 (نمو بنسبة 4.23%)، مما يعكس استراتيجية الأمن الغذائي في قطر.",
-    "Arable land saw more significant growth of 14.75% (18,300 to 21,000 hectares), indicating intensified cultivation efforts.": "شهدت الأراضي الصالحة للزراعة نموًا أكثر أهمية بنسبة 14.75% (من 18,300 إلى 21,000 هكتار)، مما يشير إلى تكثيف جهود الزراعة.",
-    "These increases align with Qatar's post-2017 blockade strategy to enhance domestic food production and reduce import dependence.": "تتماشى هذه الزيادات مع استراتيجية قطر بعد حصار عام 2017 لتعزيز إنتاج الغذاء المحلي وتقليل الاعتماد على الواردات.",
-    "The expansion of agriculture in Qatar's challenging desert environment demonstrates technological innovation in climate-adapted farming.": "يُظهر توسع الزراعة في بيئة الصحراء الصعبة في قطر الابتكار التكنولوجي في الزراعة المتكيفة مع المناخ.",
-    "Qatar's agricultural productivity (~$10-11K per worker) exceeds regional peers like Oman (~$6K) but remains below advanced economies (>$50K per worker).": "تتجاوز الإنتاجية الزراعية في قطر (~10-11 ألف دولار لكل عامل) نظرائها الإقليميين مثل عمان (~6 آلاف دولار) ولكنها تظل أقل من الاقتصادات المتقدمة (>50 ألف دولار لكل عامل).",
-    
-    "The data reveals a significant disconnect between Qatar's Vision 2030 environmental sustainability goals and actual progress, particularly in emissions and energy transition.": "تكشف البيانات عن انفصال كبير بين أهداف الاستدامة البيئية في رؤية قطر 2030 والتقدم الفعلي، خاصة في الانبعاثات وتحول الطاقة.",
-    "While showing impressive progress in solar capacity expansion and agricultural development, Qatar has made limited headway in overall emissions reduction and renewable energy integration.": "في حين أظهرت تقدمًا مثيرًا للإعجاب في توسيع قدرة الطاقة الشمسية والتنمية الزراعية، حققت قطر تقدمًا محدودًا في خفض الانبعاثات الكلية ودمج الطاقة المتجددة.",
-    "With CO₂ emissions accelerating rather than decreasing, Qatar faces a critical decision point regarding its climate strategy credibility.": "مع تسارع انبعاثات ثاني أكسيد الكربون بدلاً من انخفاضها، تواجه قطر نقطة قرار حاسمة بشأن مصداقية استراتيجيتها المناخية.",
-    "Despite significant investments in renewable capacity (particularly solar), the impact on the overall energy mix remains minimal.": "على الرغم من الاستثمارات الكبيرة في قدرة الطاقة المتجددة (وخاصة الطاقة الشمسية)، يظل التأثير على مزيج الطاقة الإجمالي ضئيلاً.",
-    "The data highlights Qatar's complex sustainability challenge in balancing food security, water conservation, and energy transition in a desert environment.": "تسلط البيانات الضوء على تحدي الاستدامة المعقد في قطر في تحقيق التوازن بين الأمن الغذائي والحفاظ على المياه وتحول الطاقة في بيئة صحراوية.",
-    "Qatar's per capita emissions (8x global average) and fossil-fuel dominated electricity mix (99.7%) contrast with its ambitious Vision 2030 sustainability goals.": "تتناقض انبعاثات قطر للفرد (8 أضعاف المتوسط العالمي) ومزيج الكهرباء الذي يهيمن عليه الوقود الأحفوري (99.7%) مع أهداف الاستدامة الطموحة في رؤية 2030.",
-
-    # Key insights - Human Development
-    "Mean years of schooling increased significantly by 11.44% from 9.67 years in 2016 to 10.77 years in 2022, indicating substantial progress in Qatar's educational development.": "زادت متوسط سنوات الدراسة بشكل كبير بنسبة 11.44% من 9.67 سنة في عام 2016 إلى 10.77 سنة في عام 2022، مما يشير إلى تقدم كبير في التطوير التعليمي في قطر.",
-    "Primary education completion rates have steadily improved from 87.03% in 2016 to 90.47% in 2022, moving closer to universal basic education.": "تحسنت معدلات إكمال التعليم الابتدائي باستمرار من 87.03% في عام 2016 إلى 90.47% في عام 2022، مقتربة من التعليم الأساسي الشامل.",
-    "The population with at least upper secondary education increased dramatically from 41.01% in 2016 to 51.43% in 2022, representing a 25.4% improvement.": "زادت نسبة السكان الحاصلين على تعليم ثانوي على الأقل بشكل كبير من 41.01% في عام 2016 إلى 51.43% في عام 2022، مما يمثل تحسنًا بنسبة 25.4%.",
-    "The percentage of adults with at least a bachelor's degree saw remarkable growth of 60.95%, from 18.88% in 2016 to 30.39% in 2022, one of the most impressive gains among all indicators.": "شهدت نسبة البالغين الحاصلين على درجة البكالوريوس على الأقل نموًا ملحوظًا بنسبة 60.95%، من 18.88% في عام 2016 إلى 30.39% في عام 2022، وهي من أكثر المكاسب إثارة للإعجاب بين جميع المؤشرات.",
-    "Qatar's tertiary attainment (~30%) is comparable to high-income countries (30-45%) but remains below leading nations like Canada and Korea (>55%).": "تُعد نسبة التحصيل العالي في قطر (~30%) مماثلة للدول ذات الدخل المرتفع (30-45%) ولكنها لا تزال أقل من الدول الرائدة مثل كندا وكوريا (>55%).",
-    
-    "The learning gap (difference between expected and learning-adjusted years of schooling) decreased from 0.69 years in 2017 to 0.43 years in 2020, representing a reduction in learning loss from 5.31% to 3.24%.": "انخفضت فجوة التعلم (الفرق بين سنوات الدراسة المتوقعة وسنوات الدراسة المعدلة للتعلم) من 0.69 سنة في عام 2017 إلى 0.43 سنة في عام 2020، مما يمثل انخفاضًا في فقد التعلم من 5.31% إلى 3.24%.",
-    "Expected years of schooling increased from 12.46 years in 2016 to 13.26 years in 2020, reflecting expanded educational opportunities.": "ارتفعت سنوات الدراسة المتوقعة من 12.46 سنة في عام 2016 إلى 13.26 سنة في عام 2020، مما يعكس توسع الفرص التعليمية.",
-    "Learning-adjusted years of schooling improved from 12.31 years in 2017 to 12.83 years in 2020, indicating not just more education but better quality education.": "تحسنت سنوات الدراسة المعدلة للتعلم من 12.31 سنة في عام 2017 إلى 12.83 سنة في عام 2020، مما يشير إلى ليس فقط المزيد من التعليم ولكن تعليم أفضل جودة.",
-    "Despite improvements, the persistence of a learning gap suggests ongoing challenges in education quality that need addressing.": "على الرغم من التحسينات، فإن استمرار فجوة التعلم يشير إلى تحديات مستمرة في جودة التعليم تحتاج إلى معالجة.",
-    "Qatar's expected years of schooling (13.26) exceeds the global average (12) but remains below leading countries (15), while learning-adjusted years (12.83) significantly outperform the global average (7.8).": "تتجاوز سنوات الدراسة المتوقعة في قطر (13.26) المتوسط العالمي (12) ولكنها تظل أقل من الدول الرائدة (15)، بينما تتفوق سنوات الدراسة المعدلة للتعلم (12.83) بشكل كبير على المتوسط العالمي (7.8).",
-    
-    "Qatar's Human Capital Index remained high and stable, changing only marginally from 0.992 in 2017 to 0.993 in 2020, indicating already strong human capital foundations.": "ظل مؤشر رأس المال البشري في قطر مرتفعًا ومستقرًا، مع تغير طفيف فقط من 0.992 في عام 2017 إلى 0.993 في عام 2020، مما يشير إلى أسس قوية بالفعل لرأس المال البشري.",
-    "Survival rates show positive trends, with the probability of survival to age 5 increasing from 94.05% in 2017 to 96.14% in 2020.": "تُظهر معدلات البقاء على قيد الحياة اتجاهات إيجابية، مع زيادة احتمالية البقاء على قيد الحياة حتى سن 5 من 94.05% في عام 2017 إلى 96.14% في عام 2020.",
-    "The survival rate from age 15-60 improved from 85.0% in 2017 to 87.8% in 2020, reflecting advancements in healthcare and quality of life.": "تحسن معدل البقاء على قيد الحياة من سن 15-60 من 85.0% في عام 2017 إلى 87.8% في عام 2020، مما يعكس التطورات في الرعاية الصحية وجودة الحياة.",
-    "A child born in Qatar today can expect to achieve 99.3% of their potential productivity as an adult, one of the highest rates globally.": "يمكن للطفل المولود في قطر اليوم أن يتوقع تحقيق 99.3% من إنتاجيته المحتملة كشخص بالغ، وهي من أعلى المعدلات عالميًا.",
-    "Qatar's HCI (0.64) exceeds both the global average (0.56) and regional benchmarks (Saudi Arabia: 0.58) but remains below leading countries like Singapore (0.88) and Japan (0.80).": "يتجاوز مؤشر رأس المال البشري في قطر (0.64) كلاً من المتوسط العالمي (0.56) والمعايير الإقليمية (المملكة العربية السعودية: 0.58) ولكنه يظل أقل من الدول الرائدة مثل سنغافورة (0.88) واليابان (0.80).",
-    
-    "The pre-primary gender parity index consistently favors females, increasing from 0.979 in 2016 to 1.077 in 2020, indicating strong early educational opportunities for girls.": "يميل مؤشر التكافؤ بين الجنسين في مرحلة ما قبل الابتدائي باستمرار لصالح الإناث، حيث ارتفع من 0.979 في عام 2016 إلى 1.077 في عام 2020، مما يشير إلى فرص تعليمية مبكرة قوية للفتيات.",
-    "The trend shows an increasing female advantage in pre-primary enrollment, with the gender parity index growing by 10% from 2016 to 2020.": "يُظهر الاتجاه ميزة متزايدة للإناث في الالتحاق بمرحلة ما قبل الابتدائي، مع نمو مؤشر التكافؤ بين الجنسين بنسبة 10% من 2016 إلى 2020.",
-    "Strong female participation in early education creates a foundation for gender equality throughout the educational system.": "تخلق المشاركة القوية للإناث في التعليم المبكر أساسًا للمساواة بين الجنسين في جميع أنحاء النظام التعليمي.",
-    "The data suggests Qatar's educational policies have been particularly successful in promoting female participation in education from an early age.": "تشير البيانات إلى أن السياسات التعليمية في قطر كانت ناجحة بشكل خاص في تعزيز مشاركة الإناث في التعليم من سن مبكرة.",
-    "Women comprise 51.6% of engineering students in Qatar, and Qatari women's enrollment in higher education is one of the highest in the region, even outnumbering men at public universities.": "تشكل النساء 51.6% من طلاب الهندسة في قطر، ويعد التحاق المرأة القطرية بالتعليم العالي من أعلى المعدلات في المنطقة، حتى أنهن يفوقن عدد الرجال في الجامعات العامة.",
-    
-    "Qatar has made progress in developing its postgraduate education capacity, with modest increases in both master's and doctoral degree holders.": "أحرزت قطر تقدمًا في تطوير قدرتها في مجال التعليم العالي، مع زيادات متواضعة في كل من حاملي درجة الماجستير والدكتوراه.",
-    "The percentage of adults with at least a master's degree is still relatively small but growing steadily as Qatar develops its knowledge economy workforce.": "لا تزال نسبة البالغين الحاصلين على درجة الماجستير على الأقل صغيرة نسبيًا ولكنها تنمو بثبات مع تطوير قطر لقوتها العاملة في اقتصاد المعرفة.",
-    "Doctoral education remains at an early stage of development, with a very small percentage of the population holding PhDs.": "لا يزال التعليم في مرحلة الدكتوراه في مرحلة مبكرة من التطوير، مع نسبة صغيرة جدًا من السكان الحاصلين على درجة الدكتوراه.",
-    "The OECD average tertiary attainment is approximately 39%, with Qatar aiming to reach similar levels for its citizen population.": "يبلغ متوسط التحصيل العالي في منظمة التعاون الاقتصادي والتنمية حوالي 39%، وتهدف قطر إلى الوصول إلى مستويات مماثلة لسكانها المواطنين.",
-    "Qatar's investment in Education City branch campuses and international educational partnerships demonstrates its commitment to developing advanced education, with a goal of leading the Arab world in higher education outcomes by 2030.": "يُظهر استثمار قطر في حرم المدينة التعليمية الفرعية والشراكات التعليمية الدولية التزامها بتطوير التعليم المتقدم، بهدف قيادة العالم العربي في نتائج التعليم العالي بحلول عام 2030.",
-    
-    "Qatar's primary education completion rates have shown steady improvement, approaching universal completion (98-99%) for nationals.": "أظهرت معدلات إكمال التعليم الابتدائي في قطر تحسنًا مطردًا، مقتربة من الإكمال الشامل (98-99%) للمواطنين.",
-    "Lower secondary completion rates have also improved but show greater room for growth compared to primary rates.": "تحسنت معدلات إكمال المرحلة الإعدادية أيضًا ولكنها تُظهر مجالًا أكبر للنمو مقارنة بمعدلات المرحلة الابتدائية.",
-    "Qatar outperforms the global average in both primary (89% globally) and secondary (75% globally) completion rates.": "تتفوق قطر على المتوسط العالمي في معدلات إكمال كل من المرحلة الابتدائية (89% عالميًا) والثانوية (75% عالميًا).",
-    "Completion rate improvements reflect both better retention of students and expanded access to education for all residents.": "تعكس تحسينات معدل الإكمال كلاً من الاحتفاظ الأفضل بالطلاب وتوسيع فرص الوصول إلى التعليم لجميع المقيمين.",
-    "Qatar's investments in free public schooling and education scholarships have been key factors in maximizing completion rates.": "كانت استثمارات قطر في التعليم العام المجاني والمنح التعليمية عوامل رئيسية في تعظيم معدلات الإكمال.",
-    
-    "The substantial increase in higher education attainment (especially bachelor's degrees) aligns with Qatar's Vision 2030 goal of transitioning to a knowledge-based economy.": "يتماشى الارتفاع الكبير في التحصيل العالي (خاصة درجات البكالوريوس) مع هدف رؤية قطر 2030 المتمثل في الانتقال إلى اقتصاد قائم على المعرفة.",
-    "The decreasing learning gap suggests a focus on quality of education, not just increased enrollment numbers.": "تشير فجوة التعلم المتناقصة إلى التركيز على جودة التعليم، وليس فقط زيادة أعداد الملتحقين.",
-    "Improvements across multiple indicators (educational attainment, expected years of schooling, survival rates) demonstrate Qatar's multifaceted approach to human development.": "تُظهر التحسينات عبر مؤشرات متعددة (التحصيل التعليمي، وسنوات الدراسة المتوقعة، ومعدلات البقاء على قيد الحياة) نهج قطر متعدد الأوجه للتنمية البشرية.",
-    "The strong performance in gender parity indicates attention to educational equity, though more comprehensive equity measures would be valuable.": "يشير الأداء القوي في المساواة بين الجنسين إلى الاهتمام بالإنصاف التعليمي، على الرغم من أن تدابير الإنصاف الأكثر شمولاً ستكون قيّمة.",
-    "The consistent improvements across indicators reflect sustained investment in Qatar's human capital, a core component of Vision 2030.": "تعكس التحسينات المستمرة عبر المؤشرات الاستثمار المستدام في رأس المال البشري في قطر، وهو مكون أساسي من رؤية 2030.",
-    "Qatar's human development metrics generally exceed global and regional averages but remain below those of leading countries, indicating both achievement and continued room for growth.": "تتجاوز مقاييس التنمية البشرية في قطر عمومًا المتوسطات العالمية والإقليمية ولكنها تظل أقل من تلك الموجودة في الدول الرائدة، مما يشير إلى الإنجاز واستمرار مجال النمو.",
-    
-    # Key insights - Social Development
-    "Qatar has made remarkable progress in sanitation services, increasing coverage from 94.68% in 2016 to 99.94% in 2022 (5.55% improvement).": "أحرزت قطر تقدمًا ملحوظًا في خدمات الصرف الصحي، حيث زادت التغطية من 94.68% في عام 2016 إلى 99.94% في عام 2022 (تحسن بنسبة 5.55%).",
-    "The data shows consistent year-on-year improvements, with approximately 0.9 percentage point gains annually.": "تُظهر البيانات تحسينات متسقة من سنة إلى أخرى، مع مكاسب سنوية تبلغ حوالي 0.9 نقطة مئوية.",
-    "Qatar has effectively achieved the UN Sustainable Development Goal target for universal access to safely managed sanitation.": "حققت قطر بشكل فعال هدف التنمية المستدامة للأمم المتحدة المتمثل في الوصول الشامل إلى خدمات الصرف الصحي المدارة بأمان.",
-    "Near-universal sanitation coverage represents a significant public health achievement that contributes to disease prevention and overall quality of life.": "تمثل تغطية الصرف الصحي شبه الشاملة إنجازًا كبيرًا في مجال الصحة العامة يسهم في الوقاية من الأمراض وجودة الحياة بشكل عام.",
-    "Qatar's sanitation access (99.94%) significantly exceeds the global average (75%) and is comparable to leading regions like North America and Europe (99%).": "يتجاوز وصول قطر إلى خدمات الصرف الصحي (99.94%) بشكل كبير المتوسط العالمي (75%) ويمكن مقارنته بالمناطق الرائدة مثل أمريكا الشمالية وأوروبا (99%).",
-    
-    "Qatar has achieved gender parity in primary education, with the Gender Parity Index (GPI) improving from 0.994 in 2016 to 1.030 in 2019, indicating a slight advantage for female students.": "حققت قطر المساواة بين الجنسين في التعليم الابتدائي، مع تحسن مؤشر التكافؤ بين الجنسين (GPI) من 0.994 في عام 2016 إلى 1.030 في عام 2019، مما يشير إلى ميزة طفيفة للطالبات.",
-    "The 3.64% improvement in GPI reflects Qatar's commitment to equal educational opportunities regardless of gender.": "يعكس التحسن بنسبة 3.64% في مؤشر التكافؤ بين الجنسين التزام قطر بفرص تعليمية متساوية بغض النظر عن الجنس.",
-    "By 2019, the GPI exceeded 1.0, indicating that girls slightly outnumber boys in primary education enrollment.": "بحلول عام 2019، تجاوز مؤشر التكافؤ بين الجنسين 1.0، مما يشير إلى أن عدد الفتيات يفوق عدد الأولاد قليلاً في الالتحاق بالتعليم الابتدائي.",
-    "The data suggests Qatar's educational policies have been effective in eliminating gender-based barriers to basic education.": "تشير البيانات إلى أن السياسات التعليمية في قطر كانت فعالة في إزالة الحواجز القائمة على نوع الجنس أمام التعليم الأساسي.",
-    "Women comprise 51.6% of engineering students in Qatar, and female enrollment in tertiary education is among the highest in the region, with women often outnumbering men in university enrollment.": "تشكل النساء 51.6% من طلاب الهندسة في قطر، ويعد التحاق الإناث بالتعليم العالي من بين أعلى المعدلات في المنطقة، حيث غالبًا ما يفوق عدد النساء عدد الرجال في الالتحاق بالجامعات.",
-    
-    "The percentage of graduates from STEM programs has decreased dramatically by 39.96%, from 29.70% in 2016 to 17.83% in 2022.": "انخفضت نسبة الخريجين من برامج العلوم والتكنولوجيا والهندسة والرياضيات بشكل كبير بنسبة 39.96%، من 29.70% في عام 2016 إلى 17.83% في عام 2022.",
-    "The decline has been persistent across all years, indicating a systematic shift in student preferences away from STEM fields.": "كان الانخفاض مستمرًا عبر جميع السنوات، مما يشير إلى تحول منهجي في تفضيلات الطلاب بعيدًا عن مجالات العلوم والتكنولوجيا والهندسة والرياضيات.",
-    "This trend poses a significant challenge to Qatar's ambition to develop a knowledge-based economy with strong scientific and technological foundations.": "يشكل هذا الاتجاه تحديًا كبيرًا لطموح قطر في تطوير اقتصاد قائم على المعرفة بأسس علمية وتكنولوجية قوية.",
-    "The consistent decline suggests an urgent need for interventions to increase interest and enrollment in STEM fields.": "يشير الانخفاض المستمر إلى الحاجة الملحة لتدخلات لزيادة الاهتمام والالتحاق بمجالات العلوم والتكنولوجيا والهندسة والرياضيات.",
-    "Qatar's current STEM graduate percentage (17.83%) is below both the global average (23%) and regional peer Saudi Arabia (32%), and significantly trails leading countries like Oman (43%) and Germany (37%).": "تقل النسبة الحالية لخريجي العلوم والتكنولوجيا والهندسة والرياضيات في قطر (17.83%) عن كل من المتوسط العالمي (23%) والمملكة العربية السعودية (32%)، وتتخلف بشكل كبير عن الدول الرائدة مثل عمان (43%) وألمانيا (37%).",
-    
-    "Email skills have shown steady improvement, increasing from 56.55% in 2016 to 58.72% in 2020 (3.84% growth).": "أظهرت مهارات البريد الإلكتروني تحسنًا مطردًا، بزيادة من 56.55% في عام 2016 إلى 58.72% في عام 2020 (نمو بنسبة 3.84%).",
-    "Programming skills have decreased from 5.51% in 2016 to 5.06% in 2019 (-8.25%), indicating challenges in developing advanced digital capabilities.": "انخفضت مهارات البرمجة من 5.51% في عام 2016 إلى 5.06% في عام 2019 (-8.25%)، مما يشير إلى تحديات في تطوير القدرات الرقمية المتقدمة.",
-    "The divergence between improving basic skills and declining advanced skills suggests a digital skills gap that could impact innovation capacity.": "يشير التباعد بين تحسين المهارات الأساسية وتراجع المهارات المتقدمة إلى فجوة في المهارات الرقمية التي يمكن أن تؤثر على قدرة الابتكار.",
-    "While basic digital literacy is improving, the relatively low levels of advanced digital skills may limit Qatar's digital transformation ambitions.": "في حين تتحسن محو الأمية الرقمية الأساسية، فإن المستويات المنخفضة نسبيًا من المهارات الرقمية المتقدمة قد تحد من طموحات التحول الرقمي في قطر.",
-    "Qatar's vision for a knowledge economy requires stronger development of advanced technical skills to support digitization initiatives and AI/robotics adoption.": "تتطلب رؤية قطر لاقتصاد المعرفة تطويرًا أقوى للمهارات التقنية المتقدمة لدعم مبادرات الرقمنة واعتماد الذكاء الاصطناعي/الروبوتات.",
-    
-    "ICT (Information & Communication Technologies) graduates represent a relatively small percentage of Qatar's total tertiary graduates.": "يمثل خريجو تكنولوجيا المعلومات والاتصالات نسبة صغيرة نسبيًا من إجمالي خريجي التعليم العالي في قطر.",
-    "ICT graduate percentages have shown fluctuations without a clear upward trend, failing to match the growing importance of digital skills in the global economy.": "أظهرت نسب خريجي تكنولوجيا المعلومات والاتصالات تقلبات دون اتجاه تصاعدي واضح، وفشلت في مطابقة الأهمية المتزايدة للمهارات الرقمية في الاقتصاد العالمي.",
-    "The gap between Qatar's ICT graduate production and its digital economy ambitions poses a challenge for the country's knowledge economy transition.": "تشكل الفجوة بين إنتاج خريجي تكنولوجيا المعلومات والاتصالات في قطر وطموحات الاقتصاد الرقمي تحديًا لانتقال البلاد إلى اقتصاد المعرفة.",
-    "Qatar's partnerships with technology companies (Microsoft, Google Cloud) are creating demand for ICT specialists that may exceed domestic graduate production.": "تخلق شراكات قطر مع شركات التكنولوجيا (مايكروسوفت، جوجل كلاود) طلبًا على متخصصي تكنولوجيا المعلومات والاتصالات قد يتجاوز إنتاج الخريجين المحليين.",
-    "Targeted programs to encourage ICT specialization will be crucial for Qatar to develop the skilled workforce needed for its digital future.": "ستكون البرامج المستهدفة لتشجيع التخصص في تكنولوجيا المعلومات والاتصالات حاسمة لقطر لتطوير القوى العاملة الماهرة اللازمة لمستقبلها الرقمي.",
-    
-    "Qatar shows impressive achievements in basic social infrastructure (sanitation) and gender equity in education, but concerning trends in STEM education and advanced digital skills.": "تُظهر قطر إنجازات مثيرة للإعجاب في البنية التحتية الاجتماعية الأساسية (الصرف الصحي) والإنصاف بين الجنسين في التعليم، ولكن اتجاهات مقلقة في تعليم العلوم والتكنولوجيا والهندسة والرياضيات والمهارات الرقمية المتقدمة.",
-    "The data suggests that Qatar has successfully built social development foundations but faces challenges in developing the innovation capabilities needed for a knowledge economy.": "تشير البيانات إلى أن قطر قد نجحت في بناء أسس التنمية الاجتماعية ولكنها تواجه تحديات في تطوير قدرات الابتكار اللازمة لاقتصاد المعرفة.",
-    "The achievement of gender parity in primary education represents a significant milestone in Qatar's social development journey.": "يمثل تحقيق المساواة بين الجنسين في التعليم الابتدائي معلمًا مهمًا في رحلة التنمية الاجتماعية في قطر.",
-    "The consistent decline in STEM and ICT graduates represents one of the most significant challenges to Qatar Vision 2030's knowledge economy objectives.": "يمثل الانخفاض المستمر في خريجي العلوم والتكنولوجيا والهندسة والرياضيات وتكنولوجيا المعلومات والاتصالات أحد أهم التحديات التي تواجه أهداف اقتصاد المعرفة في رؤية قطر 2030.",
-    "The data reveals a potential gap between Qatar's educational system outputs and its economic diversification requirements, particularly in technical fields.": "تكشف البيانات عن فجوة محتملة بين مخرجات النظام التعليمي في قطر ومتطلبات التنويع الاقتصادي، خاصة في المجالات التقنية.",
-    "Qatar's sanitation access (1.3x global average) is world-class, while its STEM graduate percentage (0.78x global average) indicates a critical area for improvement.": "يعد وصول قطر إلى خدمات الصرف الصحي (1.3 ضعف المتوسط العالمي) من الطراز العالمي، بينما تشير نسبة خريجي العلوم والتكنولوجيا والهندسة والرياضيات (0.78 ضعف المتوسط العالمي) إلى مجال حرج للتحسين.",
     
     # Business & Law Graduates
     "Business & Law Graduates (%)": "خريجو الأعمال والقانون (%)",
@@ -599,4 +379,95 @@ translations = {
     "8x global average": "8 أضعاف المتوسط العالمي",
     "1.3x global average": "1.3 ضعف المتوسط العالمي",
     "0.78x global average": "0.78 ضعف المتوسط العالمي",
+    
+    # Benchmark countries and regions, used by the {name} placeholder of the templates below
+    'UAE': 'الإمارات العربية المتحدة',
+    'Saudi Arabia': 'المملكة العربية السعودية',
+    'Kuwait': 'الكويت',
+    'Oman': 'عمان',
+    'Germany': 'ألمانيا',
+    'Singapore': 'سنغافورة',
+    'Japan': 'اليابان',
+    'Luxembourg': 'لوكسمبورغ',
+    'Norway': 'النرويج',
+    'Brazil': 'البرازيل',
+    'Middle East Avg': 'متوسط الشرق الأوسط',
+    'EU Average': 'متوسط الاتحاد الأوروبي',
+    'GCC Avg': 'متوسط دول مجلس التعاون الخليجي',
+    'North America/Europe': 'أمريكا الشمالية/أوروبا',
+    'Advanced economies': 'الاقتصادات المتقدمة',
+    
+    # Indicator names of the range statements (insight_engine.py)
+    'GDP per capita (PPP)': 'نصيب الفرد من الناتج المحلي الإجمالي (تعادل القوة الشرائية)',
+    'CO₂ emissions per capita (tonnes)': 'انبعاثات ثاني أكسيد الكربون للفرد (طن)',
+    'CO₂ emissions (million tonnes)': 'انبعاثات ثاني أكسيد الكربون (مليون طن)',
+    'Electricity from renewables (TWh)': 'الكهرباء من مصادر الطاقة المتجددة (TWh)',
+    'Electricity from fossil fuels (TWh)': 'الكهرباء من الوقود الأحفوري (TWh)',
+    'Electricity from solar (TWh)': 'الكهرباء من الطاقة الشمسية (TWh)',
+    'Solar capacity (GW)': 'قدرة الطاقة الشمسية (GW)',
+    'Gas production (TWh)': 'إنتاج الغاز (TWh)',
+    'Primary energy consumption (TWh)': 'استهلاك الطاقة الأولية (TWh)',
+    'Agricultural value added per worker': 'القيمة الزراعية المضافة لكل عامل',
+    'Business, administration and law graduates (%)': 'خريجو الأعمال والإدارة والقانون (%)',
+    'Expected years of school': 'سنوات الدراسة المتوقعة',
+    'Learning-adjusted years of school': 'سنوات الدراسة المعدلة وفقًا للتعلم',
+    'School life expectancy (years)': 'متوسط سنوات الدراسة المتوقعة (بالسنوات)',
+    'Adults with upper secondary education (%)': 'البالغون الحاصلون على التعليم الثانوي العالي (%)',
+    "Adults with a bachelor's degree (%)": 'البالغون الحاصلون على درجة البكالوريوس (%)',
+    "Adults with a master's degree (%)": 'البالغون الحاصلون على درجة الماجستير (%)',
+    'Adults with a doctoral degree (%)': 'البالغون الحاصلون على درجة الدكتوراه (%)',
+    'Primary completion rate (%)': 'معدل إتمام المرحلة الابتدائية (%)',
+    'Lower secondary completion rate (%)': 'معدل إتمام المرحلة الثانوية الدنيا (%)',
+    'Population with safely managed sanitation (%)': 'السكان الذين يستخدمون خدمات صرف صحي مُدارة بأمان (%)',
+    'STEM graduates (%)': 'خريجو العلوم والتكنولوجيا والهندسة والرياضيات (%)',
+    'ICT graduates (%)': 'خريجو تكنولوجيا المعلومات والاتصالات (%)',
+    'Adults with programming skills (%)': 'البالغون ذوو مهارات البرمجة (%)',
+    'In the selected period': 'في الفترة المحددة',
+}
+
+# Templates for texts built around numbers, tried in order when a text has no
+# exact translation: {value} is a number, {name} a term from the table above
+# and {text} is kept as it is
+translation_templates = {
+    'Global Average: {value} tonnes': 'المتوسط العالمي: {value} طن',
+    'Global Average: {value}': 'المتوسط العالمي: {value}',
+    'Global average: {value}': 'المتوسط العالمي: {value}',
+    'Global Avg Expected: {value} years': 'متوسط العالمي المتوقع: {value} سنة',
+    'Global Avg Learning-Adjusted: {value} years': 'متوسط العالمي المعدل للتعلم: {value} سنة',
+    'Leading Countries Expected: {value} years': 'الدول الرائدة متوقع: {value} سنة',
+    'Leading Countries Learning-Adjusted: {value} years': 'الدول الرائدة المعدل للتعلم: {value} سنة',
+    '{value}x global average': '{value} ضعف المتوسط العالمي',
+    '{value} tonnes': '{value} طن',
+    '{value} years': '{value} سنة',
+    '{name}: {value} tonnes': '{name}: {value} طن',
+    '{name}: {value}': '{name}: {value}',
+    'Global Average: {text}': 'المتوسط العالمي: {text}',
+    '{value1} decline from {value2}': 'انخفاض بنسبة {value1} من عام {value2}',
+    '{value1} increase from {value2}': 'ارتفاع بنسبة {value1} من عام {value2}',
+    # Range statements of insight_engine.py
+    '{name} rose by {value1} from {value2} in {value3} to {value4} in {value5}, {value6} a year on average.':
+        'ارتفع {name} بنسبة {value1} من {value2} في {value3} إلى {value4} في {value5}، بمتوسط {value6} سنويًا.',
+    '{name} fell by {value1} from {value2} in {value3} to {value4} in {value5}, {value6} a year on average.':
+        'انخفض {name} بنسبة {value1} من {value2} في {value3} إلى {value4} في {value5}، بمتوسط {value6} سنويًا.',
+    '{name} rose by {value1} from {value2} in {value3} to {value4} in {value5}.':
+        'ارتفع {name} بنسبة {value1} من {value2} في {value3} إلى {value4} في {value5}.',
+    '{name} fell by {value1} from {value2} in {value3} to {value4} in {value5}.':
+        'انخفض {name} بنسبة {value1} من {value2} في {value3} إلى {value4} في {value5}.',
+    '{name} rose from {value1} in {value2} to {value3} in {value4}.':
+        'ارتفع {name} من {value1} في {value2} إلى {value3} في {value4}.',
+    '{name} fell from {value1} in {value2} to {value3} in {value4}.':
+        'انخفض {name} من {value1} في {value2} إلى {value3} في {value4}.',
+    '{name} was unchanged at {value1} between {value2} and {value3}.':
+        'ظل {name} دون تغيير عند {value1} بين {value2} و{value3}.',
+    '{name} was {value1} in {value2}.': 'بلغ {name} {value1} في {value2}.',
+    '{name}: highest {value1} in {value2}, lowest {value3} in {value4}.':
+        '{name}: أعلى قيمة {value1} في {value2}، وأدنى قيمة {value3} في {value4}.',
+    '{name}: largest year-over-year change of {value1} from {value2} to {value3}.':
+        '{name}: أكبر تغير سنوي بنسبة {value1} من {value2} إلى {value3}.',
+    '{name} in {value1} was {value2}x the global average of {value3}.':
+        'بلغ {name} في {value1} {value2} ضعف المتوسط العالمي البالغ {value3}.',
+    'No data available for {name} between {value1} and {value2}.':
+        'لا توجد بيانات متاحة لـ {name} بين {value1} و{value2}.',
+    'No data available for {name} in {value1}.':
+        'لا توجد بيانات متاحة لـ {name} في {value1}.',
 }
\ No newline at end of file